@@ -1,9 +0,0 @@
-# 애드온 기본 설정
-ADDON_ID = "irkebim"  # 애드온 ID (환경 설정에서 사용)
-DEV_MODE = True       # 개발 모드 (자동 리로드 활성화)
-
-# 버전 정보
-__version__ = (1, 0, 0)
-
-# 기타 설정
-DEFAULT_CUBE_SIZE = 2.0  # 기본 큐브 크기
\ No newline at end of file
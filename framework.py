@@ -11,6 +11,11 @@ from datetime import datetime
 from pathlib import Path
 import hashlib
 import glob
+import importlib.util
+import json
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 
 # 필요한 패키지 설치 함수
 def install_if_missing(package):
@@ -26,6 +31,8 @@ install_if_missing("watchdog")
 
 # 상수 정의
 ADDON_NAME = "irkebim"
+# 프레임워크가 핫 리로드를 맡을 때 블렌더에 전달하는 환경 변수 (애드온 자체 감시는 꺼짐)
+FRAMEWORK_RELOAD_ENV = f"{ADDON_NAME.upper()}_FRAMEWORK_RELOAD"
 PROJECT_ROOT = os.path.abspath(os.path.dirname(__file__))
 
 # 기본 설정 값
@@ -33,7 +40,22 @@ BLENDER_EXE_PATH = "C:/Program Files/Blender Foundation/Blender 4.4/blender.exe"
 BLENDER_ADDON_PATH = "C:/Users/js11w/AppData/Roaming/Blender Foundation/Blender/4.4/scripts/addons/"
 BLENDER_EXTENSION_PATH = "C:/Users/js11w/AppData/Roaming/Blender Foundation/Blender/4.4/extensions/user_default/"
 RELEASE_DIR = os.path.join(PROJECT_ROOT, "releases")  # 기본 릴리즈 경로를 releases 폴더로 설정
-TEST_RELEASE_DIR = os.path.join(PROJECT_ROOT, "dist_temp")
+CACHE_DIR = os.path.join(PROJECT_ROOT, ".cache")  # 빌드/해시 캐시 경로
+HASH_MANIFEST_PATH = os.path.join(CACHE_DIR, "hash_manifest.json")
+SIGNATURE_EXTENSIONS = ('.py', '.toml', '.txt', '.json')  # 변경 시그니처에 포함할 확장자
+MANIFEST_SKIP_DIRS = {'__pycache__', '.git'}
+MANIFEST_SKIP_EXTENSIONS = ('.pyc', '.pyo')
+RELEASE_CACHE_DIR = os.path.join(CACHE_DIR, "release")  # 릴리즈 결과물 및 압축 엔트리 캐시
+RELEASE_CACHE_KEEP = 20  # 보관할 캐시 릴리즈 zip 개수
+RELEASE_FORMAT_VERSION = 3  # zip 레이아웃이나 생성 파일 규칙이 바뀌면 올려서 캐시 무효화
+ZIP_COMPRESS_LEVEL = 9
+ZIP_FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)  # 재현 가능한 빌드를 위한 고정 mtime
+RELEASE_WORKERS = min(8, os.cpu_count() or 1)  # 병렬 압축 스레드 수
+TESTS_DIR = os.path.join(PROJECT_ROOT, "tests")  # 헤드리스 테스트 모듈 경로
+BENCHMARK_DIR = os.path.join(PROJECT_ROOT, "benchmarks")  # 프로파일/벤치마크 결과 및 기준선
+PROFILE_BASELINE_PATH = os.path.join(BENCHMARK_DIR, "profile_baseline.json")
+TEST_WORKERS = 2  # 헤드리스 블렌더 워커 수
+TEST_TIMEOUT = 300.0  # 테스트 모듈 하나의 제한 시간 (초), 넘기면 워커를 종료하고 교체
 DEV_AS_ADDON = True
 DIST_AS_EXTENSION = True
 
@@ -56,6 +78,15 @@ if os.path.isfile(CONFIG_FILEPATH):
 
         if configParser.has_option('default', 'release_dir'):
             RELEASE_DIR = configParser.get('default', 'release_dir')
+
+        if configParser.has_option('test', 'tests_dir'):
+            TESTS_DIR = os.path.join(PROJECT_ROOT, configParser.get('test', 'tests_dir'))
+
+        if configParser.has_option('test', 'workers'):
+            TEST_WORKERS = configParser.getint('test', 'workers')
+
+        if configParser.has_option('test', 'timeout'):
+            TEST_TIMEOUT = configParser.getfloat('test', 'timeout')
     except Exception as e:
         print(f"Error reading config.ini: {e}")
         print("Using default values.")
@@ -82,14 +113,129 @@ def write_utf8(file_path, content):
     with open(file_path, 'w', encoding='utf-8') as f:
         f.write(content)
 
-def get_md5_folder(folder_path):
-    """Get the MD5 hash of all files in a folder"""
+def hash_file(file_path):
+    """Get the MD5 hex digest of a single file"""
+    md5_hash = hashlib.md5()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            md5_hash.update(chunk)
+    return md5_hash.hexdigest()
+
+def iter_folder_files(folder_path):
+    """Yield (relative path, stat) for every file in a folder, skipping caches"""
+    stack = [folder_path]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = list(os.scandir(current))
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in MANIFEST_SKIP_DIRS:
+                    stack.append(entry.path)
+            elif entry.is_file() and not entry.name.endswith(MANIFEST_SKIP_EXTENSIONS):
+                rel_path = os.path.relpath(entry.path, folder_path).replace(os.sep, '/')
+                yield rel_path, entry.stat()
+
+# 폴더별 해시 매니페스트 캐시 {폴더 경로: {상대 경로: [크기, mtime_ns, 다이제스트]}}
+_hash_manifests = None
+
+def _load_hash_manifests():
+    """Load the persistent hash manifests from disk (once per process)"""
+    global _hash_manifests
+    if _hash_manifests is None:
+        _hash_manifests = {}
+        if os.path.isfile(HASH_MANIFEST_PATH):
+            try:
+                with open(HASH_MANIFEST_PATH, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == 1:
+                    _hash_manifests = data.get('folders', {})
+            except Exception as e:
+                print(f"Ignoring unreadable hash manifest {HASH_MANIFEST_PATH}: {e}")
+    return _hash_manifests
+
+def _save_hash_manifests():
+    """Persist the hash manifests so the next session starts warm"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    temp_path = HASH_MANIFEST_PATH + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': 1, 'folders': _load_hash_manifests()}, f)
+    os.replace(temp_path, HASH_MANIFEST_PATH)
+
+def _refresh_manifest_entry(manifest, folder_path, rel_path, stat_result):
+    """Re-hash one file only if its size or mtime changed. Returns True if the digest changed"""
+    entry = manifest.get(rel_path)
+    if entry and entry[0] == stat_result.st_size and entry[1] == stat_result.st_mtime_ns:
+        return False
+    digest = hash_file(os.path.join(folder_path, rel_path))
+    manifest[rel_path] = [stat_result.st_size, stat_result.st_mtime_ns, digest]
+    return entry is None or entry[2] != digest
+
+def update_hash_manifest(folder_path, changed_paths=None):
+    """Bring the folder's hash manifest up to date
+
+    Only files whose size or mtime differ from the manifest are re-hashed. When
+    changed_paths (absolute paths reported by the file watcher) is given, only
+    those paths are checked instead of walking the whole folder.
+    Returns (manifest, changed relative paths, removed relative paths).
+    """
+    folder_path = os.path.abspath(folder_path)
+    manifests = _load_hash_manifests()
+    manifest = manifests.setdefault(folder_path, {})
+    changed, removed = set(), set()
+
+    if changed_paths is None or not manifest:
+        # 전체 폴더 검사 (stat만 수행, 변경된 파일만 해시)
+        seen = set()
+        for rel_path, stat_result in iter_folder_files(folder_path):
+            seen.add(rel_path)
+            if _refresh_manifest_entry(manifest, folder_path, rel_path, stat_result):
+                changed.add(rel_path)
+        removed = set(manifest) - seen
+    else:
+        # 감시자가 알려준 경로만 검사
+        for path in changed_paths:
+            rel_path = os.path.relpath(os.path.abspath(path), folder_path).replace(os.sep, '/')
+            if rel_path.startswith('..') or any(part in MANIFEST_SKIP_DIRS for part in rel_path.split('/')):
+                continue
+            if os.path.isdir(path):
+                for sub_path, stat_result in iter_folder_files(path):
+                    sub_rel = f"{rel_path}/{sub_path}" if rel_path != '.' else sub_path
+                    if _refresh_manifest_entry(manifest, folder_path, sub_rel, stat_result):
+                        changed.add(sub_rel)
+            elif os.path.isfile(path):
+                if not rel_path.endswith(MANIFEST_SKIP_EXTENSIONS) and \
+                        _refresh_manifest_entry(manifest, folder_path, rel_path, os.stat(path)):
+                    changed.add(rel_path)
+            else:
+                # 삭제된 파일 또는 폴더
+                prefix = rel_path + '/'
+                removed.update(p for p in manifest if p == rel_path or p.startswith(prefix))
+
+    for rel_path in removed:
+        manifest.pop(rel_path, None)
+    if changed or removed or not os.path.isfile(HASH_MANIFEST_PATH):
+        try:
+            _save_hash_manifests()
+        except Exception as e:
+            print(f"Failed to save hash manifest: {e}")
+    return manifest, sorted(changed), sorted(removed)
+
+def get_manifest_signature(manifest):
+    """Derive the folder signature from the digests recorded in a manifest"""
     md5_hash = hashlib.md5()
-    for file_path in sorted(search_files(folder_path, ['.py', '.toml', '.txt', '.json'])):
-        with open(file_path, 'rb') as f:
-            md5_hash.update(f.read())
+    for rel_path in sorted(manifest):
+        if rel_path.endswith(SIGNATURE_EXTENSIONS):
+            md5_hash.update(f"{rel_path}\0{manifest[rel_path][2]}\n".encode('utf-8'))
     return md5_hash.hexdigest()
 
+def get_md5_folder(folder_path, changed_paths=None):
+    """Get the MD5 signature of all files in a folder (incremental, see update_hash_manifest)"""
+    manifest, _, _ = update_hash_manifest(folder_path, changed_paths)
+    return get_manifest_signature(manifest)
+
 def is_subdirectory(path, potential_parent):
     """Check if path is a subdirectory of potential_parent"""
     path = os.path.abspath(path)
@@ -117,53 +263,385 @@ def remove_folder_safely(folder_path):
         print(f"Failed to remove {folder_path}: {e}")
         return False
 
+def write_utf8_atomic(file_path, content):
+    """Write content to a UTF-8 file so readers never see a partial write"""
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    temp_path = file_path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(temp_path, file_path)
+
+def _replace_with_retry(source_path, target_path, attempts=3):
+    """os.replace with a short retry for files briefly locked by another process"""
+    for attempt in range(attempts):
+        try:
+            os.replace(source_path, target_path)
+            return
+        except PermissionError:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(0.05)
+
+# 동기화 상태 {대상 폴더: {상대 경로: 다이제스트}}
+SYNC_STATE_PATH = os.path.join(CACHE_DIR, "sync_state.json")
+SYNC_STAGING_DIR = ".sync_staging"  # 대상 폴더 내부의 임시 스테이징 폴더
+_sync_state = None
+_verified_targets = set()
+
+def _load_sync_state():
+    """Load the record of what was last installed into each target folder"""
+    global _sync_state
+    if _sync_state is None:
+        _sync_state = {}
+        if os.path.isfile(SYNC_STATE_PATH):
+            try:
+                with open(SYNC_STATE_PATH, 'r', encoding='utf-8') as f:
+                    _sync_state = json.load(f)
+            except Exception as e:
+                print(f"Ignoring unreadable sync state {SYNC_STATE_PATH}: {e}")
+    return _sync_state
+
+def _save_sync_state():
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    write_utf8_atomic(SYNC_STATE_PATH, json.dumps(_load_sync_state()))
+
+def _scan_installed_files(target_folder, source_manifest, preserve):
+    """Rebuild the installed record of a target folder from disk
+
+    Files copied by sync_folder keep the source size and mtime, so only files
+    that differ in those are hashed.
+    """
+    installed, extra = {}, []
+    for rel_path, stat_result in iter_folder_files(target_folder):
+        if rel_path.split('/')[0] == SYNC_STAGING_DIR or rel_path in preserve:
+            continue
+        entry = source_manifest.get(rel_path)
+        if entry is None:
+            extra.append(rel_path)
+        elif entry[0] == stat_result.st_size and entry[1] == stat_result.st_mtime_ns:
+            installed[rel_path] = entry[2]
+        else:
+            installed[rel_path] = hash_file(os.path.join(target_folder, rel_path))
+    return installed, extra
+
+def sync_folder(source_folder, target_folder, changed_paths=None, preserve=(), exclude=None):
+    """Mirror source_folder into target_folder, touching only what changed
+
+    Added or modified files are first copied into a staging folder inside the
+    target and then moved into place with os.replace, so no file is ever seen
+    half-written. Files that no longer exist in the source are deleted.
+    The target is verified against disk once per process; after that the
+    recorded install state is trusted. exclude is an optional predicate on
+    relative paths for source files that must not be installed.
+    Returns (source manifest, copied relative paths, deleted relative paths).
+    """
+    target_folder = os.path.abspath(target_folder)
+    manifest, _, _ = update_hash_manifest(source_folder, changed_paths)
+    if exclude is not None:
+        manifest = {rel: entry for rel, entry in manifest.items() if not exclude(rel)}
+    state = _load_sync_state()
+
+    extra = []
+    if target_folder not in _verified_targets or target_folder not in state or not os.path.isdir(target_folder):
+        os.makedirs(target_folder, exist_ok=True)
+        state[target_folder], extra = _scan_installed_files(target_folder, manifest, set(preserve))
+        _verified_targets.add(target_folder)
+    installed = state[target_folder]
+
+    to_copy = sorted(rel for rel, entry in manifest.items() if installed.get(rel) != entry[2])
+    to_delete = sorted(set(rel for rel in installed if rel not in manifest) | set(extra))
+    if not to_copy and not to_delete:
+        return manifest, [], []
+
+    # 1단계: 스테이징 폴더에 변경 파일 복사
+    staging_folder = os.path.join(target_folder, SYNC_STAGING_DIR)
+    source_folder = os.path.abspath(source_folder)
+    try:
+        for rel_path in to_copy:
+            staged_path = os.path.join(staging_folder, rel_path)
+            os.makedirs(os.path.dirname(staged_path), exist_ok=True)
+            shutil.copy2(os.path.join(source_folder, rel_path), staged_path)
+
+        # 2단계: 스테이징된 파일을 제자리로 교체 (rename만 수행)
+        for rel_path in to_copy:
+            target_path = os.path.join(target_folder, rel_path)
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            _replace_with_retry(os.path.join(staging_folder, rel_path), target_path)
+            installed[rel_path] = manifest[rel_path][2]
+
+        # 3단계: 소스에서 사라진 파일 삭제
+        for rel_path in to_delete:
+            target_path = os.path.join(target_folder, rel_path)
+            try:
+                os.remove(target_path)
+            except FileNotFoundError:
+                pass
+            installed.pop(rel_path, None)
+            # 비게 된 상위 폴더 정리
+            parent = os.path.dirname(target_path)
+            while parent != target_folder and os.path.isdir(parent):
+                remaining = [name for name in os.listdir(parent) if name != '__pycache__']
+                if remaining:
+                    break
+                shutil.rmtree(parent, ignore_errors=True)
+                parent = os.path.dirname(parent)
+    finally:
+        shutil.rmtree(staging_folder, ignore_errors=True)
+        _save_sync_state()
+
+    return manifest, to_copy, to_delete
+
 # 프레임워크 코드
 _addon_md5__signature = "addon.txt"
+_addon_changes = "addon_changes.json"  # 마지막 동기화에서 바뀐 파일 목록 (시그니처 옆에 기록)
 
 # Code to be injected into Blender for hot reload functionality
 start_up_command = """
 import bpy
 from bpy.app.handlers import persistent
+import json
 import os
+import socket
 import sys
+import time
 existing_addon_md5 = ""
+reload_channel = None
+channel_buffer = b""
 try:
     bpy.ops.preferences.addon_enable(module="{addon_name}")
 except Exception as e:
     print("Addon enable failed:", e)
 
+def full_reload():
+    bpy.ops.preferences.addon_disable(module="{addon_name}")
+    all_modules = sys.modules
+    all_modules = dict(sorted(all_modules.items(),key= lambda x:x[0])) #sort them
+    for k,v in all_modules.items():
+        if k.startswith("{addon_name}"):
+            del sys.modules[k]
+    bpy.ops.preferences.addon_enable(module="{addon_name}")
+
+def modules_from_changes(changes, base_md5, addon_md5):
+    # 변경 목록이 이 시그니처 전환에 해당하지 않으면 None (전체 리로드)
+    if changes.get("base") != base_md5 or changes.get("signature") != addon_md5:
+        return None
+    if any(path.endswith(".py") for path in changes.get("removed", [])):
+        return None
+    module_names = []
+    for path in changes.get("changed", []):
+        if path.endswith(".py"):
+            parts = path[:-3].split("/")
+            if parts[-1] == "__init__":
+                parts = parts[:-1]
+            module_names.append(".".join(["{addon_name}"] + parts))
+    return module_names
+
+def read_changed_modules(base_md5, addon_md5):
+    if not os.path.exists("{addon_changes}"):
+        return None
+    with open("{addon_changes}", "r") as f:
+        changes = json.load(f)
+    return modules_from_changes(changes, base_md5, addon_md5)
+
+def targeted_reload(module_names):
+    manager = getattr(sys.modules.get("{addon_name}"), "manager", None)
+    if manager is None or not hasattr(manager, "reload_changed"):
+        return False
+    return manager.reload_changed(module_names)
+
+def apply_update(addon_md5, module_names, saved_at=None):
+    global existing_addon_md5
+    print("Addon file changed, start to update the addon")
+    mode = "targeted"
+    try:
+        if module_names is None or not targeted_reload(module_names):
+            mode = "full"
+            full_reload()
+    except Exception as e:
+        print("Targeted reload failed, reloading the whole addon:", e)
+        mode = "full"
+        try:
+            full_reload()
+        except Exception as e:
+            print("Addon update failed:", e)
+    existing_addon_md5 = addon_md5
+    print("Addon updated")
+    if saved_at:
+        latency_ms = (time.time() - saved_at) * 1000.0
+        print("Save-to-reload latency: %.1f ms (%s)" % (latency_ms, mode))
+        send_to_channel(dict(type="reloaded", signature=addon_md5, mode=mode, latency_ms=latency_ms))
+
+def send_to_channel(message):
+    global reload_channel
+    if reload_channel is None:
+        return
+    try:
+        reload_channel.sendall((json.dumps(message) + "\\n").encode("utf-8"))
+    except OSError:
+        pass
+
+def connect_reload_channel():
+    global reload_channel
+    if reload_channel is not None or {reload_port} <= 0:
+        return
+    try:
+        reload_channel = socket.create_connection(("127.0.0.1", {reload_port}), timeout=1.0)
+        reload_channel.setblocking(False)
+        print("Connected to reload channel on port {reload_port}")
+    except OSError as e:
+        print("Reload channel unavailable, falling back to signature polling:", e)
+        reload_channel = None
+
+def drain_reload_channel_tick():
+    # 프레임워크가 보낸 변경 알림을 논블로킹으로 읽어서 처리
+    global reload_channel, channel_buffer
+    if reload_channel is None:
+        return None
+    while True:
+        try:
+            data = reload_channel.recv(65536)
+        except BlockingIOError:
+            break
+        except OSError:
+            data = b""
+        if not data:
+            print("Reload channel closed, falling back to signature polling")
+            reload_channel.close()
+            reload_channel = None
+            return None
+        channel_buffer += data
+    while b"\\n" in channel_buffer:
+        line, _, channel_buffer = channel_buffer.partition(b"\\n")
+        # 예외가 타이머 밖으로 나가면 타이머가 해제되므로 알림 하나의 오류는 기록만 하고 계속
+        try:
+            notice = json.loads(line.decode("utf-8"))
+            if notice.get("type") == "changed" and notice.get("signature") != existing_addon_md5:
+                module_names = modules_from_changes(notice, existing_addon_md5, notice.get("signature"))
+                apply_update(notice.get("signature"), module_names, notice.get("saved_at"))
+        except Exception as e:
+            print("Ignoring malformed reload notice:", e)
+    return 0.05
+
 def watch_update_tick():
+    # 시그니처 파일 폴링은 채널이 없을 때만 사용하는 대체 경로
     global existing_addon_md5
+    if reload_channel is not None:
+        return 1.0
     if os.path.exists("{addon_signature}"):
         with open("{addon_signature}", "r") as f:
             addon_md5 = f.read()
         if existing_addon_md5 == "":
             existing_addon_md5 = addon_md5
         elif existing_addon_md5 != addon_md5:
-            print("Addon file changed, start to update the addon")
             try:
-                bpy.ops.preferences.addon_disable(module="{addon_name}")
-                all_modules = sys.modules
-                all_modules = dict(sorted(all_modules.items(),key= lambda x:x[0])) #sort them
-                for k,v in all_modules.items():
-                    if k.startswith("{addon_name}"):
-                        del sys.modules[k]
-                bpy.ops.preferences.addon_enable(module="{addon_name}")
+                module_names = read_changed_modules(existing_addon_md5, addon_md5)
             except Exception as e:
-                print("Addon update failed:", e)
-            existing_addon_md5 = addon_md5
-            print("Addon updated")
+                print("Could not read change list:", e)
+                module_names = None
+            apply_update(addon_md5, module_names)
     return 1.0
 
 @persistent
 def register_watch_update_tick(dummy):
+    global existing_addon_md5
     print("Watching for addon update...")
-    bpy.app.timers.register(watch_update_tick)
+    if existing_addon_md5 == "" and os.path.exists("{addon_signature}"):
+        with open("{addon_signature}", "r") as f:
+            existing_addon_md5 = f.read()
+    connect_reload_channel()
+    if reload_channel is not None and not bpy.app.timers.is_registered(drain_reload_channel_tick):
+        bpy.app.timers.register(drain_reload_channel_tick)
+    if not bpy.app.timers.is_registered(watch_update_tick):
+        bpy.app.timers.register(watch_update_tick)
 
 register_watch_update_tick(None)
 bpy.app.handlers.load_post.append(register_watch_update_tick)
 """
 
+class ReloadChannel:
+    """Local TCP channel that pushes change notices to the running Blender
+
+    Blender connects once at startup and drains the socket from a short
+    non-blocking timer, so a reload no longer waits for the next signature
+    poll. Blender answers every push with the measured save-to-reload latency.
+    """
+
+    def __init__(self, host="127.0.0.1"):
+        import socket
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.bind((host, 0))
+        self.server.listen(1)
+        self.port = self.server.getsockname()[1]
+        self.clients = []
+        self.latencies = []
+        self.lock = threading.Lock()
+        self.closed = False
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def _accept_loop(self):
+        while not self.closed:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                break
+            with self.lock:
+                self.clients.append(conn)
+            threading.Thread(target=self._read_loop, args=(conn,), daemon=True).start()
+
+    def _read_loop(self, conn):
+        try:
+            for line in conn.makefile('r', encoding='utf-8', errors='replace'):
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    print(f"Ignoring malformed message from Blender: {line.strip()[:80]}")
+                    continue
+                if message.get("type") == "reloaded":
+                    latency_ms = message.get("latency_ms", 0.0)
+                    self.latencies.append(latency_ms)
+                    print(f"Save-to-reload latency: {latency_ms:.1f} ms ({message.get('mode')})")
+        except (OSError, ValueError):
+            pass
+        finally:
+            with self.lock:
+                if conn in self.clients:
+                    self.clients.remove(conn)
+
+    def notify(self, message):
+        """Push a message to every connected Blender. Returns True if anyone received it"""
+        data = (json.dumps(message) + "\n").encode('utf-8')
+        sent = False
+        with self.lock:
+            for conn in list(self.clients):
+                try:
+                    conn.sendall(data)
+                    sent = True
+                except OSError:
+                    self.clients.remove(conn)
+        return sent
+
+    def report(self):
+        """Print a summary of the measured save-to-reload latencies"""
+        if self.latencies:
+            ordered = sorted(self.latencies)
+            median = ordered[len(ordered) // 2]
+            print(f"Save-to-reload latency over {len(ordered)} reloads: "
+                  f"median {median:.1f} ms, min {ordered[0]:.1f} ms, max {ordered[-1]:.1f} ms")
+
+    def close(self):
+        self.closed = True
+        try:
+            self.server.close()
+        except OSError:
+            pass
+        with self.lock:
+            for conn in self.clients:
+                try:
+                    conn.close()
+                except OSError:
+                    pass
+            self.clients = []
+
 def get_addon_info(filename: str):
     """Extract bl_info from the addon's __init__.py"""
     file_content = read_utf8(filename)
@@ -178,9 +656,9 @@ def get_addon_info(filename: str):
         print(f"Error parsing {filename}: {e}")
         return None
 
-def execute_blender_script(args, addon_path):
+def execute_blender_script(args, addon_path, env=None):
     """Execute a script in Blender"""
-    process = subprocess.Popen(args, stderr=subprocess.PIPE, text=True, encoding="utf-8")
+    process = subprocess.Popen(args, stderr=subprocess.PIPE, text=True, encoding="utf-8", env=env)
     try:
         for line in process.stderr:
             line: str
@@ -193,31 +671,47 @@ def execute_blender_script(args, addon_path):
         process.terminate()
         process.wait()
 
-def update_addon_for_test():
-    """Update the addon in the Blender addon folder for testing"""
+def update_addon_for_test(changed_paths=None, channel=None, saved_at=None):
+    """Update the addon in the Blender addon folder for testing
+
+    When a ReloadChannel is given, the change notice is also pushed to Blender.
+    saved_at is the time of the first file event, used for latency reporting.
+    """
     # 애드온 경로 확인
     if not os.path.exists(BLENDER_ADDON_PATH):
         os.makedirs(BLENDER_ADDON_PATH, exist_ok=True)
         
-    # 타겟 디렉토리 생성
+    # 타겟 디렉토리
     test_addon_path = os.path.join(BLENDER_ADDON_PATH, ADDON_NAME)
-    
-    # 기존 설치 제거
-    if os.path.exists(test_addon_path):
-        remove_folder_safely(test_addon_path)
-    
-    # 애드온 복사
     source_addon_path = os.path.join(PROJECT_ROOT, ADDON_NAME)
-    shutil.copytree(source_addon_path, test_addon_path)
     
-    # MD5 해시 생성
-    addon_md5 = get_md5_folder(source_addon_path)
-    write_utf8(os.path.join(test_addon_path, _addon_md5__signature), addon_md5)
+    # 변경된 파일만 동기화 (전체 삭제/복사 대신)
+    manifest, copied, deleted = sync_folder(source_addon_path, test_addon_path, changed_paths,
+                                            preserve=(_addon_md5__signature, _addon_changes))
+    
+    # MD5 시그니처는 모든 파일이 교체된 뒤 마지막에 기록
+    addon_md5 = get_manifest_signature(manifest)
+    signature_path = os.path.join(test_addon_path, _addon_md5__signature)
+    base_md5 = read_utf8(signature_path) if os.path.isfile(signature_path) else ""
+    if base_md5 != addon_md5:
+        # 블렌더가 바뀐 모듈만 리로드할 수 있도록 변경 목록을 먼저 기록
+        changes = {
+            "base": base_md5,
+            "signature": addon_md5,
+            "changed": copied,
+            "removed": deleted,
+        }
+        write_utf8_atomic(os.path.join(test_addon_path, _addon_changes), json.dumps(changes))
+        write_utf8_atomic(signature_path, addon_md5)
+        
+        # 실행 중인 블렌더에 변경 알림 전송 (폴링 대기 없이 즉시 리로드)
+        if channel is not None:
+            channel.notify(dict(changes, type="changed", saved_at=saved_at or time.time()))
     
-    print(f"Addon updated in {test_addon_path}")
+    print(f"Addon updated in {test_addon_path} ({len(copied)} copied, {len(deleted)} removed)")
     return test_addon_path
 
-def start_watch_for_update(stop_event):
+def start_watch_for_update(stop_event, channel=None):
     """Watch for file changes and update the addon"""
     from watchdog.events import FileSystemEventHandler
     from watchdog.observers import Observer
@@ -226,6 +720,11 @@ def start_watch_for_update(stop_event):
         def __init__(self):
             super(FileUpdateHandler, self).__init__()
             self.has_update = False
+            self.changed_paths = set()
+            self.lock = threading.Lock()
+            self.update_event = threading.Event()
+            self.first_event_time = None  # 이번 변경 묶음의 첫 이벤트 시각 (지연 측정용)
+            self.last_event_time = 0
             self.last_update_time = 0
             self.update_delay = 0.5  # 0.5초 딜레이 추가
 
@@ -233,16 +732,42 @@ def start_watch_for_update(stop_event):
             source_path = event.src_path
             current_time = time.time()
             
-            # .py 파일만 감시하고 애드온 폴더 내의 파일만 체크
-            if source_path.endswith(".py") and ADDON_NAME in source_path:
-                # 너무 빈번한 업데이트 방지
+            # 캐시 파일은 무시하고 애드온 폴더 내의 파일만 체크
+            paths = [source_path, getattr(event, "dest_path", "")]
+            paths = [p for p in paths
+                     if p and ADDON_NAME in p and "__pycache__" not in p and not p.endswith(MANIFEST_SKIP_EXTENSIONS)]
+            if paths:
+                # 변경 경로는 모두 기록하고 로그만 제한
+                with self.lock:
+                    self.changed_paths.update(paths)
+                    self.has_update = True
+                    if self.first_event_time is None:
+                        self.first_event_time = current_time
+                    self.last_event_time = current_time
+                self.update_event.set()
                 if current_time - self.last_update_time > self.update_delay:
                     print(f"File changed: {source_path}")
-                    self.has_update = True
                     self.last_update_time = current_time
 
-        def clear_update(self):
-            self.has_update = False
+        def take_changes(self):
+            with self.lock:
+                changed_paths = self.changed_paths
+                first_event_time = self.first_event_time
+                self.changed_paths = set()
+                self.first_event_time = None
+                self.has_update = False
+                self.update_event.clear()
+            return changed_paths, first_event_time
+
+        def restore_changes(self, changed_paths, first_event_time):
+            """Put back a change set whose update failed so the next pass retries it"""
+            with self.lock:
+                self.changed_paths |= changed_paths
+                self.has_update = True
+                if first_event_time is not None and (self.first_event_time is None or
+                                                     first_event_time < self.first_event_time):
+                    self.first_event_time = first_event_time
+            self.update_event.set()
 
     path = os.path.join(PROJECT_ROOT, ADDON_NAME)
     event_handler = FileUpdateHandler()
@@ -250,24 +775,36 @@ def start_watch_for_update(stop_event):
     observer.schedule(event_handler, path, recursive=True)
     observer.start()
 
+    debounce = 0.05  # 연속 저장을 하나로 묶기 위한 대기 시간
+    retry_delay = 1.0  # 업데이트 실패 후 다시 시도하기까지 대기 시간 (잠긴 파일 등)
+
     try:
         while not stop_event.is_set():
-            time.sleep(0.5)  # 0.5초마다 체크
+            # 이벤트가 올 때까지 대기 (유휴 상태에서는 폴링하지 않음)
+            if not event_handler.update_event.wait(timeout=0.5):
+                continue
+            # 저장이 잠잠해질 때까지 짧게 대기
+            while time.time() - event_handler.last_event_time < debounce:
+                time.sleep(debounce)
             if event_handler.has_update:
+                changed_paths, saved_at = event_handler.take_changes()
                 try:
-                    update_addon_for_test()
-                    event_handler.clear_update()
+                    update_addon_for_test(changed_paths, channel=channel, saved_at=saved_at)
                     print("Addon updated due to file changes")
                 except Exception as e:
                     print(f"Error updating addon: {e}")
                     print(
                         "Addon update failed: Please make sure no other process is"
-                        " using the addon folder. You might need to restart the test to update the addon in Blender.")
+                        " using the addon folder. The update will be retried.")
+                    # 실패한 변경 묶음을 되돌려 다음 업데이트에서 다시 동기화
+                    event_handler.restore_changes(changed_paths, saved_at)
+                    stop_event.wait(retry_delay)
         print("Stop watching for update...")
 
     except KeyboardInterrupt:
-        observer.stop()
+        pass
     finally:
+        observer.stop()
         observer.join()
 
 def test_addon(enable_watch=True):
@@ -282,13 +819,19 @@ def test_addon(enable_watch=True):
     # 종료 이벤트
     stop_event = threading.Event()
     thread = None
+    channel = None
     
     # 테스트 종료 시 처리할 작업
     def exit_handler():
+        nonlocal channel
         print("Clean up resources...")
         if thread and thread.is_alive():
             stop_event.set()
             thread.join(timeout=1.0)  # 최대 1초 대기
+        if channel is not None:
+            channel.report()
+            channel.close()
+            channel = None
         
         # 애드온 폴더를 삭제하지 않도록 설정 (개발 중에는 유지)
         # if os.path.exists(test_addon_path):
@@ -304,47 +847,1013 @@ def test_addon(enable_watch=True):
     if not enable_watch:
         print('Hot reload disabled, changes will not be automatically applied')
     else:
+        # 블렌더로 변경 알림을 보낼 채널 열기 (실패하면 시그니처 폴링만 사용)
+        try:
+            channel = ReloadChannel()
+        except OSError as e:
+            print(f"Could not open reload channel, Blender will poll the signature file: {e}")
+            channel = None
+        
         # Start watching for file changes
-        thread = threading.Thread(target=start_watch_for_update, args=(stop_event,))
+        thread = threading.Thread(target=start_watch_for_update, args=(stop_event, channel))
         thread.daemon = True  # 메인 스레드 종료 시 함께 종료되도록 설정
         thread.start()
 
     python_script = start_up_command.format(addon_name=ADDON_NAME,
                                            addon_signature=os.path.join(test_addon_path,
-                                                                       _addon_md5__signature).replace("\\", "/"))
+                                                                       _addon_md5__signature).replace("\\", "/"),
+                                           addon_changes=os.path.join(test_addon_path,
+                                                                     _addon_changes).replace("\\", "/"),
+                                           reload_port=channel.port if channel else 0)
 
     try:
         print(f"Starting Blender with addon {ADDON_NAME}")
+        # 핫 리로드를 프레임워크가 맡으면 애드온 안의 파일 감시는 켜지 않음 (같은 저장에 리로드 두 번 방지)
+        env = dict(os.environ, **{FRAMEWORK_RELOAD_ENV: "1"}) if enable_watch else None
         execute_blender_script([BLENDER_EXE_PATH, "--python-use-system-env", "--python-expr", python_script],
-                              test_addon_path)
+                              test_addon_path, env)
     finally:
         exit_handler()
         print("Test completed.")
 
-def zip_folder(source_folder, output_name, is_extension=False):
-    """Zip a folder for distribution"""
-    import zipfile
+# 헤드리스 워커와 주고받는 메시지 접두사 (블렌더 자체 출력과 구분)
+_worker_marker = "@@irkebim-worker@@"
+
+# Code run by each headless Blender worker: enable the addon, then serve test requests from stdin
+headless_worker_command = """
+import bpy
+import importlib.util
+import io
+import json
+import sys
+import time
+import traceback
+import unittest
+
+def send(message):
+    sys.stdout.write("{marker}" + json.dumps(message) + "\\n")
+    sys.stdout.flush()
+
+def enable_addon():
+    bpy.ops.preferences.addon_enable(module="{addon_name}")
+
+def reset_worker():
+    # 이전 테스트의 씬/데이터/설정을 모두 버리고 애드온만 다시 활성화
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    enable_addon()
+
+def run_test_module(path):
+    started = time.perf_counter()
+    stream = io.StringIO()
+    result = dict(type="result", path=path, tests_run=0, failures=[], errors=[], skipped=0)
+    try:
+        name = "irkebim_test_" + str(abs(hash(path)))
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        suite = unittest.defaultTestLoader.loadTestsFromModule(module)
+        outcome = unittest.TextTestRunner(stream=stream, verbosity=2).run(suite)
+        result["tests_run"] = outcome.testsRun
+        result["failures"] = [[str(test), text] for test, text in outcome.failures]
+        result["errors"] = [[str(test), text] for test, text in outcome.errors]
+        result["skipped"] = len(outcome.skipped)
+    except Exception:
+        result["errors"].append([path, traceback.format_exc()])
+    result["output"] = stream.getvalue()
+    result["duration"] = time.perf_counter() - started
+    return result
+
+try:
+    enable_addon()
+    send(dict(type="ready"))
+except Exception:
+    send(dict(type="fatal", error=traceback.format_exc()))
+    sys.exit(1)
+
+used = False
+for line in sys.stdin:
+    request = json.loads(line)
+    if request.get("cmd") == "quit":
+        break
+    if request.get("cmd") == "run":
+        if used:
+            reset_worker()
+        used = True
+        send(run_test_module(request["path"]))
+sys.exit(0)
+"""
+
+class BlenderWorker:
+    """One warm `blender --background` process with the addon enabled
+
+    stdout is read by a background thread, so every wait for a protocol
+    message has a deadline and a hung Blender cannot block the pool.
+    """
+
+    def __init__(self, index, timeout=None):
+        import queue
+        self.index = index
+        self.timeout = timeout or TEST_TIMEOUT
+        script = headless_worker_command.format(addon_name=ADDON_NAME, marker=_worker_marker)
+        self.process = subprocess.Popen(
+            [BLENDER_EXE_PATH, "--background", "--factory-startup", "--python-use-system-env",
+             "--python-expr", script],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, encoding="utf-8", errors="replace", bufsize=1)
+        self.log = []
+        self.lines = queue.Queue()
+        threading.Thread(target=self._reader_loop, daemon=True).start()
+        try:
+            ready = self._read_message(self.timeout)
+        except TimeoutError as e:
+            self.kill()
+            raise RuntimeError(f"Blender worker {index} failed to start: {e}")
+        if ready is None or ready.get("type") != "ready":
+            self.close()
+            detail = ready.get("error") if ready else "".join(self.log[-20:])
+            raise RuntimeError(f"Blender worker {index} failed to start:\n{detail}")
+
+    def _reader_loop(self):
+        # 블렌더 출력을 줄 단위로 큐에 넣음 (None은 프로세스 종료)
+        try:
+            for line in self.process.stdout:
+                self.lines.put(line)
+        except (OSError, ValueError):
+            pass
+        self.lines.put(None)
+
+    def _read_message(self, timeout):
+        """Read output until the next protocol message; Blender's own output is kept in the log
+
+        Returns None if the process exited, raises TimeoutError when no message
+        arrives within timeout seconds.
+        """
+        import queue
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"no response within {timeout:.0f}s")
+            try:
+                line = self.lines.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            if line is None:
+                return None
+            if line.startswith(_worker_marker):
+                return json.loads(line[len(_worker_marker):])
+            self.log.append(line)
+
+    def run(self, test_path):
+        """Run one test module in this worker and return its result message"""
+        self.log = []
+        self.process.stdin.write(json.dumps({"cmd": "run", "path": test_path}) + "\n")
+        self.process.stdin.flush()
+        try:
+            result = self._read_message(self.timeout)
+        except TimeoutError as e:
+            raise RuntimeError(f"Blender worker {self.index} timed out ({e}):\n{''.join(self.log[-20:])}")
+        if result is None:
+            raise RuntimeError(f"Blender worker {self.index} exited:\n{''.join(self.log[-20:])}")
+        return result
+
+    def kill(self):
+        """Terminate a hung or dead worker without waiting for it to answer"""
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+
+    def close(self):
+        if self.process.poll() is None:
+            try:
+                self.process.stdin.write(json.dumps({"cmd": "quit"}) + "\n")
+                self.process.stdin.flush()
+                self.process.wait(timeout=10)
+            except (OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+                self.process.wait()
+
+class BlenderWorkerPool:
+    """Pool of warm headless Blender workers that test modules are sharded across"""
+
+    def __init__(self, size, timeout=None):
+        self.workers = []
+        self.timeout = timeout
+        errors = []
+        lock = threading.Lock()
+
+        # 블렌더 시작 비용이 겹치도록 워커를 동시에 띄움
+        def start(index):
+            try:
+                worker = BlenderWorker(index, timeout)
+                with lock:
+                    self.workers.append(worker)
+            except Exception as e:
+                with lock:
+                    errors.append(e)
+
+        threads = [threading.Thread(target=start, args=(index,)) for index in range(max(1, size))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if not self.workers:
+            raise RuntimeError(f"No Blender worker could be started: {errors[0] if errors else 'unknown error'}")
+        for e in errors:
+            print(f"Warning: {e}")
+
+    def run(self, test_paths):
+        """Run test modules on the workers, each worker pulling the next module when free"""
+        import queue
+        pending = queue.Queue()
+        for path in test_paths:
+            pending.put(path)
+        results = []
+        lock = threading.Lock()
+
+        def serve(worker):
+            while True:
+                try:
+                    path = pending.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    result = worker.run(path)
+                except Exception as e:
+                    # 워커가 죽거나 제한 시간을 넘기면 해당 모듈은 오류로 기록하고 새 워커로 교체
+                    result = {"type": "result", "path": path, "tests_run": 0, "failures": [],
+                              "errors": [[path, str(e)]], "skipped": 0, "duration": 0.0, "output": ""}
+                    worker.kill()
+                    try:
+                        worker = BlenderWorker(worker.index, self.timeout)
+                    except Exception as restart_error:
+                        print(f"Worker {worker.index} could not be restarted: {restart_error}")
+                        with lock:
+                            results.append(result)
+                            self.workers = [w for w in self.workers if w.index != worker.index]
+                        return
+                    with lock:
+                        self.workers = [w for w in self.workers if w.index != worker.index] + [worker]
+                result["worker"] = worker.index
+                with lock:
+                    results.append(result)
+                print_test_result(result)
+
+        threads = [threading.Thread(target=serve, args=(worker,)) for worker in list(self.workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def close(self):
+        for worker in self.workers:
+            worker.close()
+        self.workers = []
+
+def print_test_result(result):
+    """Print the outcome of one test module"""
+    name = os.path.relpath(result["path"], PROJECT_ROOT)
+    status = "FAIL" if result["failures"] or result["errors"] else "ok"
+    print(f"[{status}] {name}: {result['tests_run']} tests in {result['duration']:.2f}s"
+          f" (worker {result.get('worker', '?')})")
+    for test, text in result["failures"] + result["errors"]:
+        print(f"--- {test}\n{text}")
+
+def discover_test_modules(tests_dir=None, pattern="test*.py"):
+    """Find test modules for the headless runner"""
+    import fnmatch
+    tests_dir = tests_dir or TESTS_DIR
+    paths = []
+    for root, dirs, files in os.walk(tests_dir):
+        dirs[:] = [d for d in dirs if d not in MANIFEST_SKIP_DIRS]
+        paths.extend(os.path.join(root, f) for f in files if fnmatch.fnmatch(f, pattern))
+    return sorted(paths)
+
+def run_headless_tests(workers=None, pattern="test*.py", tests_dir=None, timeout=None):
+    """Run the addon tests in a pool of warm headless Blender workers. Returns True if all passed
+
+    timeout is the per-module deadline in seconds (TEST_TIMEOUT by default);
+    a worker that exceeds it is killed and replaced.
+    """
+    if not os.path.isfile(BLENDER_EXE_PATH):
+        raise ValueError(f"Blender executable not found at {BLENDER_EXE_PATH}")
+    
+    test_paths = discover_test_modules(tests_dir, pattern)
+    if not test_paths:
+        print(f"No test modules matching {pattern} found in {tests_dir or TESTS_DIR}")
+        return True
     
-    # 릴리즈 경로가 존재하는지 확인하고 생성
+    # 최신 애드온 설치 후 워커 시작
+    update_addon_for_test()
+    workers = min(workers or TEST_WORKERS, len(test_paths))
+    started = time.perf_counter()
+    print(f"Starting {workers} headless Blender workers for {len(test_paths)} test modules")
+    pool = BlenderWorkerPool(workers, timeout)
+    try:
+        results = pool.run(test_paths)
+    finally:
+        pool.close()
+    
+    tests_run = sum(result["tests_run"] for result in results)
+    failures = sum(len(result["failures"]) for result in results)
+    errors = sum(len(result["errors"]) for result in results)
+    print(f"Ran {tests_run} tests from {len(results)} modules in {time.perf_counter() - started:.2f}s: "
+          f"{failures} failures, {errors} errors")
+    return failures == 0 and errors == 0 and len(results) == len(test_paths)
+
+# Code run in a headless Blender to profile enabling the addon
+profile_command = """
+import bpy
+import importlib.abc
+import json
+import sys
+import time
+import traceback
+
+ADDON = "{addon_name}"
+stack = []          # [이름, 시작 시각, 자식 시간]
+collapsed = dict()  # "a;b;c" -> 자체 시간(ms)
+phases = dict()
+imports = dict()
+classes = dict()
+properties = dict()
+
+def begin(label):
+    stack.append([label, time.perf_counter(), 0.0])
+
+def end():
+    label, started, child_ms = stack.pop()
+    total_ms = (time.perf_counter() - started) * 1000.0
+    if stack:
+        stack[-1][2] += total_ms
+    path = ";".join([frame[0] for frame in stack] + [label])
+    collapsed[path] = collapsed.get(path, 0.0) + total_ms - child_ms
+    return total_ms, total_ms - child_ms
+
+def timed(name, func):
+    def wrapper(*args, **kwargs):
+        begin(name)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            total_ms, _ = end()
+            entry = phases.setdefault(name, dict(ms=0.0, calls=0))
+            entry["ms"] += total_ms
+            entry["calls"] += 1
+    return wrapper
+
+def instrument_module_manager(module):
+    cls = module.ModuleManager
+    for name in ("__init__", "_load_utils", "load_all_modules", "register_all"):
+        setattr(cls, name, timed("ModuleManager." + name, getattr(cls, name)))
+
+def instrument_registration(module):
+    for name in ("collect_from_all_modules", "register_all"):
+        setattr(module, name, timed("registration." + name, getattr(module, name)))
+    register_property = module.register_property
+    def timed_register_property(owner, name, value):
+        started = time.perf_counter()
+        try:
+            return register_property(owner, name, value)
+        finally:
+            properties[owner.__name__ + "." + name] = (time.perf_counter() - started) * 1000.0
+    module.register_property = timed_register_property
+
+INSTRUMENT = dict()
+INSTRUMENT[ADDON + ".utils.module_manager"] = instrument_module_manager
+INSTRUMENT[ADDON + ".utils.registration"] = instrument_registration
+
+class TimingLoader:
+    # -X importtime과 같은 방식으로 애드온 모듈의 자체/누적 임포트 시간 측정
+    def __init__(self, loader):
+        self.loader = loader
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        name = module.__name__
+        begin("import " + name)
+        try:
+            self.loader.exec_module(module)
+        finally:
+            total_ms, self_ms = end()
+            imports[name] = dict(self_ms=self_ms, cumulative_ms=total_ms)
+        if name in INSTRUMENT:
+            INSTRUMENT[name](module)
+
+class TimingFinder(importlib.abc.MetaPathFinder):
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname != ADDON and not fullname.startswith(ADDON + "."):
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None:
+                    spec.loader = TimingLoader(spec.loader)
+                return spec
+        return None
+
+register_class = bpy.utils.register_class
+def timed_register_class(cls):
+    started = time.perf_counter()
+    try:
+        return register_class(cls)
+    finally:
+        classes[cls.__name__] = (time.perf_counter() - started) * 1000.0
+
+report = dict(addon=ADDON, blender_version=bpy.app.version_string)
+try:
+    sys.meta_path.insert(0, TimingFinder())
+    bpy.utils.register_class = timed_register_class
+    begin("addon_enable")
+    bpy.ops.preferences.addon_enable(module=ADDON)
+    report["total_ms"], _ = end()
+except Exception:
+    report["error"] = traceback.format_exc()
+finally:
+    bpy.utils.register_class = register_class
+
+report.update(phases=phases, imports=imports, classes=classes, properties=properties,
+              collapsed=sorted("%s %d" % (path, round(ms * 1000)) for path, ms in collapsed.items()))
+# 애드온 자체 타이밍 구간 (utils/logger.py 링 버퍼)
+addon_logger = sys.modules.get(ADDON + ".utils.logger")
+if addon_logger is not None:
+    report["spans"] = addon_logger.summarize_spans()
+with open("{report_path}", "w", encoding="utf-8") as f:
+    json.dump(report, f, indent=2, sort_keys=True)
+"""
+
+def _flatten_metrics(report):
+    """Flatten a profile or benchmark report into {metric name: milliseconds}"""
+    metrics = {}
+    if "total_ms" in report:
+        metrics["total"] = report["total_ms"]
+    for name, entry in report.get("phases", {}).items():
+        metrics[f"phase:{name}"] = entry["ms"]
+    for name, entry in report.get("imports", {}).items():
+        metrics[f"import:{name}"] = entry["cumulative_ms"]
+    for name, ms in report.get("classes", {}).items():
+        metrics[f"class:{name}"] = ms
+    for name, ms in report.get("properties", {}).items():
+        metrics[f"property:{name}"] = ms
+    for name, entry in report.get("benchmarks", {}).items():
+        metrics[f"bench:{name}"] = entry["ms"]
+    return metrics
+
+def compare_with_baseline(report, baseline, threshold=0.2, min_delta_ms=1.0):
+    """List metrics that got slower than the baseline by more than threshold (fraction)
+
+    Differences under min_delta_ms are ignored as timer noise.
+    Returns a list of (metric, baseline ms, current ms).
+    """
+    current, previous = _flatten_metrics(report), _flatten_metrics(baseline)
+    regressions = []
+    for name in sorted(current):
+        if name in previous:
+            old, new = previous[name], current[name]
+            if new - old > min_delta_ms and new > old * (1.0 + threshold):
+                regressions.append((name, old, new))
+    return regressions
+
+def print_regressions(regressions, threshold):
+    if not regressions:
+        print(f"No regressions over {threshold:.0%} against the baseline")
+        return
+    print(f"{len(regressions)} regressions over {threshold:.0%}:")
+    for name, old, new in regressions:
+        print(f"  {name}: {old:.2f} ms -> {new:.2f} ms (+{(new - old) / old:.0%})" if old else
+              f"  {name}: {old:.2f} ms -> {new:.2f} ms")
+
+def run_blender_background(script, timeout=600):
+    """Run a script in a fresh headless Blender and wait for it to finish"""
+    if not os.path.isfile(BLENDER_EXE_PATH):
+        raise ValueError(f"Blender executable not found at {BLENDER_EXE_PATH}")
+    result = subprocess.run(
+        [BLENDER_EXE_PATH, "--background", "--factory-startup", "--python-use-system-env",
+         "--python-exit-code", "1", "--python-expr", script],
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, encoding="utf-8", errors="replace",
+        timeout=timeout)
+    return result.returncode, result.stdout
+
+def profile_addon(repeat=1, update_baseline=False, threshold=0.2, output_dir=None):
+    """Profile enabling the addon in headless Blender and compare against the stored baseline
+
+    Writes <output_dir>/profile.json (per-module import, per-phase, per-class and
+    per-property times) and profile.folded (collapsed stacks for flamegraph tools).
+    The fastest of `repeat` runs is kept. Returns True if no regression was found.
+    """
+    output_dir = output_dir or os.path.join(BENCHMARK_DIR, "profiles")
+    os.makedirs(output_dir, exist_ok=True)
+    update_addon_for_test()
+    
+    report = None
+    for run in range(max(1, repeat)):
+        report_path = os.path.join(output_dir, f"profile_run{run}.json")
+        script = profile_command.format(addon_name=ADDON_NAME, report_path=report_path.replace("\\", "/"))
+        returncode, output = run_blender_background(script)
+        if not os.path.isfile(report_path):
+            print(output)
+            raise RuntimeError(f"Profiling run failed with exit code {returncode}")
+        with open(report_path, 'r', encoding='utf-8') as f:
+            run_report = json.load(f)
+        os.remove(report_path)
+        if "error" in run_report:
+            raise RuntimeError(f"Enabling the addon failed while profiling:\n{run_report['error']}")
+        if report is None or run_report["total_ms"] < report["total_ms"]:
+            report = run_report
+    report["runs"] = max(1, repeat)
+    
+    report_path = os.path.join(output_dir, "profile.json")
+    write_utf8(report_path, json.dumps(report, indent=2, sort_keys=True))
+    write_utf8(os.path.join(output_dir, "profile.folded"), "\n".join(report["collapsed"]) + "\n")
+    
+    # 요약 출력
+    print(f"Addon enable took {report['total_ms']:.1f} ms (best of {report['runs']})")
+    for name, entry in sorted(report["phases"].items(), key=lambda item: -item[1]["ms"]):
+        print(f"  {name}: {entry['ms']:.1f} ms ({entry['calls']} calls)")
+    slowest = sorted(report["imports"].items(), key=lambda item: -item[1]["self_ms"])[:10]
+    for name, entry in slowest:
+        print(f"  import {name}: self {entry['self_ms']:.1f} ms, cumulative {entry['cumulative_ms']:.1f} ms")
+    print(f"Profile written to {report_path}")
+    
+    if update_baseline or not os.path.isfile(PROFILE_BASELINE_PATH):
+        write_utf8(PROFILE_BASELINE_PATH, json.dumps(report, indent=2, sort_keys=True))
+        print(f"Baseline saved to {PROFILE_BASELINE_PATH}")
+        return True
+    
+    with open(PROFILE_BASELINE_PATH, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare_with_baseline(report, baseline, threshold)
+    print_regressions(regressions, threshold)
+    return not regressions
+
+# Benchmark suite run in a headless Blender
+bench_command = """
+import bpy
+import json
+import statistics
+import sys
+import time
+import traceback
+
+ADDON = "{addon_name}"
+SUITES = dict(
+    default=dict(cube_counts=[1, 100, 10000], scene_counts=[100, 1000], repeat=3),
+    quick=dict(cube_counts=[1, 100, 1000], scene_counts=[100], repeat=2),
+)
+suite = SUITES["{suite}"]
+results = dict()
+errors = dict()
+
+def is_enabled():
+    return ADDON in bpy.context.preferences.addons
+
+def enable():
+    if not is_enabled():
+        bpy.ops.preferences.addon_enable(module=ADDON)
+
+def disable():
+    if is_enabled():
+        bpy.ops.preferences.addon_disable(module=ADDON)
+
+def reset():
+    # 벤치마크마다 빈 파일에서 시작
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    enable()
+
+def manager():
+    return sys.modules[ADDON].manager
+
+def measure(name, func, setup=None, repeat=None):
+    times = []
+    try:
+        for _ in range(repeat or suite["repeat"]):
+            if setup:
+                setup()
+            started = time.perf_counter()
+            func()
+            times.append((time.perf_counter() - started) * 1000.0)
+    except Exception:
+        errors[name] = traceback.format_exc()
+        return
+    results[name] = dict(ms=statistics.median(times), min_ms=min(times), runs=len(times))
+    print("bench %-40s %10.2f ms" % (name, results[name]["ms"]))
+
+def add_cubes(count):
+    def run():
+        for _ in range(count):
+            bpy.ops.mesh.add_custom_cube()
+    return run
+
+def add_cube_batch(count):
+    def run():
+        bpy.ops.mesh.add_cube_batch(source='GRID', count_x=count, count_y=1, count_z=1)
+    return run
+
+def build_walls(count):
+    def run():
+        import numpy
+        walls = sys.modules[ADDON + ".geometry.walls"]
+        angles = numpy.linspace(0.0, 8.0 * numpy.pi, count + 1)
+        points = numpy.stack((angles * numpy.cos(angles), angles * numpy.sin(angles)), axis=1)
+        edges = numpy.stack((numpy.arange(count), numpy.arange(1, count + 1)), axis=1)
+        walls.build_walls(points, edges, 0.2, 2.4)
+    return run
+
+def build_facade(openings):
+    def run():
+        import numpy
+        wall_model = sys.modules[ADDON + ".geometry.wall_model"]
+        corners = [(0.0, 0.0), (150.0, 0.0), (150.0, 10.0), (0.0, 10.0)]
+        obj = wall_model.create_wall_object("BenchFacade", corners, corners[1:] + corners[:1], 0.2, 3.0)
+        offsets = numpy.arange(openings) * (150.0 / max(openings, 1)) + 0.1
+        params = numpy.stack((offsets, numpy.full(openings, 0.15), numpy.full(openings, 0.9),
+                              numpy.full(openings, 2.1)), axis=1)
+        wall_model.set_openings(obj, numpy.zeros(openings, dtype=numpy.int32), params)
+        wall_model.regenerate(obj)
+    return run
+
+def add_scenes(count):
+    def setup():
+        reset()
+        for index in range(count):
+            bpy.data.scenes.new("Bench%d" % index)
+    return setup
+
+def drag_preference():
+    preferences = bpy.context.preferences.addons[ADDON].preferences
+    for step in range(20):
+        preferences.default_cube_size = 1.0 + step * 0.01
+
+def full_reload():
+    disable()
+    for name in sorted(sys.modules):
+        if name == ADDON or name.startswith(ADDON + "."):
+            del sys.modules[name]
+    enable()
+
+reset()
+measure("addon_enable", enable, setup=disable)
+measure("addon_disable", disable, setup=enable)
+for count in suite["cube_counts"]:
+    measure("cube_execute_%d" % count, add_cubes(count), setup=reset)
+    measure("cube_batch_%d" % count, add_cube_batch(count), setup=reset)
+measure("wall_build_2000", build_walls(2000), setup=reset)
+measure("wall_facade_plain", build_facade(0), setup=reset)
+measure("wall_facade_500_openings", build_facade(500), setup=reset)
+for count in suite["scene_counts"]:
+    measure("preference_sync_%d_scenes" % count, lambda: manager()._sync_preferences_to_scenes(),
+            setup=add_scenes(count))
+    measure("preference_drag_%d_scenes" % count, drag_preference, setup=add_scenes(count))
+reset()
+measure("hot_reload_targeted", lambda: manager().reload_changed([ADDON + ".operators.cube"]))
+measure("hot_reload_full", full_reload)
+
+with open("{report_path}", "w", encoding="utf-8") as f:
+    json.dump(dict(suite="{suite}", blender_version=bpy.app.version_string,
+                   benchmarks=results, errors=errors), f, indent=2, sort_keys=True)
+"""
+
+def run_benchmarks(suite="default", threshold=0.2, update_baseline=False):
+    """Run a benchmark suite in headless Blender and compare it with the suite's baseline
+
+    Every run is stored in benchmarks/results/. The first run of a suite (or one
+    made with update_baseline) becomes benchmarks/baseline_<suite>.json.
+    Returns True when all benchmarks ran and none regressed beyond threshold.
+    """
+    update_addon_for_test()
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    report_path = os.path.join(BENCHMARK_DIR, "results", f"{suite}_{timestamp}.json")
+    os.makedirs(os.path.dirname(report_path), exist_ok=True)
+    
+    script = bench_command.format(addon_name=ADDON_NAME, suite=suite, report_path=report_path.replace("\\", "/"))
+    returncode, output = run_blender_background(script, timeout=3600)
+    if not os.path.isfile(report_path):
+        print(output)
+        raise RuntimeError(f"Benchmark run failed with exit code {returncode}")
+    
+    with open(report_path, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    report["created"] = datetime.now().isoformat(timespec="seconds")
+    try:
+        report["commit"] = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                                          capture_output=True, text=True).stdout.strip()
+    except OSError:
+        pass
+    write_utf8(report_path, json.dumps(report, indent=2, sort_keys=True))
+    
+    for name, entry in sorted(report["benchmarks"].items()):
+        print(f"  {name:<40} {entry['ms']:>10.2f} ms (min {entry['min_ms']:.2f}, {entry['runs']} runs)")
+    for name, error in sorted(report["errors"].items()):
+        print(f"  {name}: ERROR\n{error}")
+    print(f"Results written to {report_path}")
+    
+    baseline_path = os.path.join(BENCHMARK_DIR, f"baseline_{suite}.json")
+    if update_baseline or not os.path.isfile(baseline_path):
+        write_utf8(baseline_path, json.dumps(report, indent=2, sort_keys=True))
+        print(f"Baseline saved to {baseline_path}")
+        return not report["errors"]
+    
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    print(f"Comparing with baseline from {baseline.get('created', 'unknown date')} ({baseline.get('commit', '?')})")
+    regressions = compare_with_baseline(report, baseline, threshold)
+    print_regressions(regressions, threshold)
+    return not regressions and not report["errors"]
+
+def get_release_key(manifest, arc_prefix):
+    """Hash the release inputs (file digests and packaging options) into a cache key"""
+    key = hashlib.sha256()
+    options = {"format": RELEASE_FORMAT_VERSION, "prefix": arc_prefix, "level": ZIP_COMPRESS_LEVEL,
+               "date_time": ZIP_FIXED_DATE_TIME}
+    key.update(json.dumps(options, sort_keys=True).encode('utf-8'))
+    for rel_path in sorted(manifest):
+        key.update(f"{rel_path}\0{manifest[rel_path][2]}\n".encode('utf-8'))
+    return key.hexdigest()
+
+def _get_compressed_entry(file_path, digest):
+    """Return (crc, size, method, data) for a file, reusing a cached compressed copy by digest"""
+    entry_path = os.path.join(RELEASE_CACHE_DIR, "entries", f"{digest}-{ZIP_COMPRESS_LEVEL}.bin")
+    if os.path.isfile(entry_path):
+        with open(entry_path, 'rb') as f:
+            crc, size, method = struct.unpack('<IQB', f.read(13))
+            return crc, size, method, f.read()
+
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    compressor = zlib.compressobj(ZIP_COMPRESS_LEVEL, zlib.DEFLATED, -15)
+    data = compressor.compress(raw) + compressor.flush()
+    method = 8  # deflate
+    if len(data) >= len(raw):
+        data, method = raw, 0  # 압축 효과가 없으면 그대로 저장
+    crc = zlib.crc32(raw) & 0xFFFFFFFF
+
+    os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+    temp_path = f"{entry_path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(struct.pack('<IQB', crc, len(raw), method))
+        f.write(data)
+    os.replace(temp_path, entry_path)
+    return crc, len(raw), method, data
+
+def write_deterministic_zip(output_path, files):
+    """Write a byte-for-byte reproducible zip
+
+    files is a list of (arcname, file path, digest). Entries are sorted by name,
+    carry a fixed timestamp and permissions, and their compressed data is reused
+    from the entry cache when the same content was packaged before.
+    """
+    year, month, day, hour, minute, second = ZIP_FIXED_DATE_TIME
+    dos_date = ((year - 1980) << 9) | (month << 5) | day
+    dos_time = (hour << 11) | (minute << 5) | (second // 2)
+    external_attr = 0o100644 << 16
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    temp_path = f"{output_path}.{os.getpid()}.tmp"
+    central_directory = []
+    files = sorted(files)
+    with open(temp_path, 'wb') as f, ThreadPoolExecutor(max_workers=RELEASE_WORKERS) as executor:
+        # 압축은 스레드 풀에서 병렬로 수행하고, 기록은 정렬 순서대로 스트리밍
+        compressed = executor.map(lambda item: _get_compressed_entry(item[1], item[2]), files)
+        for (arcname, file_path, digest), (crc, size, method, data) in zip(files, compressed):
+            if size >= 0xFFFFFFFF or f.tell() >= 0xFFFFFFFF or len(files) >= 0xFFFF:
+                raise ValueError("Release too large for a non-zip64 archive")
+            name = arcname.encode('utf-8')
+            offset = f.tell()
+            # local file header (UTF-8 파일 이름 플래그 0x0800)
+            f.write(struct.pack('<IHHHHHIIIHH', 0x04034b50, 20, 0x0800, method, dos_time, dos_date,
+                                crc, len(data), size, len(name), 0))
+            f.write(name)
+            f.write(data)
+            central_directory.append(struct.pack('<IHHHHHHIIIHHHHHII', 0x02014b50, (3 << 8) | 20, 20, 0x0800,
+                                                 method, dos_time, dos_date, crc, len(data), size, len(name),
+                                                 0, 0, 0, 0, external_attr, offset) + name)
+        directory_offset = f.tell()
+        for record in central_directory:
+            f.write(record)
+        directory_size = f.tell() - directory_offset
+        f.write(struct.pack('<IHHHHIIH', 0x06054b50, 0, 0, len(central_directory), len(central_directory),
+                            directory_size, directory_offset, 0))
+    os.replace(temp_path, output_path)
+
+def _prune_release_cache():
+    """Keep only the most recently used cached release zips"""
+    artifacts_dir = os.path.join(RELEASE_CACHE_DIR, "artifacts")
+    try:
+        artifacts = sorted((entry for entry in os.scandir(artifacts_dir) if entry.name.endswith('.zip')),
+                           key=lambda entry: entry.stat().st_mtime, reverse=True)
+    except FileNotFoundError:
+        return
+    for entry in artifacts[RELEASE_CACHE_KEEP:]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+def get_cached_release(manifest, arc_prefix):
+    """Path of the cached zip built from exactly these inputs, or None"""
+    artifact_path = os.path.join(RELEASE_CACHE_DIR, "artifacts", f"{get_release_key(manifest, arc_prefix)}.zip")
+    return artifact_path if os.path.isfile(artifact_path) else None
+
+def _publish_release_zip(artifact_path, output_name):
+    """Copy a cached release zip to RELEASE_DIR under its release name"""
     if not os.path.exists(RELEASE_DIR):
         os.makedirs(RELEASE_DIR, exist_ok=True)
+    output_path = os.path.join(RELEASE_DIR, f"{output_name}.zip")
+    shutil.copyfile(artifact_path, output_path)
+    os.utime(artifact_path)  # 최근 사용 표시 (캐시 정리 기준)
+    return output_path
+
+def load_build_excludes(addon_folder):
+    """Read [build].paths_exclude_pattern from the addon's blender_manifest.toml"""
+    manifest_path = os.path.join(addon_folder, "blender_manifest.toml")
+    if not os.path.isfile(manifest_path):
+        return []
+    try:
+        import tomllib
+        with open(manifest_path, 'rb') as f:
+            return list(tomllib.load(f).get('build', {}).get('paths_exclude_pattern', []))
+    except ImportError:
+        # Python 3.10 이하: 필요한 항목만 간단히 파싱
+        content = read_utf8(manifest_path)
+        build = re.search(r'^\[build\](.*?)(?=^\[|\Z)', content, re.S | re.M)
+        patterns = build and re.search(r'paths_exclude_pattern\s*=\s*\[(.*?)\]', build.group(1), re.S)
+        return re.findall(r'"([^"]*)"', patterns.group(1)) if patterns else []
+
+def compile_exclude_patterns(patterns):
+    """Build a predicate for gitignore-style exclude patterns
+
+    "name/" matches directories only, a leading "/" (or an inner "/") anchors the
+    pattern to the addon root, "*" does not cross "/" and "**" does.
+    """
+    rules = []
+    for pattern in patterns:
+        dir_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+        anchored = pattern.startswith('/') or '/' in pattern.lstrip('/')
+        pattern = pattern.lstrip('/')
+        regex = ''
+        index = 0
+        while index < len(pattern):
+            if pattern.startswith('**', index):
+                regex += '.*'
+                index += 2
+            elif pattern[index] == '*':
+                regex += '[^/]*'
+                index += 1
+            elif pattern[index] == '?':
+                regex += '[^/]'
+                index += 1
+            else:
+                regex += re.escape(pattern[index])
+                index += 1
+        rules.append((re.compile(regex + r'\Z'), dir_only, anchored))
+
+    def is_excluded(rel_path):
+        parts = rel_path.split('/')
+        for regex, dir_only, anchored in rules:
+            # 디렉토리 패턴은 상위 폴더에만, 일반 패턴은 파일 자체에도 적용
+            candidates = range(len(parts) - 1) if dir_only else range(len(parts))
+            for depth in candidates:
+                target = '/'.join(parts[:depth + 1]) if anchored else parts[depth]
+                if regex.match(target):
+                    return True
+        return False
+
+    return is_excluded
+
+def get_release_manifest(source_folder):
+    """The source hash manifest minus files excluded by blender_manifest.toml"""
+    manifest, _, _ = update_hash_manifest(source_folder)
+    is_excluded = compile_exclude_patterns(load_build_excludes(source_folder))
+    return {rel_path: entry for rel_path, entry in manifest.items() if not is_excluded(rel_path)}
+
+def load_addon_utility(name):
+    """Load a stdlib-only module from the addon's utils folder without importing the addon"""
+    path = os.path.join(PROJECT_ROOT, ADDON_NAME, "utils", f"{name}.py")
+    spec = importlib.util.spec_from_file_location(f"_{ADDON_NAME}_utils_{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def get_release_config(source_folder):
+    """The addon's config.py with DEV_MODE switched off for release builds"""
+    content = read_utf8(os.path.join(source_folder, "config.py"))
+    content, count = re.subn(r'^DEV_MODE\s*=\s*\w+', 'DEV_MODE = False', content, count=1, flags=re.M)
+    if not count:
+        raise ValueError("DEV_MODE assignment not found in config.py")
+    return content
+
+def check_release_registration(generated):
+    """Make sure a release build registers from the precomputed manifest
+
+    ModuleManager only reads registration_manifest.json when DEV_MODE is off, so
+    the packaged config.py must say so and the manifest must list the classes.
+    """
+    class_scan = load_addon_utility("class_scan")
+    dev_mode = None
+    for node in ast.parse(generated["config.py"]).body:
+        if isinstance(node, ast.Assign) and any(getattr(target, 'id', None) == "DEV_MODE" for target in node.targets):
+            dev_mode = ast.literal_eval(node.value)
+    if dev_mode is not False:
+        raise ValueError(f"Release config.py has DEV_MODE = {dev_mode!r}, the registration manifest would be ignored")
+    manifest = json.loads(generated[class_scan.REGISTRATION_MANIFEST_FILENAME])
+    if not manifest["classes"]:
+        raise ValueError("Registration manifest lists no classes")
+    print(f"Release registers from {class_scan.REGISTRATION_MANIFEST_FILENAME}: "
+          f"{len(manifest['classes'])} classes, {len(manifest['properties'])} properties")
+
+def get_generated_release_files(source_folder, manifest):
+    """Files computed at release time from the released sources, as {relative path: text}"""
+    discovery = load_addon_utility("discovery")
+    class_scan = load_addon_utility("class_scan")
+    # 릴리스에서는 패키지 스캔 없이 미리 계산된 인덱스를 사용 (mtime 제외로 재현 가능)
+    index = discovery.DiscoveryIndex.from_files(manifest, source_folder, ADDON_NAME)
+    metadata = class_scan.scan_modules(index.iter_files())
+    generated = {
+        "config.py": get_release_config(source_folder),
+        discovery.INDEX_FILENAME: json.dumps(index.to_dict(with_mtimes=False), indent=2, sort_keys=True),
+        class_scan.METADATA_FILENAME: json.dumps(class_scan.to_dict(metadata), indent=2, sort_keys=True),
+        class_scan.REGISTRATION_MANIFEST_FILENAME: json.dumps(class_scan.build_registration_manifest(metadata),
+                                                             indent=2, sort_keys=True),
+    }
+    check_release_registration(generated)
+    return generated
+
+def _stage_generated_files(generated):
+    """Store generated files by digest so they can be zipped like sources: {relative path: (path, digest)}"""
+    staged = {}
+    for rel_path, content in generated.items():
+        content = content.encode('utf-8')
+        digest = hashlib.md5(content).hexdigest()
+        path = os.path.join(RELEASE_CACHE_DIR, "generated", digest)
+        if not os.path.isfile(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(f"{path}.tmp", 'wb') as f:
+                f.write(content)
+            os.replace(f"{path}.tmp", path)
+        staged[rel_path] = (path, digest)
+    return staged
+
+def write_generated_files(target_folder, generated):
+    """Write generated release files into an installed folder"""
+    for rel_path, content in generated.items():
+        write_utf8_atomic(os.path.join(target_folder, rel_path), content)
+
+def zip_folder(source_folder, output_name, is_extension=False):
+    """Zip a folder for distribution (reproducible, cached by content)
+
+    Entries are streamed straight from source_folder; files excluded by
+    blender_manifest.toml are skipped, so no staging copy is needed. The cache
+    is keyed on the source manifest alone: generated files are derived from
+    the sources, so they are only computed when the zip has to be written.
+    """
+    manifest = get_release_manifest(source_folder)
+    # For addon, include the folder name
+    arc_prefix = "" if is_extension else os.path.basename(os.path.normpath(source_folder)) + "/"
     
-    output_filename = f"{output_name}.zip"
-    output_path = os.path.join(RELEASE_DIR, output_filename)
-    
-    with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, _, files in os.walk(source_folder):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arcname = os.path.relpath(file_path, source_folder)
-                if not is_extension:
-                    # For addon, include the folder name
-                    arcname = os.path.join(os.path.basename(source_folder), arcname)
-                zipf.write(file_path, arcname)
+    artifact_path = get_cached_release(manifest, arc_prefix)
+    if artifact_path:
+        print("Release inputs unchanged, reusing cached zip")
+    else:
+        artifact_path = os.path.join(RELEASE_CACHE_DIR, "artifacts", f"{get_release_key(manifest, arc_prefix)}.zip")
+        sources = {rel_path: (os.path.join(source_folder, rel_path), entry[2]) for rel_path, entry in manifest.items()}
+        sources.update(_stage_generated_files(get_generated_release_files(source_folder, manifest)))
+        files = [(arc_prefix + rel_path, path, digest) for rel_path, (path, digest) in sources.items()]
+        write_deterministic_zip(artifact_path, files)
+        _prune_release_cache()
     
+    output_path = _publish_release_zip(artifact_path, output_name)
     print(f"Saved zip file to: {output_path}")
     return output_path
 
+def install_release_folder(source_folder, target_folder):
+    """Sync the released files and the generated release files into target_folder"""
+    manifest = get_release_manifest(source_folder)
+    generated = get_generated_release_files(source_folder, manifest)
+    is_excluded = compile_exclude_patterns(load_build_excludes(source_folder))
+    # 생성 파일(릴리스용 config.py 포함)은 소스 대신 아래에서 기록
+    sync_folder(source_folder, target_folder, preserve=tuple(generated),
+                exclude=lambda rel_path: rel_path in generated or is_excluded(rel_path))
+    write_generated_files(target_folder, generated)
+
+def install_extension(source_folder):
+    """Sync a release into the Blender extension folder"""
+    if not os.path.exists(BLENDER_EXTENSION_PATH):
+        return
+    print(f"Copying extension to: {BLENDER_EXTENSION_PATH}")
+    try:
+        install_release_folder(source_folder, os.path.join(BLENDER_EXTENSION_PATH, ADDON_NAME))
+    except Exception as e:
+        print(f"Error copying to extension directory: {e}")
+
 def release_addon(need_zip=True, with_timestamp=False, with_version=False, is_extension=None):
     """Release the addon as a zip file or folder"""
     # Use provided is_extension value or default to DIST_AS_EXTENSION
@@ -355,36 +1864,9 @@ def release_addon(need_zip=True, with_timestamp=False, with_version=False, is_ex
     if not os.path.exists(RELEASE_DIR):
         os.makedirs(RELEASE_DIR, exist_ok=True)
     
-    # 임시 폴더 생성
-    if not os.path.exists(TEST_RELEASE_DIR):
-        os.makedirs(TEST_RELEASE_DIR, exist_ok=True)
-    
-    # Prepare temporary folder for release
-    release_folder = os.path.join(TEST_RELEASE_DIR, ADDON_NAME)
-    
-    # 안전하게 기존 폴더 삭제
-    if os.path.exists(release_folder):
-        if not remove_folder_safely(release_folder):
-            print("Warning: Could not remove existing folder. Will try to continue...")
-    
     # 소스 애드온 경로
     source_addon_path = os.path.join(PROJECT_ROOT, ADDON_NAME)
     
-    # 폴더 복사
-    try:
-        shutil.copytree(source_addon_path, release_folder)
-    except Exception as e:
-        print(f"Error copying addon files: {e}")
-        # 다른 방식으로 시도
-        os.makedirs(release_folder, exist_ok=True)
-        for item in os.listdir(source_addon_path):
-            s = os.path.join(source_addon_path, item)
-            d = os.path.join(release_folder, item)
-            if os.path.isdir(s):
-                shutil.copytree(s, d, dirs_exist_ok=True)
-            else:
-                shutil.copy2(s, d)
-    
     # Read bl_info for version info if needed
     bl_info = None
     init_file = os.path.join(source_addon_path, "__init__.py")
@@ -404,47 +1886,28 @@ def release_addon(need_zip=True, with_timestamp=False, with_version=False, is_ex
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         zip_name = f"{zip_name}_{timestamp}"
     
-    # Create zip file if needed
+    # Create zip file if needed (소스에서 바로 스트리밍, 캐시 재사용)
     if need_zip:
-        zip_path = zip_folder(release_folder, zip_name, is_extension)
+        zip_path = zip_folder(source_addon_path, zip_name, is_extension)
         print(f"Addon released: {zip_path}")
         
         # Extension mode: 배포를 위해 확장 디렉토리에 복사
-        if is_extension and os.path.exists(BLENDER_EXTENSION_PATH):
-            print(f"Copying extension to: {BLENDER_EXTENSION_PATH}")
-            ext_folder = os.path.join(BLENDER_EXTENSION_PATH, ADDON_NAME)
-            if os.path.exists(ext_folder):
-                remove_folder_safely(ext_folder)
-            
-            try:
-                shutil.copytree(release_folder, ext_folder)
-            except Exception as e:
-                print(f"Error copying to extension directory: {e}")
+        if is_extension:
+            install_extension(source_addon_path)
             
         return zip_path
     
-    # If no zip needed, copy to final location
+    # If no zip needed, sync to final location
     final_folder = os.path.join(RELEASE_DIR, ADDON_NAME)
-    if os.path.exists(final_folder):
-        remove_folder_safely(final_folder)
-    
     try:
-        shutil.copytree(release_folder, final_folder)
+        install_release_folder(source_addon_path, final_folder)
     except Exception as e:
         print(f"Error copying to release directory: {e}")
     
     print(f"Addon released to folder: {final_folder}")
     
     # Extension mode: 배포를 위해 확장 디렉토리에 복사
-    if is_extension and os.path.exists(BLENDER_EXTENSION_PATH):
-        print(f"Copying extension to: {BLENDER_EXTENSION_PATH}")
-        ext_folder = os.path.join(BLENDER_EXTENSION_PATH, ADDON_NAME)
-        if os.path.exists(ext_folder):
-            remove_folder_safely(ext_folder)
-        
-        try:
-            shutil.copytree(release_folder, ext_folder)
-        except Exception as e:
-            print(f"Error copying to extension directory: {e}")
+    if is_extension:
+        install_extension(source_addon_path)
         
     return final_folder
\ No newline at end of file
@@ -18,7 +18,7 @@ bl_info = {
 from .utils.module_manager import ModuleManager
 
 # 패키지 목록
-packages = ["operators", "panels", "preferences", "utils"]
+packages = ["geometry", "operators", "panels", "preferences", "utils"]
 
 # 모듈 관리자 초기화
 manager = ModuleManager(__package__, packages)
@@ -1,6 +1,8 @@
 # 애드온 전역 설정 - 애드온 자체의 기본 설정 정보
 ADDON_ID = "irkebim"  # 애드온 ID (환경 설정에서 사용)
 DEV_MODE = True       # 개발 모드 (자동 리로드 활성화)
+LAZY_LOADING = False  # 오퍼레이터/패널을 셸로 먼저 등록하고 첫 실행 시 임포트
+WARM_IMPORTS = ("numpy",)  # 지연 로딩 시 시작 후 백그라운드에서 미리 임포트할 무거운 의존성
 
 # 버전 정보 - __init__.py 및 blender_manifest.toml과 동일하게 유지
 __version__ = (1, 0, 0)
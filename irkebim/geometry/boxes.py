@@ -0,0 +1,122 @@
+# irkebim/geometry/boxes.py
+# 박스(큐브) 요소 일괄 생성 - 중심/크기 배열에서 정점과 면을 벡터 연산으로 계산
+import csv
+import json
+import os
+import bpy
+import numpy as np
+from typing import List, Optional, Tuple
+
+from ..utils.logger import get_logger, span
+from . import mesh_cache, mesh_writer
+
+log = get_logger(__name__)
+
+# 단위 박스의 꼭짓점 (-0.5 ~ 0.5)
+UNIT_BOX_VERTICES = np.array([
+    (-0.5, -0.5, -0.5), (0.5, -0.5, -0.5), (0.5, 0.5, -0.5), (-0.5, 0.5, -0.5),
+    (-0.5, -0.5, 0.5), (0.5, -0.5, 0.5), (0.5, 0.5, 0.5), (-0.5, 0.5, 0.5),
+], dtype=np.float32)
+
+# 바깥을 향하는 사각형 면 6개 (꼭짓점 인덱스)
+UNIT_BOX_FACES = np.array([
+    (0, 3, 2, 1),  # 아래
+    (4, 5, 6, 7),  # 위
+    (0, 1, 5, 4),  # 앞
+    (1, 2, 6, 5),  # 오른쪽
+    (2, 3, 7, 6),  # 뒤
+    (3, 0, 4, 7),  # 왼쪽
+], dtype=np.int32)
+
+def box_vertices(centers: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+    """중심 (N, 3)과 크기 (N,) 또는 (N, 3)으로 (N * 8, 3) 정점 계산"""
+    centers = np.asarray(centers, dtype=np.float32).reshape(-1, 3)
+    sizes = np.asarray(sizes, dtype=np.float32)
+    sizes = np.broadcast_to(sizes.reshape(-1, 1) if sizes.ndim <= 1 else sizes, centers.shape)
+    return (UNIT_BOX_VERTICES[None, :, :] * sizes[:, None, :] + centers[:, None, :]).reshape(-1, 3)
+
+def box_faces(count: int) -> np.ndarray:
+    """박스 count개의 (count * 6, 4) 면 인덱스"""
+    offsets = np.arange(count, dtype=np.int32) * len(UNIT_BOX_VERTICES)
+    return (UNIT_BOX_FACES[None, :, :] + offsets[:, None, None]).reshape(-1, 4)
+
+def cube_geometry(params: dict):
+    """공유 메쉬용 원점 중심 박스 (params: size 또는 [sx, sy, sz])"""
+    return box_vertices(np.zeros((1, 3), dtype=np.float32), [params["size"]]), box_faces(1)
+
+mesh_cache.register_builder("cube", cube_geometry)
+
+def grid_centers(counts: Tuple[int, int, int], spacing: float,
+                 origin: Tuple[float, float, float] = (0.0, 0.0, 0.0)) -> np.ndarray:
+    """X, Y, Z 방향 개수와 간격으로 격자 중심점 (X가 가장 빠르게 변함)"""
+    count_x, count_y, count_z = counts
+    z, y, x = np.meshgrid(np.arange(count_z), np.arange(count_y), np.arange(count_x), indexing="ij")
+    centers = np.stack((x.ravel(), y.ravel(), z.ravel()), axis=1).astype(np.float32) * spacing
+    return centers + np.asarray(origin, dtype=np.float32)
+
+def _size_from_record(record: dict, default_size: float):
+    if "size" in record:
+        return record["size"]
+    if "sx" in record:
+        return [record["sx"], record.get("sy", record["sx"]), record.get("sz", record["sx"])]
+    return default_size
+
+def load_spec(file_path: str, default_size: float = 1.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """CSV/JSON 명세에서 (중심 (N, 3), 크기 (N, 3), 요소 ID (N,)) 읽기
+
+    CSV: x, y, z 열과 size 또는 sx, sy, sz 열, 선택적으로 id 열
+    JSON: [{"center": [x, y, z], "size": s 또는 [sx, sy, sz], "id": n}, ...]
+          또는 {"elements": [...]}
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    with open(file_path, "r", encoding="utf-8", newline="") as f:
+        if extension == ".json":
+            data = json.load(f)
+            records = data["elements"] if isinstance(data, dict) else data
+            centers = [record["center"] for record in records]
+        elif extension == ".csv":
+            records = [{key.strip().lower(): float(value) for key, value in row.items() if value not in (None, "")}
+                       for row in csv.DictReader(f)]
+            centers = [(record["x"], record["y"], record["z"]) for record in records]
+        else:
+            raise ValueError(f"Unsupported element spec format: {extension}")
+
+    count = len(records)
+    sizes = np.empty((count, 3), dtype=np.float32)
+    for index, record in enumerate(records):
+        sizes[index] = _size_from_record(record, default_size)
+    if all("id" in record for record in records):
+        element_ids = np.array([record["id"] for record in records], dtype=np.int32)
+    else:
+        element_ids = np.arange(count, dtype=np.int32)
+    return np.asarray(centers, dtype=np.float32).reshape(-1, 3), sizes, element_ids
+
+@span("boxes.build_boxes")
+def build_boxes(centers: np.ndarray, sizes: np.ndarray, element_ids: Optional[np.ndarray] = None,
+                name: str = "Boxes", chunk_size: int = mesh_writer.DEFAULT_CHUNK_SIZE,
+                collection: Optional[bpy.types.Collection] = None) -> List[bpy.types.Object]:
+    """박스 요소를 chunk_size개씩 묶어 메쉬 오브젝트로 생성
+
+    각 면에는 요소 ID가 element_id 면 속성으로 저장됩니다.
+    """
+    centers = np.asarray(centers, dtype=np.float32).reshape(-1, 3)
+    count = len(centers)
+    sizes = np.broadcast_to(np.asarray(sizes, dtype=np.float32).reshape(-1, 1)
+                            if np.ndim(sizes) <= 1 else np.asarray(sizes, dtype=np.float32), (count, 3))
+    if element_ids is None:
+        element_ids = np.arange(count, dtype=np.int32)
+
+    objects = []
+    faces_per_box = len(UNIT_BOX_FACES)
+    for chunk in mesh_writer.iter_chunks(count, chunk_size):
+        chunk_count = chunk.stop - chunk.start
+        face_ids = np.repeat(np.asarray(element_ids[chunk], dtype=np.int32), faces_per_box)
+        objects.append(mesh_writer.new_mesh_object(
+            name,
+            box_vertices(centers[chunk], sizes[chunk]),
+            box_faces(chunk_count),
+            face_attributes={mesh_writer.ELEMENT_ID_ATTRIBUTE: face_ids},
+            collection=collection,
+        ))
+    log.debug("Built %s boxes in %s meshes", count, len(objects))
+    return objects
@@ -0,0 +1,325 @@
+# irkebim/geometry/element_graph.py
+# 매개변수 요소 그래프 - 생성한 오브젝트마다 매개변수와 의존 입력을 ID 속성에 기록하고
+# 입력(씬 속성, 층, 다른 요소)이 바뀌면 그 입력에 의존하는 요소만 더럽혀 타이머에서 모아 다시 만듭니다.
+# 입력 키 형식: "scene:<씬 속성 이름>", "storey:<컬렉션 uid>", "object:<오브젝트 uid>"
+# 층과 요소는 이름 대신 ID 속성에 기록한 uid로 구분하므로 이름을 바꿔도 의존 관계가 유지됩니다.
+#   element_graph.register_type("cube", resolve_cube, rebuild_cube)
+#   element_graph.register_element(obj, "cube", inputs=["scene:cube_custom_size"])
+#   element_graph.mark_input_dirty("scene:cube_custom_size")  # 다음 타이머 틱에 해당 요소만 갱신
+import json
+import time
+import uuid
+import bpy
+from bpy.app.handlers import persistent
+from collections import defaultdict, namedtuple
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+
+from ..preferences import linked_props
+from ..utils import handlers
+from ..utils.logger import get_logger, span
+from . import mesh_cache
+
+log = get_logger(__name__)
+
+# 오브젝트에 저장하는 요소 기록 ID 속성
+# {"type": 요소 종류, "params": 고정 매개변수 JSON, "inputs": 입력 키 목록 JSON, "resolved": 마지막으로 만든 매개변수 JSON}
+# (ID 속성은 문자열 목록을 저장할 수 없으므로 JSON 문자열로 저장)
+ELEMENT_KEY = "irkebim_element"
+
+# 층 컬렉션과 요소 오브젝트에 기록하는 고유 ID (이름이 바뀌어도 유지)
+UID_KEY = "irkebim_uid"
+
+SCENE_INPUT = "scene:"
+STOREY_INPUT = "storey:"
+OBJECT_INPUT = "object:"
+
+# 연속 변경을 모으는 시간과 한 틱에서 다시 만드는 최대 시간 (초) - 남은 요소는 다음 틱
+REBUILD_INTERVAL = 0.05
+REBUILD_BUDGET = 0.05
+
+# resolve(obj, record) -> 현재 입력으로 정한 매개변수 dict, rebuild(obj, params) -> 형상 갱신
+ElementType = namedtuple("ElementType", "resolve rebuild")
+
+_types: Dict[str, ElementType] = {}
+_dependents: Dict[str, Set[str]] = defaultdict(set)  # 입력 키: 의존하는 요소 uid
+_element_inputs: Dict[str, tuple] = {}  # 요소 uid: 입력 키
+_dirty: Dict[str, None] = {}  # 다시 만들 요소 uid (더럽혀진 순서 유지)
+_indexed_state = None  # 색인을 마지막으로 맞춘 시점의 (파일 경로, 오브젝트 수)
+
+# uid로 ID 찾기
+class _UidLookup:
+    """uid -> 이름 캐시 (이름이 바뀌었거나 캐시에 없는 uid를 찾을 때만 전체를 다시 읽음)"""
+
+    def __init__(self, attribute: str):
+        self.attribute = attribute  # bpy.data의 컬렉션 이름 (objects, collections)
+        self.names: Dict[str, str] = {}
+        self.scanned = None  # 마지막으로 전체를 읽었을 때의 개수
+
+    def _data(self):
+        return getattr(bpy.data, self.attribute)
+
+    def add(self, id_data):
+        self.names[id_data[UID_KEY]] = id_data.name
+
+    def find(self, uid: str):
+        data = self._data()
+        name = self.names.get(uid)
+        if name is not None:
+            id_data = data.get(name)
+            if id_data is not None and id_data.get(UID_KEY) == uid:
+                return id_data
+        elif self.scanned == len(data):
+            return None  # 마지막으로 읽은 뒤 추가/삭제가 없으면 없는 uid
+        self.scan()
+        name = self.names.get(uid)
+        return data.get(name) if name is not None else None
+
+    def scan(self):
+        data = self._data()
+        self.names = {}
+        for id_data in data:
+            uid = id_data.get(UID_KEY)
+            if uid:
+                self.names.setdefault(uid, id_data.name)
+        self.scanned = len(data)
+
+    def clear(self):
+        self.names.clear()
+        self.scanned = None
+
+_objects = _UidLookup("objects")
+_collections = _UidLookup("collections")
+
+def ensure_uid(id_data) -> str:
+    """ID의 uid (없으면 새로 기록)"""
+    uid = id_data.get(UID_KEY)
+    if not uid:
+        uid = uuid.uuid4().hex
+        id_data[UID_KEY] = uid
+    return uid
+
+def storey_input(collection: bpy.types.Collection) -> str:
+    """층 컬렉션 입력 키"""
+    uid = ensure_uid(collection)
+    _collections.add(collection)
+    return STOREY_INPUT + uid
+
+def object_input(obj: bpy.types.Object) -> str:
+    """다른 요소 오브젝트 입력 키"""
+    uid = ensure_uid(obj)
+    _objects.add(obj)
+    return OBJECT_INPUT + uid
+
+def find_object(uid: str) -> Optional[bpy.types.Object]:
+    return _objects.find(uid)
+
+def register_type(element_type: str, resolve: Callable, rebuild: Callable):
+    """요소 종류 등록"""
+    _types[element_type] = ElementType(resolve, rebuild)
+
+def get_record(obj: bpy.types.Object) -> Optional[Dict[str, Any]]:
+    """요소 기록 (요소가 아니면 None)"""
+    record = obj.get(ELEMENT_KEY)
+    if not record:
+        return None
+    return {
+        "type": record["type"],
+        "params": json.loads(record["params"]),
+        "inputs": json.loads(record["inputs"]),
+        "resolved": record.get("resolved", ""),
+    }
+
+def _write_record(obj: bpy.types.Object, record: Dict[str, Any]):
+    obj[ELEMENT_KEY] = {
+        "type": record["type"],
+        "params": json.dumps(record["params"], sort_keys=True),
+        "inputs": json.dumps(list(record["inputs"])),
+        "resolved": record["resolved"],
+    }
+
+def scene_of(obj: bpy.types.Object) -> bpy.types.Scene:
+    """요소가 속한 씬 (씬 입력 값을 읽을 씬)"""
+    scenes = obj.users_scene
+    return scenes[0] if scenes else bpy.context.scene
+
+def get_storey(collection: Optional[bpy.types.Collection]) -> Optional[bpy.types.Collection]:
+    """층으로 지정된 컬렉션이면 그대로, 아니면 None"""
+    return collection if collection is not None and getattr(collection, "is_storey", False) else None
+
+def storey_of(record: Dict[str, Any]) -> Optional[bpy.types.Collection]:
+    """요소가 의존하는 층 컬렉션"""
+    for key in record["inputs"]:
+        if key.startswith(STOREY_INPUT):
+            return get_storey(_collections.find(key[len(STOREY_INPUT):]))
+    return None
+
+# 의존 색인
+def _link(uid: str, inputs: Iterable[str]):
+    _unlink(uid)
+    inputs = tuple(inputs)
+    _element_inputs[uid] = inputs
+    for key in inputs:
+        _dependents[key].add(uid)
+
+def _unlink(uid: str):
+    for key in _element_inputs.pop(uid, ()):
+        _dependents[key].discard(uid)
+
+def rebuild_index():
+    """bpy.data.objects의 요소 기록으로 의존 색인 재구성 (파일 로드 후 또는 오브젝트가 추가/삭제된 경우)
+
+    복제(Shift+D)된 요소는 원본의 uid까지 복사되므로 이름 순으로 먼저 나온 것만 uid를 유지하고
+    나머지에는 새 uid를 기록합니다. 복제된 요소도 같은 입력을 따라 다시 만들어집니다.
+    """
+    _dependents.clear()
+    _element_inputs.clear()
+    _objects.names = {}
+    for obj in bpy.data.objects:
+        record = obj.get(ELEMENT_KEY)
+        uid = obj.get(UID_KEY)
+        if uid and uid in _objects.names:
+            del obj[UID_KEY]
+            uid = None
+        if record:
+            uid = ensure_uid(obj)
+            _link(uid, json.loads(record["inputs"]))
+        if uid:
+            _objects.add(obj)
+    _objects.scanned = len(bpy.data.objects)
+    _collections.scan()
+    _mark_indexed()
+
+def _mark_indexed():
+    global _indexed_state
+    _indexed_state = (bpy.data.filepath, len(bpy.data.objects))
+
+def _ensure_index():
+    if _indexed_state != (bpy.data.filepath, len(bpy.data.objects)):
+        rebuild_index()
+
+def register_element(obj: bpy.types.Object, element_type: str, params: Optional[Dict[str, Any]] = None,
+                     inputs: Iterable[str] = (), depends: Iterable[bpy.types.Object] = ()):
+    """생성한 오브젝트를 요소로 기록 (현재 형상은 지금 입력으로 만들어졌다고 봄)
+
+    params: 입력과 관계없이 고정하는 매개변수, inputs: 의존 입력 키, depends: 의존하는 다른 요소
+    """
+    if element_type not in _types:
+        raise KeyError(f"Unknown element type: {element_type}")
+    inputs = list(inputs) + [object_input(other) for other in depends]
+    record = {"type": element_type, "params": dict(params or {}), "inputs": inputs, "resolved": ""}
+    record["resolved"] = mesh_cache.normalize_params(_types[element_type].resolve(obj, record))
+    _write_record(obj, record)
+    # 색인이 이 오브젝트 생성 직전까지 맞았다면 전체를 다시 읽지 않고 이어서 추가
+    fresh = _indexed_state == (bpy.data.filepath, len(bpy.data.objects) - 1)
+    uid = ensure_uid(obj)
+    _objects.add(obj)
+    _link(uid, inputs)
+    if fresh:
+        _mark_indexed()
+
+def set_params(obj: bpy.types.Object, **params):
+    """요소의 고정 매개변수 변경 (None이면 고정 해제) 후 다시 만들기 예약"""
+    record = get_record(obj)
+    for name, value in params.items():
+        if value is None:
+            record["params"].pop(name, None)
+        else:
+            record["params"][name] = value
+    _write_record(obj, record)
+    mark_element_dirty(obj)
+
+# 더럽히기 / 예약
+def mark_input_dirty(key: str) -> int:
+    """입력에 의존하는 요소를 더럽히고 다시 만들기 예약, 더럽힌 요소 수 반환"""
+    _ensure_index()
+    uids = _dependents.get(key, ())
+    for uid in uids:
+        _dirty[uid] = None
+    if uids:
+        schedule()
+    return len(uids)
+
+def mark_element_dirty(obj: bpy.types.Object):
+    _dirty[ensure_uid(obj)] = None
+    schedule()
+
+def schedule():
+    if not bpy.app.timers.is_registered(_rebuild_tick):
+        bpy.app.timers.register(_rebuild_tick, first_interval=REBUILD_INTERVAL)
+
+def pending_count() -> int:
+    return len(_dirty)
+
+@span("element_graph.rebuild_dirty")
+def rebuild_dirty(budget: Optional[float] = None) -> int:
+    """더럽혀진 요소를 다시 만들기 (budget 초를 넘기면 멈춤), 실제로 다시 만든 수 반환
+
+    입력으로 정한 매개변수가 마지막으로 만든 값과 같으면 건너뛰고, 다시 만든 요소에
+    의존하는 요소는 뒤에 이어서 처리합니다. 다시 만들다 실패한 요소는 기록만 하고 제외합니다.
+    """
+    started = time.perf_counter()
+    rebuilt = skipped = failed = 0
+    while _dirty:
+        if budget is not None and time.perf_counter() - started > budget:
+            break
+        uid = next(iter(_dirty))
+        del _dirty[uid]
+        obj = _objects.find(uid)
+        record = get_record(obj) if obj is not None else None
+        element_type = _types.get(record["type"]) if record else None
+        if element_type is None:
+            continue
+        try:
+            params = element_type.resolve(obj, record)
+            resolved = mesh_cache.normalize_params(params)
+            if resolved == record["resolved"]:
+                skipped += 1
+                continue
+            element_type.rebuild(obj, params)
+        except Exception as e:
+            log.exception("Error rebuilding element %s: %s", obj.name, e)
+            failed += 1
+            continue
+        record["resolved"] = resolved
+        _write_record(obj, record)
+        rebuilt += 1
+        for dependent in _dependents.get(OBJECT_INPUT + uid, ()):
+            _dirty[dependent] = None
+    log.debug("Rebuilt %s elements, %s unchanged, %s failed, %s pending", rebuilt, skipped, failed, len(_dirty))
+    return rebuilt
+
+def _rebuild_tick():
+    try:
+        rebuild_dirty(REBUILD_BUDGET)
+    except Exception as e:
+        # 요소별 오류는 rebuild_dirty에서 처리하므로 여기서는 남은 요소를 유지하고 다음 틱에 계속
+        log.exception("Error rebuilding elements: %s", e)
+    return REBUILD_INTERVAL if _dirty else None  # 남은 요소는 다음 틱에
+
+# 핸들러
+def _on_linked_changed(scene_property: str):
+    mark_input_dirty(SCENE_INPUT + scene_property)
+
+@persistent
+def _on_load_post(dummy):
+    global _indexed_state
+    _dirty.clear()
+    _objects.clear()
+    _collections.clear()
+    _indexed_state = None  # 다음 사용 때 새 파일 기준으로 색인
+
+_HANDLERS = (
+    (bpy.app.handlers.load_post, _on_load_post),
+)
+
+def register_handlers():
+    """씬 속성/환경설정 변경 구독과 파일 로드 핸들러 등록"""
+    handlers.register(_HANDLERS)
+    linked_props.add_listener(__name__, _on_linked_changed)
+
+def unregister_handlers():
+    handlers.unregister(_HANDLERS)
+    linked_props.remove_listener(__name__)
+    if bpy.app.timers.is_registered(_rebuild_tick):
+        bpy.app.timers.unregister(_rebuild_tick)
+    _dirty.clear()
@@ -0,0 +1,145 @@
+# irkebim/geometry/mesh_cache.py
+# 매개변수 형상 메쉬 캐시 - 요소 종류와 정규화된 매개변수가 같으면 같은 메쉬를 공유
+# 캐시 키는 메쉬의 ID 속성에 저장되므로 파일을 다시 열거나 실행 취소해도 유지되고,
+# 메모리 색인은 메쉬 이름만 보관합니다 (ID 포인터는 실행 취소 후 무효가 될 수 있음).
+#   mesh = mesh_cache.acquire("cube", {"size": 2.0})
+#   mesh_cache.assign(obj, "cube", {"size": 3.0})  # 이전 메쉬는 사용자가 없으면 삭제
+import json
+import bpy
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..preferences.default_values import DEFAULT_PRECISION
+from ..utils.logger import get_logger, span
+from . import mesh_writer
+
+log = get_logger(__name__)
+
+# 메쉬에 저장하는 캐시 키 ID 속성
+ELEMENT_TYPE_KEY = "irkebim_element_type"
+PARAMS_KEY = "irkebim_params"
+
+_builders: Dict[str, Callable] = {}  # 요소 종류: 매개변수 -> (정점, 면[, 면 크기]) 함수
+_index: Dict[Tuple[str, str], str] = {}  # (요소 종류, 정규화된 매개변수 JSON): 메쉬 이름
+_indexed_state = None  # 색인을 마지막으로 맞춘 시점의 (파일 경로, 메쉬 수) - 다르면 파일 로드나 외부 추가/삭제
+
+def register_builder(element_type: str, builder: Callable):
+    """요소 종류의 형상 생성 함수 등록 (params dict -> (vertices, faces) 또는 (vertices, faces, face_sizes))"""
+    _builders[element_type] = builder
+
+def normalize_params(params: Dict[str, Any], precision: int = DEFAULT_PRECISION) -> str:
+    """실수는 precision 자리로 반올림하고 키 순서를 고정한 JSON 문자열"""
+    def normalize(value):
+        if isinstance(value, float):
+            return round(value, precision) + 0.0  # -0.0 -> 0.0
+        if isinstance(value, (list, tuple)):
+            return [normalize(item) for item in value]
+        return value
+    return json.dumps({key: normalize(value) for key, value in params.items()}, sort_keys=True)
+
+def _mesh_key(mesh: bpy.types.Mesh) -> Optional[Tuple[str, str]]:
+    element_type = mesh.get(ELEMENT_TYPE_KEY)
+    params = mesh.get(PARAMS_KEY)
+    return (element_type, params) if element_type and params else None
+
+def rebuild_index():
+    """bpy.data.meshes의 ID 속성으로 색인 재구성 (파일 로드 후 또는 색인이 어긋난 경우)"""
+    _index.clear()
+    for mesh in bpy.data.meshes:
+        key = _mesh_key(mesh)
+        if key and key not in _index:
+            _index[key] = mesh.name
+    _mark_indexed()
+
+def _mark_indexed():
+    global _indexed_state
+    _indexed_state = (bpy.data.filepath, len(bpy.data.meshes))
+
+def _lookup(key: Tuple[str, str]) -> Optional[bpy.types.Mesh]:
+    name = _index.get(key)
+    mesh = bpy.data.meshes.get(name) if name else None
+    if mesh is not None and _mesh_key(mesh) == key:
+        return mesh
+    if name is None and _indexed_state == (bpy.data.filepath, len(bpy.data.meshes)):
+        return None  # 처음 보는 매개변수
+    # 이름이 바뀌었거나 실행 취소/파일 로드로 색인이 어긋난 경우
+    rebuild_index()
+    name = _index.get(key)
+    return bpy.data.meshes.get(name) if name else None
+
+def _set_key(mesh: bpy.types.Mesh, key: Tuple[str, str]):
+    mesh[ELEMENT_TYPE_KEY], mesh[PARAMS_KEY] = key
+    _index[key] = mesh.name
+    _mark_indexed()
+
+def _build(mesh: bpy.types.Mesh, element_type: str, params_json: str):
+    builder = _builders.get(element_type)
+    if builder is None:
+        raise KeyError(f"No geometry builder registered for element type: {element_type}")
+    mesh_writer.write_mesh(mesh, *builder(json.loads(params_json)))
+
+def acquire(element_type: str, params: Dict[str, Any]) -> bpy.types.Mesh:
+    """매개변수에 맞는 공유 메쉬 (없으면 생성)"""
+    key = (element_type, normalize_params(params))
+    mesh = _lookup(key)
+    if mesh is None:
+        mesh = bpy.data.meshes.new(element_type.title())
+        _build(mesh, *key)
+        _set_key(mesh, key)
+        log.debug("Mesh cache: built %s for %s %s", mesh.name, *key)
+    return mesh
+
+def release(mesh: Optional[bpy.types.Mesh]) -> bool:
+    """더 이상 사용자가 없는 캐시 메쉬 삭제 (삭제했으면 True)"""
+    if mesh is None or mesh.users > 0 or _mesh_key(mesh) is None:
+        return False
+    _index.pop(_mesh_key(mesh), None)
+    bpy.data.meshes.remove(mesh)
+    _mark_indexed()
+    return True
+
+def assign(obj: bpy.types.Object, element_type: str, params: Dict[str, Any]) -> bpy.types.Mesh:
+    """오브젝트가 매개변수에 맞는 공유 메쉬를 사용하도록 변경"""
+    previous = obj.data
+    mesh = acquire(element_type, params)
+    if previous is not mesh:
+        obj.data = mesh
+        release(previous)
+    return mesh
+
+def get_params(mesh: bpy.types.Mesh) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """캐시 메쉬의 (요소 종류, 매개변수), 캐시 메쉬가 아니면 None"""
+    key = _mesh_key(mesh)
+    return (key[0], json.loads(key[1])) if key else None
+
+@span("mesh_cache.update_params")
+def update_params(mesh: bpy.types.Mesh, params: Dict[str, Any]) -> bpy.types.Mesh:
+    """공유 메쉬의 매개변수 변경 - 모든 사용자에게 한 번에 반영
+
+    같은 매개변수의 메쉬가 이미 있으면 사용자를 그 메쉬로 옮기고 이 메쉬는 삭제하며,
+    없으면 이 메쉬의 형상을 제자리에서 다시 만듭니다.
+    """
+    element_type, _ = _mesh_key(mesh)
+    key = (element_type, normalize_params(params))
+    if _mesh_key(mesh) == key:
+        return mesh
+    existing = _lookup(key)
+    _index.pop(_mesh_key(mesh), None)
+    if existing is not None:
+        mesh.user_remap(existing)
+        release(mesh)
+        return existing
+
+    mesh.clear_geometry()
+    _build(mesh, *key)
+    _set_key(mesh, key)
+    return mesh
+
+@span("mesh_cache.cleanup_orphans")
+def cleanup_orphans() -> int:
+    """사용자가 없는 캐시 메쉬 모두 삭제, 삭제한 수 반환"""
+    orphans = [mesh for mesh in bpy.data.meshes if mesh.users == 0 and _mesh_key(mesh)]
+    for mesh in orphans:
+        release(mesh)
+    if orphans:
+        log.debug("Mesh cache: removed %s orphan meshes", len(orphans))
+    return len(orphans)
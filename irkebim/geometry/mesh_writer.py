@@ -0,0 +1,143 @@
+# irkebim/geometry/mesh_writer.py
+# NumPy 배열로 만든 형상을 foreach_set으로 메쉬에 한 번에 기록
+# 오퍼레이터 호출(bpy.ops) 없이 메쉬를 만들므로 요소 수천 개도 한 번의 갱신으로 처리됩니다.
+import bpy
+import numpy as np
+from typing import Dict, Iterable, List, Optional
+
+from ..utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# 한 메쉬에 넣을 최대 요소 수 (너무 큰 메쉬는 편집/선택이 느려짐)
+DEFAULT_CHUNK_SIZE = 10000
+
+# 요소 ID를 저장하는 면 속성 이름
+ELEMENT_ID_ATTRIBUTE = "element_id"
+
+# 바뀐 정점이 이보다 적으면 정점별로, 많으면 좌표 배열 전체를 foreach_set으로 기록
+ITEM_WRITE_LIMIT = 256
+
+_ATTRIBUTE_TYPES = {
+    np.dtype(np.int32): ("INT", "value"),
+    np.dtype(np.float32): ("FLOAT", "value"),
+    np.dtype(np.bool_): ("BOOLEAN", "value"),
+}
+
+def write_mesh(mesh: bpy.types.Mesh, vertices: np.ndarray, faces: np.ndarray,
+               face_sizes: Optional[np.ndarray] = None,
+               face_attributes: Optional[Dict[str, np.ndarray]] = None) -> bpy.types.Mesh:
+    """빈 메쉬에 정점/면/면 속성 기록
+
+    vertices: (N, 3) 좌표
+    faces: 면마다 꼭짓점 수가 같으면 (F, k) 배열, 다르면 1차원 정점 인덱스 배열과 face_sizes
+    face_attributes: {속성 이름: (F,) 배열} - int32/float32/bool 면 속성으로 저장
+    """
+    vertices = np.ascontiguousarray(vertices, dtype=np.float32).reshape(-1, 3)
+    if face_sizes is None:
+        faces = np.asarray(faces, dtype=np.int32)
+        if faces.ndim != 2:
+            raise ValueError("face_sizes is required for a flat face index array")
+        face_sizes = np.full(len(faces), faces.shape[1], dtype=np.int32)
+    face_sizes = np.asarray(face_sizes, dtype=np.int32)
+    loops = np.ascontiguousarray(faces, dtype=np.int32).ravel()
+    loop_starts = np.zeros(len(face_sizes), dtype=np.int32)
+    if len(face_sizes) > 1:
+        np.cumsum(face_sizes[:-1], out=loop_starts[1:])
+
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set("co", vertices.ravel())
+    mesh.loops.add(len(loops))
+    mesh.loops.foreach_set("vertex_index", loops)
+    mesh.polygons.add(len(face_sizes))
+    # Blender 4.x는 loop_start만으로 면 크기를 계산
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+
+    for name, values in (face_attributes or {}).items():
+        set_face_attribute(mesh, name, values)
+
+    mesh.update(calc_edges=True)
+    return mesh
+
+def has_faces(mesh: bpy.types.Mesh, vertex_count: int, faces: np.ndarray) -> bool:
+    """메쉬의 정점 수와 면(꼭짓점 수가 같은 (F, k) 배열)이 그대로인지"""
+    faces = np.asarray(faces, dtype=np.int32)
+    if faces.ndim != 2 or len(mesh.vertices) != vertex_count or len(mesh.polygons) != len(faces) or \
+            len(mesh.loops) != faces.size:
+        return False
+    loop_starts = np.empty(len(faces), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    if not np.array_equal(loop_starts, np.arange(len(faces), dtype=np.int32) * faces.shape[1]):
+        return False
+    loops = np.empty(faces.size, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loops)
+    return np.array_equal(loops, faces.ravel())
+
+def update_vertices(mesh: bpy.types.Mesh, vertices: np.ndarray) -> int:
+    """위상이 같은 메쉬에서 좌표가 달라진 정점만 기록, 기록한 정점 수 반환
+
+    foreach_set에는 범위 기록이 없으므로 바뀐 정점이 ITEM_WRITE_LIMIT보다 많으면 배열 전체를 기록합니다.
+    """
+    vertices = np.ascontiguousarray(vertices, dtype=np.float32).reshape(-1, 3)
+    current = np.empty(vertices.size, dtype=np.float32)
+    mesh.vertices.foreach_get("co", current)
+    changed = np.flatnonzero(np.any(current.reshape(-1, 3) != vertices, axis=1))
+    if len(changed) > ITEM_WRITE_LIMIT:
+        mesh.vertices.foreach_set("co", vertices.ravel())
+    else:
+        mesh_vertices = mesh.vertices
+        for index, co in zip(changed.tolist(), vertices[changed].tolist()):
+            mesh_vertices[index].co = co
+    return len(changed)
+
+def set_face_attribute(mesh: bpy.types.Mesh, name: str, values: np.ndarray):
+    """면 속성 생성(이미 있으면 덮어씀) 후 값 기록"""
+    values = np.asarray(values)
+    if values.dtype not in _ATTRIBUTE_TYPES:
+        values = values.astype(np.int32 if np.issubdtype(values.dtype, np.integer) else np.float32)
+    attribute_type, field = _ATTRIBUTE_TYPES[values.dtype]
+    attribute = mesh.attributes.get(name)
+    if attribute is not None and (attribute.domain != 'FACE' or attribute.data_type != attribute_type):
+        mesh.attributes.remove(attribute)
+        attribute = None
+    if attribute is None:
+        attribute = mesh.attributes.new(name, attribute_type, 'FACE')
+    attribute.data.foreach_set(field, np.ascontiguousarray(values).ravel())
+
+def get_face_attribute(mesh: bpy.types.Mesh, name: str, dtype=np.int32) -> Optional[np.ndarray]:
+    """면 속성 값을 배열로 읽기 (없으면 None)"""
+    attribute = mesh.attributes.get(name)
+    if attribute is None:
+        return None
+    values = np.empty(len(attribute.data), dtype=dtype)
+    attribute.data.foreach_get("value", values)
+    return values
+
+def iter_chunks(count: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterable[slice]:
+    """요소 count개를 chunk_size개씩 나누는 슬라이스"""
+    chunk_size = max(1, chunk_size)
+    for start in range(0, count, chunk_size):
+        yield slice(start, min(start + chunk_size, count))
+
+def create_object(name: str, mesh: bpy.types.Mesh,
+                  collection: Optional[bpy.types.Collection] = None) -> bpy.types.Object:
+    """메쉬 오브젝트를 만들어 컬렉션(기본: 현재 씬 컬렉션)에 연결"""
+    obj = bpy.data.objects.new(name, mesh)
+    (collection or bpy.context.scene.collection).objects.link(obj)
+    return obj
+
+def new_mesh_object(name: str, vertices: np.ndarray, faces: np.ndarray,
+                    face_sizes: Optional[np.ndarray] = None,
+                    face_attributes: Optional[Dict[str, np.ndarray]] = None,
+                    collection: Optional[bpy.types.Collection] = None) -> bpy.types.Object:
+    mesh = write_mesh(bpy.data.meshes.new(name), vertices, faces, face_sizes, face_attributes)
+    return create_object(name, mesh, collection)
+
+def select_only(context: bpy.types.Context, objects: List[bpy.types.Object]):
+    """새로 만든 오브젝트만 선택하고 마지막 오브젝트를 활성화"""
+    for obj in context.selected_objects:
+        obj.select_set(False)
+    for obj in objects:
+        obj.select_set(True)
+    if objects:
+        context.view_layer.objects.active = objects[-1]
@@ -0,0 +1,204 @@
+# irkebim/geometry/openings.py
+# 개구부(문/창)가 뚫린 벽체 메쉬를 불리언 없이 직접 구성
+# 벽체 양쪽 면을 개구부 경계(벽체 축 방향 위치, 높이)로 나눈 격자로 만들고
+# 개구부 칸을 뺀 뒤 옆면(jamb), 아랫면(sill), 윗면(head)을 이어 붙입니다.
+#   openings = np.array([(1.0, 0.9, 0.0, 2.1), (3.0, 1.2, 0.9, 2.1)])  # (위치, 폭, 하단, 상단)
+#   vertices, faces, opening_ids = wall_with_openings(corners, start, direction, 2.4, 0.0, openings)
+import numpy as np
+from typing import Dict, Hashable, Iterable, Optional, Tuple
+
+from ..utils.logger import get_logger, span
+from . import boxes, walls
+
+log = get_logger(__name__)
+
+# 이보다 좁거나 낮은 개구부는 무시
+MIN_OPENING_SIZE = 1e-4
+
+def resolve_openings(openings: np.ndarray, u_min: float, u_max: float, height: float) -> np.ndarray:
+    """개구부 사각형을 벽체 축 범위와 높이 안으로 자르고 겹치는 개구부 제거
+
+    openings: (K, 4) 벽체 시작점 기준 (위치, 폭, 하단 높이, 상단 높이)
+    반환: (K', 5) (왼쪽 u, 오른쪽 u, 하단, 상단, 원래 순번) - 왼쪽 u 순
+    """
+    openings = np.asarray(openings, dtype=np.float64).reshape(-1, 4)
+    left = np.clip(openings[:, 0], u_min, u_max)
+    right = np.clip(openings[:, 0] + openings[:, 1], u_min, u_max)
+    bottom = np.clip(openings[:, 2], 0.0, height)
+    top = np.clip(openings[:, 3], 0.0, height)
+    resolved = np.stack((left, right, bottom, top, np.arange(len(openings))), axis=1)
+    resolved = resolved[(right - left > MIN_OPENING_SIZE) & (top - bottom > MIN_OPENING_SIZE)]
+    resolved = resolved[np.argsort(resolved[:, 0], kind="stable")]
+
+    # 축 방향으로 겹치면 먼저 놓인 개구부만 유지
+    keep = np.ones(len(resolved), dtype=bool)
+    reach = -np.inf
+    for index, (left_u, right_u) in enumerate(resolved[:, :2].tolist()):
+        if left_u < reach - MIN_OPENING_SIZE:
+            keep[index] = False
+            log.warning("Opening %s overlaps another opening and is skipped", int(resolved[index, 4]))
+        else:
+            reach = right_u
+    return resolved[keep]
+
+def _quads(a, b, c, d) -> np.ndarray:
+    return np.stack(np.broadcast_arrays(a, b, c, d), axis=-1).reshape(-1, 4)
+
+def wall_with_openings(corners: np.ndarray, start: np.ndarray, direction: np.ndarray, height: float,
+                       base_z: float, openings: np.ndarray,
+                       ids: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """개구부가 뚫린 벽체 선분 하나 (정점 (V, 3), 사각형 면 (F, 4), 면별 개구부 ID (벽체 면은 -1))
+
+    corners: segment_corners의 바닥 꼭짓점 (4, 2) - 시작-오른쪽, 끝-오른쪽, 끝-왼쪽, 시작-왼쪽
+    start, direction: 개구부 위치의 기준이 되는 중심선 시작점과 단위 방향
+    ids: 개구부별 ID (없으면 openings의 순번)
+    """
+    start_right, end_right, end_left, start_left = np.asarray(corners, dtype=np.float64)
+    direction = np.asarray(direction, dtype=np.float64)
+    u_right = np.dot(np.stack((start_right, end_right)) - start, direction)
+    u_left = np.dot(np.stack((start_left, end_left)) - start, direction)
+    ids = np.arange(len(np.reshape(openings, (-1, 4)))) if ids is None else np.asarray(ids)
+    resolved = resolve_openings(openings, max(u_right[0], u_left[0]), min(u_right[1], u_left[1]), height)
+
+    # 양쪽 면 공통 격자: 축 방향은 개구부 좌우 경계, 높이 방향은 하단/상단 경계
+    inner_u = np.unique(resolved[:, :2])
+    right_u = np.r_[u_right[0], inner_u, u_right[1]]
+    left_u = np.r_[u_left[0], inner_u, u_left[1]]
+    # 끝에 붙은(잘린) 개구부나 맞닿은 개구부로 생기는 폭 0 칸 제거 (양쪽 면 모두 폭이 0인 경우)
+    wide = (np.diff(right_u) > MIN_OPENING_SIZE) | (np.diff(left_u) > MIN_OPENING_SIZE)
+    keep = np.r_[True, wide[:-1], True]
+    if not wide[-1] and keep[1:-1].any():
+        keep[np.flatnonzero(keep[:-1])[-1]] = False
+    right_u, left_u = right_u[keep], left_u[keep]
+    heights = np.unique(np.r_[0.0, height, resolved[:, 2:4].ravel()])
+    nu, nv = len(right_u), len(heights)
+
+    vertices = np.empty((2, nu, nv, 3))
+    vertices[0, :, :, :2] = (start_right + np.outer(right_u - u_right[0], direction))[:, None, :]
+    vertices[1, :, :, :2] = (start_left + np.outer(left_u - u_left[0], direction))[:, None, :]
+    vertices[..., 2] = base_z + heights
+    # 마이터 끝에 붙은 개구부는 한쪽 면에서만 폭이 0인 칸을 남기며 그 칸은 쐐기 모양 벽체가 됨
+    index = np.arange(2 * nu * nv).reshape(2, nu, nv)
+    right, left = index[0], index[1]
+
+    # 칸 중심이 개구부 안이면 구멍 (정리된 개구부는 축 방향으로 겹치지 않으므로 칸마다 후보는 하나)
+    centers_u = (right_u[:-1] + right_u[1:] + left_u[:-1] + left_u[1:]) * 0.25
+    centers_v = (heights[:-1] + heights[1:]) * 0.5
+    cell_ids = np.full((nu - 1, nv - 1), -1, dtype=np.int32)  # 칸별 개구부 ID (벽체는 -1)
+    if len(resolved):
+        owner = np.maximum(np.searchsorted(resolved[:, 0], centers_u, side="right") - 1, 0)
+        bounds = resolved[owner]
+        hole = ((bounds[:, 0] <= centers_u) & (centers_u <= bounds[:, 1]))[:, None] & \
+               (bounds[:, 2:3] <= centers_v) & (centers_v <= bounds[:, 3:4])
+        opening_ids = ids[bounds[:, 4].astype(np.int64)].astype(np.int32)
+        cell_ids[hole] = np.broadcast_to(opening_ids[:, None], hole.shape)[hole]
+    solid = cell_ids < 0
+    i, j = np.nonzero(solid)
+
+    faces = [
+        _quads(right[i, j], right[i + 1, j], right[i + 1, j + 1], right[i, j + 1]),  # 오른쪽 면 (-n)
+        _quads(left[i, j], left[i, j + 1], left[i + 1, j + 1], left[i + 1, j]),  # 왼쪽 면 (+n)
+    ]
+    face_openings = [np.full(len(i) * 2, -1, dtype=np.int32)]
+
+    # 나머지 면은 벽체 칸과 빈 칸(개구부 또는 벽체 밖)의 경계마다 - 끝면/jamb, 바닥/윗면/sill/head
+    # 개구부가 벽체 끝에 붙으면 그쪽은 끝면도 jamb도 없이 열림
+    padded_solid = np.pad(solid, ((1, 1), (0, 0)))
+    padded_ids = np.pad(cell_ids, ((1, 1), (0, 0)), constant_values=-1)
+    columns, rows = np.nonzero(padded_solid[:-1] & ~padded_solid[1:])  # 벽체 -> 빈 칸 (+d)
+    faces.append(_quads(right[columns, rows], left[columns, rows], left[columns, rows + 1],
+                        right[columns, rows + 1]))
+    face_openings.append(padded_ids[columns + 1, rows])
+    columns, rows = np.nonzero(~padded_solid[:-1] & padded_solid[1:])  # 빈 칸 -> 벽체 (-d)
+    faces.append(_quads(right[columns, rows], right[columns, rows + 1], left[columns, rows + 1],
+                        left[columns, rows]))
+    face_openings.append(padded_ids[columns, rows])
+
+    padded_solid = np.pad(solid, ((0, 0), (1, 1)))
+    padded_ids = np.pad(cell_ids, ((0, 0), (1, 1)), constant_values=-1)
+    columns, rows = np.nonzero(padded_solid[:, :-1] & ~padded_solid[:, 1:])  # 벽체 아래, 빈 칸 위 (+z)
+    faces.append(_quads(right[columns, rows], right[columns + 1, rows], left[columns + 1, rows],
+                        left[columns, rows]))
+    face_openings.append(padded_ids[columns, rows + 1])
+    columns, rows = np.nonzero(~padded_solid[:, :-1] & padded_solid[:, 1:])  # 빈 칸 아래, 벽체 위 (-z)
+    faces.append(_quads(right[columns, rows], left[columns, rows], left[columns + 1, rows],
+                        right[columns + 1, rows]))
+    face_openings.append(padded_ids[columns, rows])
+
+    faces = np.concatenate(faces)
+    # 큰 개구부 안쪽에 남는 격자 정점 제거
+    used, faces = np.unique(faces, return_inverse=True)
+    return (vertices.reshape(-1, 3)[used].astype(np.float32), faces.reshape(-1, 4).astype(np.int32),
+            np.concatenate(face_openings))
+
+class WallMeshCache:
+    """벽체 선분별 메쉬 배열 캐시 - 입력(꼭짓점, 개구부 등)이 바뀐 선분만 다시 계산"""
+
+    def __init__(self):
+        self._entries: Dict[Hashable, tuple] = {}  # 키: (지문, 정점, 면, 면별 개구부 ID)
+        self.rebuilt = 0  # 마지막 build_wall_arrays에서 다시 계산한 선분 수
+
+    @staticmethod
+    def _fingerprint(*arrays) -> bytes:
+        return b"".join(np.ascontiguousarray(np.round(np.asarray(array, dtype=np.float64), 9)).tobytes()
+                        for array in arrays)
+
+    def update(self, key: Hashable, corners, start, direction, height, base_z, openings, ids) -> tuple:
+        fingerprint = self._fingerprint(corners, start, direction, (height, base_z), openings, ids)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != fingerprint:
+            entry = (fingerprint,) + wall_with_openings(corners, start, direction, height, base_z, openings, ids)
+            self._entries[key] = entry
+            self.rebuilt += 1
+        return entry[1:]
+
+    def prune(self, keys: Iterable[Hashable]):
+        """keys에 없는 선분 항목 삭제"""
+        keys = set(keys)
+        for key in [key for key in self._entries if key not in keys]:
+            del self._entries[key]
+
+@span("openings.build_wall_arrays")
+def build_wall_arrays(points: np.ndarray, edges: np.ndarray, thickness, height, base_z,
+                      edge_walls: np.ndarray, edge_openings: Dict[int, Tuple[np.ndarray, np.ndarray]],
+                      cache: Optional[WallMeshCache] = None):
+    """벽체 그래프 전체의 메쉬 배열 (정점, 면, 면별 벽체 ID, 면별 개구부 ID)
+
+    개구부가 없는 선분은 walls와 같은 박스 배치로 한 번에 만들고, edge_openings
+    {선분 순번: (개구부 ID (K,), 선분 시작점 기준 개구부 (K, 4))}가 있는 선분만
+    선분별로(캐시 사용) 만듭니다.
+    """
+    points = np.asarray(points, dtype=np.float64)[:, :2]
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    edge_walls = np.asarray(edge_walls, dtype=np.int32)
+    count = len(edges)
+    thickness = np.broadcast_to(np.asarray(thickness, dtype=np.float64), (count,))
+    heights = np.broadcast_to(np.asarray(height, dtype=np.float64), (count,))
+    bases = np.broadcast_to(np.asarray(base_z, dtype=np.float64), (count,))
+    corners = walls.segment_corners(points, edges, thickness)
+    cache = cache if cache is not None else WallMeshCache()
+    cache.rebuilt = 0
+
+    with_openings = np.zeros(count, dtype=bool)
+    with_openings[[edge for edge, openings in edge_openings.items() if len(openings[0])]] = True
+    plain = np.flatnonzero(~with_openings)
+    vertices = [walls.extrude_corners(corners[plain], heights[plain], bases[plain])]
+    faces = [boxes.box_faces(len(plain))]
+    face_walls = [np.repeat(edge_walls[plain], walls.FACES_PER_SEGMENT)]
+    face_openings = [np.full(len(faces[0]), -1, dtype=np.int32)]
+
+    offset = len(vertices[0])
+    vectors = points[edges[:, 1]] - points[edges[:, 0]]
+    directions = vectors / np.maximum(np.linalg.norm(vectors, axis=1), 1e-12)[:, None]
+    for edge in np.flatnonzero(with_openings).tolist():
+        edge_vertices, edge_faces, edge_face_openings = cache.update(
+            edge, corners[edge], points[edges[edge, 0]], directions[edge],
+            heights[edge], bases[edge], edge_openings[edge][1], edge_openings[edge][0])
+        vertices.append(edge_vertices)
+        faces.append(edge_faces + offset)
+        face_walls.append(np.full(len(edge_faces), edge_walls[edge], dtype=np.int32))
+        face_openings.append(edge_face_openings)
+        offset += len(edge_vertices)
+    cache.prune(np.flatnonzero(with_openings).tolist())
+    return (np.concatenate(vertices), np.concatenate(faces), np.concatenate(face_walls),
+            np.concatenate(face_openings))
@@ -0,0 +1,282 @@
+# irkebim/geometry/snapping.py
+# 요소 배치용 평면(XY) 스냅 - 요소 정점, 선분 중점, 벽체 중심선, 그리드
+# 오브젝트마다 mathutils KDTree를 만들고 오브젝트 범위(bounding box) 배열로 후보를 먼저 거르므로
+# 마우스 이벤트마다 전체를 다시 만들지 않습니다. depsgraph 갱신으로 바뀐 오브젝트만 더럽혀 두고
+# 다음 질의 때 그 오브젝트의 범위만 다시 구하며, 트리는 오브젝트가 처음 후보가 될 때 만듭니다.
+#   result = snapping.get_index().snap(context.scene, (x, y), radius=0.2, grid_size=1.0)
+#   if result: location = result.location
+import bpy
+import numpy as np
+from collections import namedtuple
+from bpy.app.handlers import persistent
+from mathutils import kdtree
+from typing import Dict, Iterable, Optional, Set
+
+from ..preferences.default_values import DEFAULT_PRECISION
+from ..utils import handlers
+from ..utils.logger import get_logger, span
+from . import mesh_cache, mesh_writer, wall_model
+
+log = get_logger(__name__)
+
+# 스냅 종류 (같은 거리면 앞쪽 우선)
+VERTEX, MIDPOINT, CENTERLINE, GRID = "VERTEX", "MIDPOINT", "CENTERLINE", "GRID"
+
+# 스냅 결과: location (x, y) 평면 좌표, kind 스냅 종류, object_name 대상 오브젝트 (그리드는 None)
+SnapResult = namedtuple("SnapResult", "location kind object_name")
+
+def is_snap_target(obj: bpy.types.Object) -> bool:
+    """스냅 대상인 BIM 요소 (벽체, 캐시 메쉬, element_id 속성이 있는 메쉬)"""
+    if obj.type != 'MESH' or obj.data is None:
+        return False
+    return (wall_model.is_wall_object(obj) or mesh_cache.get_params(obj.data) is not None or
+            mesh_writer.ELEMENT_ID_ATTRIBUTE in obj.data.attributes)
+
+class _ObjectEntry:
+    """오브젝트 하나의 스냅 후보 (월드 좌표 평면)
+
+    색인할 때는 범위만 구하고 KDTree와 벽체 중심선은 처음 후보가 될 때 만듭니다.
+    """
+
+    __slots__ = ("tree", "kinds", "bounds", "segments", "mesh_name", "uid")
+
+    def __init__(self, obj: bpy.types.Object):
+        mesh = obj.data
+        self.mesh_name = mesh.name
+        self.uid = obj.session_uid
+        self.tree = self.kinds = self.segments = None
+        # 벽체 중심선은 벽체 메쉬 안에 있으므로 정점 범위로 충분
+        vertices = self._world_vertices(obj)
+        self.bounds = (np.concatenate((vertices[:, :2].min(axis=0), vertices[:, :2].max(axis=0))) if len(vertices)
+                       else np.full(4, np.nan))
+
+    @staticmethod
+    def _world_vertices(obj: bpy.types.Object) -> np.ndarray:
+        mesh = obj.data
+        matrix = np.array(obj.matrix_world, dtype=np.float64)
+        coordinates = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", coordinates)
+        return coordinates.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+
+    def build(self, obj: bpy.types.Object):
+        """정점/중점 KDTree와 벽체 중심선 만들기"""
+        mesh = obj.data
+        vertices = self._world_vertices(obj)
+        edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", edges)
+        edges = edges.reshape(-1, 2)
+
+        # 벽체 위/아래 정점처럼 평면에서 겹치는 점은 하나만 유지
+        points = np.concatenate((vertices[:, :2], (vertices[edges[:, 0], :2] + vertices[edges[:, 1], :2]) * 0.5))
+        kinds = np.repeat(np.array([VERTEX, MIDPOINT]), (len(vertices), len(edges)))
+        keys = np.ascontiguousarray(np.round(points * 10 ** DEFAULT_PRECISION).astype(np.int64))
+        _, first = np.unique(keys.view(np.dtype((np.void, 16))).ravel(), return_index=True)
+        first.sort()  # 정점이 중점보다 앞에 남도록
+        points, self.kinds = points[first], kinds[first]
+
+        self.tree = kdtree.KDTree(len(points))
+        for index, (x, y) in enumerate(points.tolist()):
+            self.tree.insert((x, y, 0.0), index)
+        self.tree.balance()
+
+        if wall_model.is_wall_object(obj):
+            matrix = np.array(obj.matrix_world, dtype=np.float64)
+            starts, ends = wall_model.get_walls(obj)[:2]
+            self.segments = np.stack((starts, ends), axis=1) @ matrix[:2, :2].T + matrix[:2, 3]
+
+    def nearest_point(self, location) -> tuple:
+        """가장 가까운 정점/중점 (좌표, 종류, 거리)"""
+        co, index, distance = self.tree.find((location[0], location[1], 0.0))
+        if co is None:
+            return None, None, np.inf
+        return (co[0], co[1]), str(self.kinds[index]), distance
+
+    def nearest_centerline(self, location) -> tuple:
+        """가장 가까운 벽체 중심선 위의 점 (좌표, 거리)"""
+        if self.segments is None or not len(self.segments):
+            return None, np.inf
+        starts, vectors = self.segments[:, 0], self.segments[:, 1] - self.segments[:, 0]
+        lengths = np.maximum(np.einsum("ij,ij->i", vectors, vectors), 1e-12)
+        t = np.clip(np.einsum("ij,ij->i", np.asarray(location) - starts, vectors) / lengths, 0.0, 1.0)
+        projected = starts + vectors * t[:, None]
+        distances = np.linalg.norm(projected - location, axis=1)
+        nearest = int(np.argmin(distances))
+        return tuple(projected[nearest].tolist()), float(distances[nearest])
+
+class SnapIndex:
+    """씬의 BIM 요소 스냅 색인 - 바뀐 오브젝트만 다시 만듦"""
+
+    def __init__(self):
+        self.entries: Dict[str, _ObjectEntry] = {}
+        self._uid_names: Dict[int, str] = {}  # 오브젝트 session_uid: 색인한 이름 (이름 변경 확인)
+        self._dirty: Set[str] = set()  # 다시 만들 오브젝트 이름
+        self._dirty_meshes: Set[str] = set()  # 형상이 바뀐 메쉬 이름 (공유 메쉬 사용 오브젝트 모두 갱신)
+        self._membership_dirty = True  # 오브젝트 추가/삭제 확인 필요
+        self._membership = None  # 마지막으로 확인한 씬 오브젝트 이름 목록
+        self._object_count = -1  # 마지막으로 확인한 씬 오브젝트 수
+        self._names: list = []
+        self._bounds = np.zeros((0, 4))
+
+    def clear(self):
+        self.entries.clear()
+        self._uid_names.clear()
+        self._dirty.clear()
+        self._dirty_meshes.clear()
+        self._membership_dirty = True
+        self._membership = None
+        self._object_count = -1
+        self._update_bounds()
+
+    def mark_dirty(self, object_name: str):
+        self._dirty.add(object_name)
+
+    def mark_mesh_dirty(self, mesh_name: str):
+        self._dirty_meshes.add(mesh_name)
+
+    def mark_membership_dirty(self):
+        self._membership_dirty = True
+
+    def check_object_count(self, scene: bpy.types.Scene):
+        """씬 오브젝트 수가 바뀌었으면(추가/삭제) 다음 질의에서 이름 목록 확인"""
+        count = len(scene.objects)
+        if count != self._object_count:
+            self._object_count = count
+            self._membership_dirty = True
+
+    def _update_bounds(self):
+        self._names = list(self.entries)
+        self._bounds = (np.array([self.entries[name].bounds for name in self._names])
+                        if self._names else np.zeros((0, 4)))
+
+    @span("snapping.refresh")
+    def refresh(self, scene: bpy.types.Scene, exclude: Iterable[str] = ()):
+        """더럽혀진 오브젝트만 다시 색인
+
+        exclude의 오브젝트(배치 중 움직이는 요소 등)는 다시 만들지 않고 더럽혀진 채로 둡니다.
+        """
+        exclude = set(exclude)
+        objects = scene.objects
+        # 추가/삭제/이름 변경 표시가 있을 때만 이름 목록(keys는 C에서 만듦)을 비교해 바뀐 경우에 전체 확인
+        # (개수가 같은 삭제+추가, 이름 변경도 목록이 바뀜)
+        scan = False
+        if self._membership_dirty:
+            membership = objects.keys()
+            scan = membership != self._membership
+            self._membership = membership
+            self._object_count = len(membership)
+        self._membership_dirty = False
+        if not (self._dirty - exclude or self._dirty_meshes or scan):
+            return
+        dirty = set(self._dirty)
+        if self._dirty_meshes:
+            dirty.update(name for name, entry in self.entries.items() if entry.mesh_name in self._dirty_meshes)
+            self._dirty_meshes.clear()
+        if scan:
+            present = {obj.name: obj.session_uid for obj in objects if is_snap_target(obj)}
+            for name in set(self.entries) - set(present):
+                del self.entries[name]
+            # 지운 오브젝트와 같은 이름으로 새로 만든 오브젝트
+            dirty.update(name for name, uid in present.items()
+                         if name not in self.entries or self.entries[name].uid != uid)
+
+        rebuilt = 0
+        self._dirty = dirty & exclude
+        for name in dirty - exclude:
+            obj = objects.get(name)
+            if obj is None or not is_snap_target(obj):
+                self.entries.pop(name, None)
+                continue
+            entry = _ObjectEntry(obj)
+            # 이름이 바뀐 오브젝트의 이전 항목 제거
+            stale = self._uid_names.get(entry.uid)
+            if stale is not None and stale != name and stale in self.entries and self.entries[stale].uid == entry.uid:
+                del self.entries[stale]
+            self._uid_names[entry.uid] = name
+            self.entries[name] = entry
+            rebuilt += 1
+        self._update_bounds()
+        log.debug("Snap index: rebuilt %s of %s objects", rebuilt, len(self.entries))
+
+    def candidates(self, location, radius: float, exclude: Iterable[str] = ()) -> list:
+        """범위가 location에서 radius 안에 있는 오브젝트 이름"""
+        if not self._names:
+            return []
+        x, y = location
+        bounds = self._bounds
+        near = ((bounds[:, 0] - radius <= x) & (x <= bounds[:, 2] + radius) &
+                (bounds[:, 1] - radius <= y) & (y <= bounds[:, 3] + radius))
+        exclude = set(exclude)
+        return [self._names[index] for index in np.flatnonzero(near) if self._names[index] not in exclude]
+
+    def snap(self, scene: bpy.types.Scene, location, radius: float, grid_size: Optional[float] = None,
+             exclude: Iterable[str] = ()) -> Optional[SnapResult]:
+        """location (x, y)에서 radius 안의 가장 가까운 스냅 위치
+
+        정점/중점을 먼저 찾고, 없으면 벽체 중심선, 그래도 없으면 grid_size 그리드로 스냅합니다.
+        """
+        self.refresh(scene, exclude)
+        location = (float(location[0]), float(location[1]))
+        best, best_distance = None, radius
+        centerline, centerline_distance = None, radius
+        for name in self.candidates(location, radius, exclude):
+            entry = self.entries[name]
+            if entry.tree is None:
+                obj = scene.objects.get(name)
+                if obj is None:
+                    continue
+                entry.build(obj)
+            point, kind, distance = entry.nearest_point(location)
+            if distance <= best_distance:
+                best, best_distance = SnapResult(point, kind, name), distance
+            if best is None:
+                point, distance = entry.nearest_centerline(location)
+                if distance <= centerline_distance:
+                    centerline, centerline_distance = SnapResult(point, CENTERLINE, name), distance
+        if best is not None:
+            return best
+        if centerline is not None:
+            return centerline
+        if grid_size:
+            snapped = np.round(np.round(np.asarray(location) / grid_size) * grid_size, DEFAULT_PRECISION)
+            return SnapResult(tuple(snapped.tolist()), GRID, None)
+        return None
+
+_index = SnapIndex()
+
+def get_index() -> SnapIndex:
+    return _index
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    # 씬/컬렉션 갱신은 프레임 변경, 속성 변경마다 오므로 오브젝트 추가/삭제는 오브젝트 수로만 확인
+    if depsgraph.id_type_updated('SCENE') or depsgraph.id_type_updated('COLLECTION'):
+        _index.check_object_count(scene)
+    if not depsgraph.id_type_updated('OBJECT') and not depsgraph.id_type_updated('MESH'):
+        return
+    for update in depsgraph.updates:
+        id_data = getattr(update.id, "original", update.id)
+        if isinstance(id_data, bpy.types.Object):
+            if update.is_updated_transform or update.is_updated_geometry:
+                _index.mark_dirty(id_data.name)  # 새로 만든 오브젝트도 여기로 옴
+            else:
+                _index.mark_membership_dirty()  # 변환/형상 변경이 아닌 오브젝트 갱신 (이름 변경 등)
+        elif isinstance(id_data, bpy.types.Mesh):
+            _index.mark_mesh_dirty(id_data.name)
+
+@persistent
+def _on_load_post(dummy):
+    _index.clear()
+
+_HANDLERS = (
+    (bpy.app.handlers.depsgraph_update_post, _on_depsgraph_update),
+    (bpy.app.handlers.load_post, _on_load_post),
+)
+
+def register_handlers():
+    """depsgraph 갱신/파일 로드 핸들러 등록"""
+    handlers.register(_HANDLERS)
+    _index.clear()
+
+def unregister_handlers():
+    handlers.unregister(_HANDLERS)
+    _index.clear()
@@ -0,0 +1,360 @@
+# irkebim/geometry/wall_joins.py
+# 벽체 중심선 교차/연결 해석 - 균일 격자(공간 해시)로 후보를 좁혀 같은 칸에 있는 벽체끼리만 검사
+# 연결 종류:
+#   L: 두 벽체의 끝점이 만남 (일직선 연장 포함) -> 같은 점으로 붙여 마이터 연결
+#   T: 한 벽체(stem)의 끝이 다른 벽체(through)의 중간에 닿음 -> stem을 through의 면까지 줄임
+#   X: 두 벽체가 중간에서 교차 -> 교차점에서 둘 다 나눔
+#   solver = WallJoinSolver()
+#   solver.add_walls(ids, starts, ends, thickness)
+#   points, edges, wall_ids, thickness = solver.to_graph()  # walls.build_walls에 그대로 전달
+#   affected = solver.move_wall(7, (0, 0), (3, 0))  # 7번 벽체와 연결이 바뀐 벽체 ID
+#   graph = solver.patch_graph(graph, affected)  # 바뀐 벽체의 선분만 다시 만듦
+import numpy as np
+from collections import defaultdict, namedtuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..preferences.default_values import DEFAULT_GRID_SIZE
+from ..utils.logger import get_logger, span
+from . import walls
+
+log = get_logger(__name__)
+
+# 끝점이 이 거리 안이면 만나는 것으로 판단
+DEFAULT_TOLERANCE = 1e-4
+
+# kind: "L", "T", "X" / first, second: 벽체 ID (T는 first가 stem) / point: 교차점
+# first_param, second_param: 각 벽체 중심선 위의 위치 (0 = 시작, 1 = 끝)
+Junction = namedtuple("Junction", "kind first second point first_param second_param")
+
+_EPSILON = 1e-12
+
+def classify_pairs(a_starts: np.ndarray, a_ends: np.ndarray, b_starts: np.ndarray, b_ends: np.ndarray,
+                   tolerance: float = DEFAULT_TOLERANCE):
+    """선분 쌍 (N, 2) 배열을 한 번에 분류
+
+    (종류 배열, a의 위치, b의 위치, 교차점) 반환 - 종류는 "", "L", "T"(a가 stem),
+    "t"(b가 stem), "X" 중 하나입니다.
+    """
+    r = a_ends - a_starts
+    s = b_ends - b_starts
+    q = b_starts - a_starts
+    a_lengths = np.maximum(np.linalg.norm(r, axis=1), _EPSILON)
+    b_lengths = np.maximum(np.linalg.norm(s, axis=1), _EPSILON)
+    denominators = walls.cross(r, s)
+    parallel = np.abs(denominators) <= 1e-9 * a_lengths * b_lengths
+    safe = np.where(parallel, 1.0, denominators)
+    t = walls.cross(q, s) / safe
+    u = walls.cross(q, r) / safe
+
+    # 평행한 선분은 끝점끼리 닿는 경우만 (일직선 연장)
+    if parallel.any():
+        for t_value, a_points in ((0.0, a_starts), (1.0, a_ends)):
+            for u_value, b_points in ((0.0, b_starts), (1.0, b_ends)):
+                touching = parallel & (np.linalg.norm(a_points - b_points, axis=1) <= tolerance)
+                t[touching], u[touching] = t_value, u_value
+                parallel &= ~touching
+        t[parallel] = u[parallel] = np.nan
+
+    t_tolerance = tolerance / a_lengths
+    u_tolerance = tolerance / b_lengths
+    hit = ((t >= -t_tolerance) & (t <= 1.0 + t_tolerance) &
+           (u >= -u_tolerance) & (u <= 1.0 + u_tolerance))
+    a_end = (t <= t_tolerance) | (t >= 1.0 - t_tolerance)
+    b_end = (u <= u_tolerance) | (u >= 1.0 - u_tolerance)
+
+    kinds = np.full(len(r), "", dtype="<U1")
+    kinds[hit & a_end & b_end] = "L"
+    kinds[hit & a_end & ~b_end] = "T"
+    kinds[hit & ~a_end & b_end] = "t"
+    kinds[hit & ~a_end & ~b_end] = "X"
+    t = np.clip(np.nan_to_num(t), 0.0, 1.0)
+    u = np.clip(np.nan_to_num(u), 0.0, 1.0)
+    # 끝점 연결은 끝점 위치를 정확히 0 또는 1로
+    t = np.where(a_end, np.round(t), t)
+    u = np.where(b_end, np.round(u), u)
+    return kinds, t, u, a_starts + t[:, None] * r
+
+class WallJoinSolver:
+    """벽체 중심선을 균일 격자 칸에 나누어 담고 연결(L/T/X)을 유지하는 해석기
+
+    격자 칸 크기는 DEFAULT_GRID_SIZE이며, 벽체를 옮기면 그 벽체가 지나는 칸의
+    후보만 다시 검사합니다.
+    """
+
+    def __init__(self, cell_size: Optional[float] = None, tolerance: float = DEFAULT_TOLERANCE):
+        self.cell_size = cell_size or DEFAULT_GRID_SIZE
+        self.tolerance = tolerance
+        self.walls: Dict[int, Tuple[np.ndarray, np.ndarray, float]] = {}  # ID: (시작, 끝, 두께)
+        self.junctions: Dict[Tuple[int, int], Junction] = {}  # (작은 ID, 큰 ID): 연결
+        self._cells: Dict[Tuple[int, int], Set[int]] = defaultdict(set)  # 격자 칸: 벽체 ID
+        self._wall_cells: Dict[int, List[Tuple[int, int]]] = {}
+        self._wall_junctions: Dict[int, Set[Tuple[int, int]]] = defaultdict(set)
+
+    # 격자
+    def _cell_range(self, start: np.ndarray, end: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        low = np.floor((np.minimum(start, end) - self.tolerance) / self.cell_size).astype(np.int64)
+        high = np.floor((np.maximum(start, end) + self.tolerance) / self.cell_size).astype(np.int64)
+        return low, high
+
+    def _insert(self, wall_id: int, start: np.ndarray, end: np.ndarray):
+        _, cells = self._cells_of(start[None], end[None])
+        cells = list(map(tuple, cells.tolist()))
+        for cell in cells:
+            self._cells[cell].add(wall_id)
+        self._wall_cells[wall_id] = cells
+
+    def _remove(self, wall_id: int):
+        for cell in self._wall_cells.pop(wall_id, ()):
+            members = self._cells[cell]
+            members.discard(wall_id)
+            if not members:
+                del self._cells[cell]
+
+    def candidates(self, wall_id: int) -> Set[int]:
+        """같은 칸을 공유하는 다른 벽체"""
+        found = set()
+        for cell in self._wall_cells.get(wall_id, ()):
+            found.update(self._cells[cell])
+        found.discard(wall_id)
+        return found
+
+    # 연결
+    def _add_pairs(self, pairs: np.ndarray):
+        """벽체 ID 쌍 (N, 2)을 한 번에 검사하여 연결 기록"""
+        if not len(pairs):
+            return
+        first = [self.walls[a] for a in pairs[:, 0].tolist()]
+        second = [self.walls[b] for b in pairs[:, 1].tolist()]
+        self._add_junctions(pairs, np.array([wall[0] for wall in first]), np.array([wall[1] for wall in first]),
+                            np.array([wall[0] for wall in second]), np.array([wall[1] for wall in second]))
+
+    def _add_junctions(self, pairs: np.ndarray, a_starts: np.ndarray, a_ends: np.ndarray,
+                       b_starts: np.ndarray, b_ends: np.ndarray):
+        if not len(pairs):
+            return
+        kinds, t, u, points = classify_pairs(a_starts, a_ends, b_starts, b_ends, self.tolerance)
+        for index in np.flatnonzero(kinds != "").tolist():
+            a, b = int(pairs[index, 0]), int(pairs[index, 1])
+            kind = str(kinds[index])
+            if kind == "t":  # b가 stem
+                junction = Junction("T", b, a, points[index], float(u[index]), float(t[index]))
+            else:
+                junction = Junction(kind, a, b, points[index], float(t[index]), float(u[index]))
+            key = (min(a, b), max(a, b))
+            self.junctions[key] = junction
+            self._wall_junctions[a].add(key)
+            self._wall_junctions[b].add(key)
+
+    def _drop_junctions(self, wall_id: int) -> Set[int]:
+        partners = set()
+        for key in self._wall_junctions.pop(wall_id, set()):
+            self.junctions.pop(key, None)
+            other = key[0] if key[1] == wall_id else key[1]
+            partners.add(other)
+            self._wall_junctions[other].discard(key)
+        return partners
+
+    def _cells_of(self, starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """벽체마다 경계 상자가 걸치는 격자 칸 (항목별 벽체 위치, 칸 좌표 (M, 2))"""
+        low, high = self._cell_range(starts, ends)
+        spans = high - low + 1
+        counts = spans[:, 0] * spans[:, 1]
+        owners = np.repeat(np.arange(len(starts)), counts)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        cells = low[owners] + np.stack((local // spans[owners, 1], local % spans[owners, 1]), axis=1)
+        return owners, cells
+
+    @span("wall_joins.add_walls")
+    def add_walls(self, ids: Iterable[int], starts: np.ndarray, ends: np.ndarray, thickness) -> int:
+        """여러 벽체를 한 번에 추가하고 격자 칸을 공유하는 쌍만 검사, 검사한 쌍 수 반환"""
+        ids = np.fromiter((int(wall_id) for wall_id in ids), dtype=np.int64)
+        starts = np.asarray(starts, dtype=np.float64)[:, :2]
+        ends = np.asarray(ends, dtype=np.float64)[:, :2]
+        thickness = np.broadcast_to(np.asarray(thickness, dtype=np.float64), (len(ids),))
+        for wall_id in ids.tolist():
+            if wall_id in self.walls:
+                self._remove(wall_id)
+                self._drop_junctions(wall_id)
+        had_walls = bool(self.walls)
+        for index, wall_id in enumerate(ids.tolist()):
+            self.walls[wall_id] = (starts[index], ends[index], float(thickness[index]))
+
+        # 칸 색인 갱신
+        owners, cells = self._cells_of(starts, ends)
+        owner_ids = ids[owners].tolist()
+        cell_keys = list(map(tuple, cells.tolist()))
+        old_members = set()
+        for wall_id, cell in zip(owner_ids, cell_keys):
+            members = self._cells[cell]
+            if had_walls:
+                old_members.update((wall_id, other) for other in members)
+            members.add(wall_id)
+            self._wall_cells.setdefault(wall_id, []).append(cell)
+
+        # 새 벽체끼리: 칸 번호로 정렬하면 같은 칸의 항목이 이웃 -> 같은 칸 안의 모든 쌍
+        order = np.lexsort((cells[:, 1], cells[:, 0]))
+        sorted_cells = cells[order]
+        boundaries = np.flatnonzero(np.any(sorted_cells[1:] != sorted_cells[:-1], axis=1)) + 1
+        group_ends = np.repeat(np.r_[boundaries, len(order)], np.diff(np.r_[0, boundaries, len(order)]))
+        partners = group_ends - np.arange(len(order)) - 1
+        first = np.repeat(np.arange(len(order)), partners)
+        second = first + 1 + np.arange(partners.sum()) - np.repeat(np.cumsum(partners) - partners, partners)
+        pairs = np.sort(np.stack((owners[order][first], owners[order][second]), axis=1), axis=1)
+        pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+        pair_keys = np.unique(pairs[:, 0] * len(ids) + pairs[:, 1])
+        pairs = np.stack((pair_keys // len(ids), pair_keys % len(ids)), axis=1)
+        self._add_junctions(ids[pairs], starts[pairs[:, 0]], ends[pairs[:, 0]],
+                            starts[pairs[:, 1]], ends[pairs[:, 1]])
+        checked = len(pairs)
+
+        # 기존 벽체와의 쌍
+        new_ids = set(ids.tolist())
+        old_pairs = np.array(sorted((wall_id, other) for wall_id, other in old_members if other not in new_ids),
+                             dtype=np.int64).reshape(-1, 2)
+        if len(old_pairs):
+            self._add_pairs(old_pairs)
+            checked += len(old_pairs)
+        log.debug("Wall joins: %s walls, %s candidate pairs, %s junctions",
+                  len(self.walls), checked, len(self.junctions))
+        return checked
+
+    def move_wall(self, wall_id: int, start, end, thickness: Optional[float] = None) -> Set[int]:
+        """벽체 하나를 옮기고 그 벽체만 다시 검사, 연결이 바뀐 벽체 ID(자신 포함) 반환"""
+        previous = self.walls.get(wall_id)
+        if thickness is None:
+            thickness = previous[2] if previous else 0.0
+        affected = self._drop_junctions(wall_id) if previous else set()
+        self._remove(wall_id)
+        self.walls[wall_id] = (np.asarray(start, dtype=np.float64)[:2], np.asarray(end, dtype=np.float64)[:2],
+                               float(thickness))
+        self._insert(wall_id, *self.walls[wall_id][:2])
+        others = sorted(self.candidates(wall_id))
+        self._add_pairs(np.array([(wall_id, other) for other in others], dtype=np.int64).reshape(-1, 2))
+        for key in self._wall_junctions.get(wall_id, ()):
+            affected.update(key)
+        affected.add(wall_id)
+        return affected
+
+    def remove_wall(self, wall_id: int) -> Set[int]:
+        """벽체 제거, 연결되어 있던 벽체 ID 반환"""
+        affected = self._drop_junctions(wall_id)
+        self._remove(wall_id)
+        self.walls.pop(wall_id, None)
+        return affected
+
+    def junctions_of(self, wall_id: int) -> List[Junction]:
+        return [self.junctions[key] for key in self._wall_junctions.get(wall_id, ())]
+
+    # 메쉬 생성용 그래프
+    @span("wall_joins.to_graph")
+    def to_graph(self, wall_ids: Optional[Iterable[int]] = None):
+        """연결을 반영한 중심선 그래프 (점 (P, 2), 선분 (E, 2), 선분별 벽체 ID, 선분별 두께)
+
+        L 연결은 같은 점을 공유하고(마이터), T의 stem은 through 면에서 끝나며,
+        X는 교차점에서 두 벽체가 모두 나뉩니다.
+        """
+        wall_ids = sorted(self.walls) if wall_ids is None else sorted(wall_ids)
+        if not wall_ids:
+            return np.zeros((0, 2)), np.zeros((0, 2), dtype=np.int64), np.zeros(0, dtype=np.int32), np.zeros(0)
+        position = {wall_id: index for index, wall_id in enumerate(wall_ids)}
+        records = [self.walls[wall_id] for wall_id in wall_ids]
+        starts = np.array([record[0] for record in records])
+        ends = np.array([record[1] for record in records])
+        thickness = np.array([record[2] for record in records])
+        endpoints = np.stack((starts, ends), axis=1)  # (N, 2 끝, xy)
+
+        stems, splits = [], defaultdict(list)
+        for junction in self.junctions.values():
+            if junction.first not in position or junction.second not in position:
+                continue
+            if junction.kind == "L":
+                # 두 끝점을 정확히 같은 점으로
+                endpoints[position[junction.second], int(junction.second_param)] = junction.point
+                endpoints[position[junction.first], int(junction.first_param)] = junction.point
+            elif junction.kind == "T":
+                stems.append((position[junction.first], int(junction.first_param), position[junction.second]))
+            else:
+                splits[position[junction.first]].append(junction.first_param)
+                splits[position[junction.second]].append(junction.second_param)
+
+        vectors = ends - starts
+        lengths = np.linalg.norm(vectors, axis=1)
+        directions = vectors / np.maximum(lengths, _EPSILON)[:, None]
+        if stems:
+            # stem 끝을 through 면까지 줄임 (L 연결보다 우선): 중심선에서 면까지 = (두께 / 2) / sin(사잇각)
+            stem, end, through = np.array(stems).T
+            sine = np.abs(walls.cross(directions[stem], directions[through]))
+            trim = np.minimum(thickness[through] * 0.5 / np.maximum(sine, 1e-3), lengths[stem] * 0.5)
+            # 한 끝이 여러 벽체에 닿으면 가장 많이 줄이는 값 사용
+            trim_by_end = np.zeros((len(wall_ids), 2))
+            np.maximum.at(trim_by_end, (stem, end), trim)
+            sign = np.where(end == 0, 1.0, -1.0)
+            origin = np.where(end[:, None] == 0, starts[stem], ends[stem])
+            endpoints[stem, end] = origin + (sign * trim_by_end[stem, end])[:, None] * directions[stem]
+
+        points = [endpoints.reshape(-1, 2)]
+        edges = [np.arange(len(wall_ids) * 2).reshape(-1, 2)]
+        edge_walls = [np.asarray(wall_ids)]
+        edge_thickness = [thickness]
+        if splits:
+            # 교차하는 벽체는 교차점에서 나눔
+            split_rows = sorted(splits)
+            edges[0] = np.delete(edges[0], split_rows, axis=0)
+            edge_walls[0] = np.delete(edge_walls[0], split_rows)
+            edge_thickness[0] = np.delete(edge_thickness[0], split_rows)
+            offset = len(points[0])
+            for row in split_rows:
+                params = np.unique([param for param in splits[row] if 0.0 < param < 1.0])
+                inner = starts[row] + vectors[row] * params[:, None]
+                wall_points = np.concatenate((endpoints[row, :1], inner, endpoints[row, 1:]))
+                count = len(wall_points)
+                points.append(wall_points)
+                edges.append(offset + np.stack((np.arange(count - 1), np.arange(1, count)), axis=1))
+                edge_walls.append(np.full(count - 1, wall_ids[row]))
+                edge_thickness.append(np.full(count - 1, thickness[row]))
+                offset += count
+
+        points, edges = np.concatenate(points), np.concatenate(edges)
+        # 길이 0 선분은 weld_points에서 제거되므로 남은 선분의 속성만 유지
+        kept = _distinct_ends(points, edges, self.tolerance)
+        welded_points, welded_edges = walls.weld_points(points, edges, self.tolerance)
+        return (welded_points, welded_edges, np.concatenate(edge_walls).astype(np.int32)[kept],
+                np.concatenate(edge_thickness)[kept])
+
+    @span("wall_joins.patch_graph")
+    def patch_graph(self, graph: tuple, wall_ids: Iterable[int]):
+        """to_graph 결과에서 wall_ids 벽체의 선분만 다시 만들어 바꾼 그래프
+
+        wall_ids에는 연결이 바뀐 벽체(move_wall/remove_wall이 돌려준 ID)와 제거한 벽체를
+        모두 넣어야 합니다. 다시 만드는 벽체의 연결 상대도 함께 계산하지만 선분은 wall_ids의
+        것만 바꾸고, 나머지 선분은 이전 그래프의 것을 그대로 씁니다.
+        """
+        points, edges, edge_walls, edge_thickness = graph
+        wall_ids = set(wall_ids)
+        present = sorted(wall_id for wall_id in wall_ids if wall_id in self.walls)
+        context = set(present)
+        for wall_id in present:
+            for key in self._wall_junctions.get(wall_id, ()):
+                context.update(key)
+        new_points, new_edges, new_walls, new_thickness = self.to_graph(context)
+        replaced = np.isin(new_walls, present)
+        kept = ~np.isin(edge_walls, sorted(wall_ids))
+
+        points = np.concatenate((points, new_points))
+        edges = np.concatenate((edges[kept], new_edges[replaced] + len(graph[0])))
+        edge_walls = np.concatenate((edge_walls[kept], new_walls[replaced]))
+        edge_thickness = np.concatenate((edge_thickness[kept], new_thickness[replaced]))
+        # 벽체 ID 순으로 정렬해 바뀌지 않은 선분의 순번(메쉬 캐시 키)을 최대한 유지
+        order = np.argsort(edge_walls, kind="stable")
+        edges, edge_walls, edge_thickness = edges[order], edge_walls[order], edge_thickness[order]
+        distinct = _distinct_ends(points, edges, self.tolerance)
+        points, edges = walls.weld_points(points, edges, self.tolerance)
+        # 이전 그래프에서 더 이상 쓰지 않는 점 제거
+        used, edges = np.unique(edges.ravel(), return_inverse=True)
+        return (points[used], edges.reshape(-1, 2), edge_walls[distinct].astype(np.int32),
+                edge_thickness[distinct])
+
+def _distinct_ends(points: np.ndarray, edges: np.ndarray, tolerance: float) -> np.ndarray:
+    """weld_points와 같은 기준으로 길이 0이 되지 않는 선분"""
+    keys = np.round(points / tolerance).astype(np.int64)
+    return np.any(keys[edges[:, 0]] != keys[edges[:, 1]], axis=1)
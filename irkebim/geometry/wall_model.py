@@ -0,0 +1,231 @@
+# irkebim/geometry/wall_model.py
+# 벽체 오브젝트의 정의(중심선, 두께, 높이, 개구부)를 ID 속성에 저장하고 메쉬를 다시 만듦
+# 오브젝트마다 연결 해석 결과와 선분별 메쉬 배열을 캐시하므로 개구부 하나를 옮기면
+# 개구부 배열은 그 개구부가 있는 선분만 다시 계산합니다. 메쉬의 면(위상)이 그대로면(개구부나
+# 벽체 끝점 이동 등) 좌표가 바뀐 정점과 바뀐 면 속성만 기록하고, 위상이 바뀌면 전체를 다시 씁니다.
+# 선분 꼭짓점(segment_corners)과 배열 조립은 오브젝트 전체 대상이라 그 비용은 선분 수에 비례합니다.
+# 캐시는 파일 로드 시 비우고, 새 오브젝트의 캐시를 만들 때 삭제된 오브젝트의 항목을 정리합니다.
+#   obj = wall_model.create_wall_object("Walls", starts, ends, 0.2, 2.4)
+#   index = wall_model.add_opening(obj, wall_id=0, offset=1.0, width=0.9, sill=0.0, head=2.1)
+#   wall_model.update_opening(obj, index, offset=2.0)
+#   wall_model.regenerate(obj)
+import bpy
+import numpy as np
+from bpy.app.handlers import persistent
+from typing import Dict, Optional, Tuple
+
+from ..utils import handlers
+from ..utils.logger import get_logger, span
+from . import mesh_writer, openings, wall_joins
+
+log = get_logger(__name__)
+
+# 오브젝트에 저장하는 벽체 정의 ID 속성
+WALLS_KEY = "irkebim_walls"
+OPENINGS_KEY = "irkebim_openings"
+
+# 개구부 ID를 저장하는 면 속성 이름 (벽체 면은 -1)
+OPENING_ID_ATTRIBUTE = "opening_id"
+
+_OPENING_FIELDS = ("offset", "width", "sill", "head")
+
+_graphs: Dict[int, tuple] = {}  # 오브젝트 session_uid: (시작점, 끝점, 두께, 연결 해석기, 그래프)
+_mesh_caches: Dict[int, openings.WallMeshCache] = {}  # 오브젝트 session_uid: 선분별 메쉬 캐시
+
+def is_wall_object(obj: Optional[bpy.types.Object]) -> bool:
+    return obj is not None and obj.type == 'MESH' and WALLS_KEY in obj
+
+def store_walls(obj: bpy.types.Object, starts: np.ndarray, ends: np.ndarray, thickness, height: float,
+                base_z: float = 0.0):
+    """벽체 정의 저장 (벽체 ID는 starts의 순번)"""
+    starts = np.asarray(starts, dtype=np.float64)[:, :2]
+    ends = np.asarray(ends, dtype=np.float64)[:, :2]
+    thickness = np.broadcast_to(np.asarray(thickness, dtype=np.float64), (len(starts),))
+    obj[WALLS_KEY] = {
+        "starts": starts.ravel().tolist(),
+        "ends": ends.ravel().tolist(),
+        "thickness": thickness.tolist(),
+        "height": float(height),
+        "base_z": float(base_z),
+    }
+
+def get_walls(obj: bpy.types.Object) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float, float]:
+    """저장된 벽체 정의 (시작점 (N, 2), 끝점 (N, 2), 두께 (N,), 높이, 바닥 높이)"""
+    data = obj[WALLS_KEY]
+    return (np.asarray(list(data["starts"]), dtype=np.float64).reshape(-1, 2),
+            np.asarray(list(data["ends"]), dtype=np.float64).reshape(-1, 2),
+            np.asarray(list(data["thickness"]), dtype=np.float64),
+            float(data["height"]), float(data["base_z"]))
+
+def get_openings(obj: bpy.types.Object) -> Tuple[np.ndarray, np.ndarray]:
+    """저장된 개구부 (벽체 ID (K,), 벽체 시작점 기준 (위치, 폭, 하단, 상단) (K, 4)) - 개구부 ID는 순번"""
+    data = obj.get(OPENINGS_KEY)
+    if not data or not len(data["wall"]):
+        return np.zeros(0, dtype=np.int32), np.zeros((0, 4))
+    return (np.asarray(list(data["wall"]), dtype=np.int32),
+            np.stack([np.asarray(list(data[field]), dtype=np.float64) for field in _OPENING_FIELDS], axis=1))
+
+def set_openings(obj: bpy.types.Object, wall_ids: np.ndarray, params: np.ndarray):
+    params = np.asarray(params, dtype=np.float64).reshape(-1, 4)
+    data = {"wall": np.asarray(wall_ids, dtype=np.int32).tolist()}
+    data.update({field: params[:, column].tolist() for column, field in enumerate(_OPENING_FIELDS)})
+    obj[OPENINGS_KEY] = data
+
+def add_opening(obj: bpy.types.Object, wall_id: int, offset: float, width: float, sill: float,
+                head: float) -> int:
+    """개구부 추가, 개구부 ID 반환 (메쉬는 regenerate에서 갱신)"""
+    wall_ids, params = get_openings(obj)
+    set_openings(obj, np.append(wall_ids, wall_id), np.vstack((params, (offset, width, sill, head))))
+    return len(wall_ids)
+
+def update_opening(obj: bpy.types.Object, opening_id: int, wall_id: Optional[int] = None, **values):
+    """개구부 위치/크기 변경 (values: offset, width, sill, head 중 바꿀 값)"""
+    wall_ids, params = get_openings(obj)
+    if not 0 <= opening_id < len(wall_ids):
+        raise IndexError(f"No opening {opening_id} on {obj.name}")
+    unknown = set(values) - set(_OPENING_FIELDS)
+    if unknown:
+        raise KeyError(f"Unknown opening fields: {', '.join(sorted(unknown))}")
+    if wall_id is not None:
+        wall_ids[opening_id] = wall_id
+    for field, value in values.items():
+        params[opening_id, _OPENING_FIELDS.index(field)] = value
+    set_openings(obj, wall_ids, params)
+
+def nearest_wall(obj: bpy.types.Object, point) -> Tuple[int, float, float]:
+    """오브젝트 좌표의 점에서 가장 가까운 벽체 (벽체 ID, 벽체 시작점부터의 거리, 중심선까지 거리)"""
+    starts, ends = get_walls(obj)[:2]
+    point = np.asarray(point, dtype=np.float64)[:2]
+    vectors = ends - starts
+    lengths = np.maximum(np.linalg.norm(vectors, axis=1), 1e-12)
+    along = np.clip(np.einsum("ij,ij->i", point - starts, vectors) / lengths, 0.0, lengths)
+    distances = np.linalg.norm(starts + vectors * (along / lengths)[:, None] - point, axis=1)
+    wall_id = int(np.argmin(distances))
+    return wall_id, float(along[wall_id]), float(distances[wall_id])
+
+def _prune_caches():
+    """삭제된 오브젝트(session_uid가 더 이상 없는)의 캐시 항목 제거"""
+    live = {obj.session_uid for obj in bpy.data.objects}
+    stale = [uid for uid in _graphs.keys() | _mesh_caches.keys() if uid not in live]
+    for uid in stale:
+        _graphs.pop(uid, None)
+        _mesh_caches.pop(uid, None)
+    if stale:
+        log.debug("Dropped wall caches of %s deleted objects", len(stale))
+
+def _wall_graph(obj: bpy.types.Object, starts: np.ndarray, ends: np.ndarray, thickness: np.ndarray):
+    """연결 해석 결과 (오브젝트별 해석기를 유지하고 바뀐 벽체만 다시 해석)"""
+    cached = _graphs.get(obj.session_uid)
+    if cached is None:
+        # 캐시 항목이 늘어나는 때에만 정리 (편집 중 반복되는 regenerate에서는 오브젝트를 훑지 않음)
+        _prune_caches()
+    if cached is not None:
+        previous_starts, previous_ends, previous_thickness, solver, graph = cached
+        common = min(len(starts), len(previous_starts))
+        changed = np.flatnonzero(np.any(starts[:common] != previous_starts[:common], axis=1) |
+                                 np.any(ends[:common] != previous_ends[:common], axis=1) |
+                                 (thickness[:common] != previous_thickness[:common])).tolist()
+        removed = list(range(len(starts), len(previous_starts)))
+        added = list(range(len(previous_starts), len(starts)))
+        # 절반 넘게 바뀌었으면 벽체별로 옮기는 것보다 새로 해석하는 쪽이 빠름
+        if len(changed) + len(removed) + len(added) > len(starts) // 2:
+            cached = None
+    if cached is None:
+        solver = wall_joins.WallJoinSolver()
+        solver.add_walls(range(len(starts)), starts, ends, thickness)
+        graph = solver.to_graph()
+    elif changed or removed or added:
+        affected = set(removed)
+        for wall_id in removed:
+            affected |= solver.remove_wall(wall_id)
+        for wall_id in changed:
+            affected |= solver.move_wall(wall_id, starts[wall_id], ends[wall_id], thickness[wall_id])
+        if added:
+            solver.add_walls(added, starts[added], ends[added], thickness[added])
+            for wall_id in added:
+                affected.add(wall_id)
+                for junction in solver.junctions_of(wall_id):
+                    affected.update((junction.first, junction.second))
+        graph = solver.patch_graph(graph, affected)
+        log.debug("Wall graph of %s: %s walls changed, %s re-solved", obj.name,
+                  len(changed) + len(removed) + len(added), len(affected))
+    _graphs[obj.session_uid] = (starts, ends, thickness, solver, graph)
+    return graph
+
+@span("wall_model.regenerate")
+def regenerate(obj: bpy.types.Object):
+    """저장된 정의로 벽체 메쉬 다시 만들기 (면 속성: 벽체 ID, 개구부 ID)"""
+    starts, ends, thickness, height, base_z = get_walls(obj)
+    points, edges, edge_walls, edge_thickness = _wall_graph(obj, starts, ends, thickness)
+
+    # 개구부 위치는 벽체 시작점 기준이므로 선분(T 연결로 줄었거나 X 연결로 나뉜) 시작점 기준으로 옮김
+    opening_walls, params = get_openings(obj)
+    edge_openings = {}
+    if len(opening_walls):
+        vectors = ends - starts
+        directions = vectors / np.maximum(np.linalg.norm(vectors, axis=1), 1e-12)[:, None]
+        for edge in np.flatnonzero(np.isin(edge_walls, opening_walls)).tolist():
+            wall_id = edge_walls[edge]
+            ids = np.flatnonzero(opening_walls == wall_id)
+            shifted = params[ids].copy()
+            shifted[:, 0] -= np.dot(points[edges[edge, 0]] - starts[wall_id], directions[wall_id])
+            edge_openings[edge] = (ids, shifted)
+
+    cache = _mesh_caches.setdefault(obj.session_uid, openings.WallMeshCache())
+    vertices, faces, face_walls, face_openings = openings.build_wall_arrays(
+        points, edges, edge_thickness, height, base_z, edge_walls, edge_openings, cache)
+    written = _write_mesh(obj.data, vertices, faces, {
+        mesh_writer.ELEMENT_ID_ATTRIBUTE: face_walls,
+        OPENING_ID_ATTRIBUTE: face_openings,
+    })
+    log.debug("Regenerated %s: %s segments, %s openings, %s rebuilt, %s vertices written", obj.name, len(edges),
+              len(opening_walls), cache.rebuilt, written)
+
+def _write_mesh(mesh: bpy.types.Mesh, vertices: np.ndarray, faces: np.ndarray,
+                face_attributes: Dict[str, np.ndarray]) -> int:
+    """메쉬 기록, 기록한 정점 수 반환 - 면이 지금 메쉬와 같으면 바뀐 좌표와 면 속성만 기록"""
+    if not mesh_writer.has_faces(mesh, len(vertices), faces):
+        mesh.clear_geometry()
+        mesh_writer.write_mesh(mesh, vertices, faces, face_attributes=face_attributes)
+        return len(vertices)
+    written = mesh_writer.update_vertices(mesh, vertices)
+    changed = False
+    for name, values in face_attributes.items():
+        current = mesh_writer.get_face_attribute(mesh, name)
+        if current is None or not np.array_equal(current, values):
+            mesh_writer.set_face_attribute(mesh, name, values)
+            changed = True
+    if written or changed:
+        mesh.update()
+    return written
+
+def create_wall_object(name: str, starts: np.ndarray, ends: np.ndarray, thickness, height: float,
+                       base_z: float = 0.0,
+                       collection: Optional[bpy.types.Collection] = None) -> bpy.types.Object:
+    """벽체 정의를 가진 새 메쉬 오브젝트 생성"""
+    obj = mesh_writer.create_object(name, bpy.data.meshes.new(name), collection)
+    store_walls(obj, starts, ends, thickness, height, base_z)
+    regenerate(obj)
+    return obj
+
+def clear_caches():
+    """오브젝트별 캐시 전체 삭제 (파일 로드 등)"""
+    _graphs.clear()
+    _mesh_caches.clear()
+
+# 핸들러
+@persistent
+def _on_load_post(dummy):
+    clear_caches()  # session_uid는 파일마다 새로 매겨짐
+
+_HANDLERS = (
+    (bpy.app.handlers.load_post, _on_load_post),
+)
+
+def register_handlers():
+    """파일 로드 핸들러 등록"""
+    handlers.register(_HANDLERS)
+
+def unregister_handlers():
+    handlers.unregister(_HANDLERS)
+    clear_caches()
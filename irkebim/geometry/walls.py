@@ -0,0 +1,153 @@
+# irkebim/geometry/walls.py
+# 중심선 그래프(점 + 선분)로 벽체 형상을 한 번에 계산
+# 선분마다 두께만큼 좌우로 오프셋하고, 두 선분이 만나는 점은 각의 이등분선에서 잘라(마이터)
+# 끝점과 세 개 이상이 만나는 점은 직각으로 끝냅니다(버트). 모든 계산은 NumPy 배열 연산입니다.
+#   points = np.array([(0, 0), (5, 0), (5, 4)])
+#   edges = np.array([(0, 1), (1, 2)])
+#   vertices, faces = wall_geometry(points, edges, thickness=0.2, height=2.4)
+import bpy
+import numpy as np
+from typing import Iterable, Optional, Tuple
+
+from ..utils.logger import get_logger, span
+from . import boxes, mesh_writer
+
+log = get_logger(__name__)
+
+# 마이터 꼭짓점이 중심선에서 (두께 / 2) * MITER_LIMIT 보다 멀어지면 버트로 끝냄 (예각 대비)
+MITER_LIMIT = 4.0
+
+# 벽체 선분 하나는 꼭짓점 순서가 단위 박스와 같은 변형된 박스
+# 바닥: 시작-오른쪽, 끝-오른쪽, 끝-왼쪽, 시작-왼쪽 (위에서 볼 때 반시계 방향)
+FACES_PER_SEGMENT = len(boxes.UNIT_BOX_FACES)
+
+_EPSILON = 1e-9
+
+def cross(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """2D 외적의 z 성분 (마지막 축이 xy인 배열끼리)"""
+    return a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]
+
+def _perpendicular(vectors: np.ndarray) -> np.ndarray:
+    """왼쪽 법선 (x, y) -> (-y, x)"""
+    return np.stack((-vectors[..., 1], vectors[..., 0]), axis=-1)
+
+def polylines_to_graph(polylines: Iterable[np.ndarray],
+                       closed: Optional[Iterable[bool]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """폴리라인 목록을 (점 (P, 2), 선분 (E, 2)) 그래프로 변환"""
+    polylines = [np.asarray(polyline, dtype=np.float64)[:, :2] for polyline in polylines]
+    closed = list(closed) if closed is not None else [False] * len(polylines)
+    points, edges, offset = [], [], 0
+    for polyline, is_closed in zip(polylines, closed):
+        count = len(polyline)
+        indices = np.arange(count) + offset
+        edges.append(np.stack((indices[:-1], indices[1:]), axis=1))
+        if is_closed and count > 2:
+            edges.append(np.array([[indices[-1], indices[0]]]))
+        points.append(polyline)
+        offset += count
+    if not points:
+        return np.zeros((0, 2)), np.zeros((0, 2), dtype=np.int64)
+    return np.concatenate(points), np.concatenate(edges).astype(np.int64)
+
+def weld_points(points: np.ndarray, edges: np.ndarray,
+                tolerance: float = 1e-5) -> Tuple[np.ndarray, np.ndarray]:
+    """tolerance 안에서 겹치는 점을 합쳐 선분이 점을 공유하도록 함 (길이 0 선분 제거)"""
+    keys = np.round(np.asarray(points)[:, :2] / tolerance).astype(np.int64)
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    edges = inverse.reshape(-1)[np.asarray(edges)]
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    return np.asarray(points)[first], edges
+
+def segment_corners(points: np.ndarray, edges: np.ndarray, thickness) -> np.ndarray:
+    """선분마다 바닥 꼭짓점 4개 (E, 4, 2) - 시작-오른쪽, 끝-오른쪽, 끝-왼쪽, 시작-왼쪽
+
+    thickness는 스칼라 또는 선분별 (E,) 배열입니다. 마이터 연결은 두께가 같은
+    선분끼리 가정합니다 (두께가 다르면 두꺼운 쪽 기준으로 이등분선에서 잘림).
+    """
+    points = np.asarray(points, dtype=np.float64)[:, :2]
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    edge_count = len(edges)
+    half = np.broadcast_to(np.asarray(thickness, dtype=np.float64) * 0.5, (edge_count,))
+
+    starts, ends = points[edges[:, 0]], points[edges[:, 1]]
+    vectors = ends - starts
+    lengths = np.linalg.norm(vectors, axis=1)
+    directions = vectors / np.maximum(lengths, _EPSILON)[:, None]
+    normals = _perpendicular(directions)
+
+    # 선분 끝(edge end) 배열: 2e는 시작, 2e+1은 끝. 각 끝에서 선분 바깥쪽(선분 방향)으로 향하는 단위 벡터
+    end_vertices = edges.reshape(-1)
+    outgoing = np.empty((edge_count * 2, 2))
+    outgoing[0::2] = directions
+    outgoing[1::2] = -directions
+
+    # 차수가 2인 점에서 만나는 두 선분 끝을 짝지음 (점 번호로 정렬하면 서로 이웃)
+    degree = np.bincount(end_vertices, minlength=len(points))
+    order = np.argsort(end_vertices, kind="stable")
+    partner = np.full(edge_count * 2, -1, dtype=np.int64)
+    sorted_vertices = end_vertices[order]
+    pair_starts = np.flatnonzero((degree[sorted_vertices] == 2) &
+                                 np.r_[True, sorted_vertices[1:] != sorted_vertices[:-1]])
+    partner[order[pair_starts]] = order[pair_starts + 1]
+    partner[order[pair_starts + 1]] = order[pair_starts]
+
+    # 이등분선 방향: 두 바깥 방향의 합 (일직선이면 법선 방향)
+    joined = partner >= 0
+    bisectors = outgoing.copy()
+    bisectors[joined] += outgoing[partner[joined]]
+    straight = np.linalg.norm(bisectors, axis=1) < 1e-6
+    bisectors[straight] = _perpendicular(outgoing[straight])
+
+    # 면(오른쪽 -1, 왼쪽 +1)이 이등분선과 만나는 점: v + k * b, k = s * h * cross(n, o) / cross(b, o)
+    end_normals = np.repeat(normals, 2, axis=0)
+    end_half = np.repeat(half, 2)
+    denominators = cross(bisectors, outgoing)
+    valid = joined & (np.abs(denominators) > _EPSILON)
+    scale = np.zeros(edge_count * 2)
+    scale[valid] = end_half[valid] * cross(end_normals, outgoing)[valid] / denominators[valid]
+    # 너무 뾰족한 마이터는 버트로
+    valid &= np.abs(scale) * np.linalg.norm(bisectors, axis=1) <= end_half * MITER_LIMIT
+
+    vertices_2d = points[end_vertices]
+    corners = np.empty((edge_count * 2, 2, 2))  # 선분 끝, (오른쪽, 왼쪽), xy
+    for side_index, side in enumerate((-1.0, 1.0)):
+        butt = vertices_2d + side * end_half[:, None] * end_normals
+        miter = vertices_2d + side * scale[:, None] * bisectors
+        corners[:, side_index] = np.where(valid[:, None], miter, butt)
+
+    start_corners, end_corners = corners[0::2], corners[1::2]
+    return np.stack((start_corners[:, 0], end_corners[:, 0], end_corners[:, 1], start_corners[:, 1]), axis=1)
+
+def extrude_corners(corners: np.ndarray, height, base_z=0.0) -> np.ndarray:
+    """바닥 꼭짓점 (E, 4, 2)를 높이만큼 돌출하여 (E * 8, 3) 정점 생성"""
+    count = len(corners)
+    base = np.broadcast_to(np.asarray(base_z, dtype=np.float64), (count,))
+    top = base + np.broadcast_to(np.asarray(height, dtype=np.float64), (count,))
+    vertices = np.empty((count, 8, 3), dtype=np.float32)
+    vertices[:, :4, :2] = corners
+    vertices[:, 4:, :2] = corners
+    vertices[:, :4, 2] = base[:, None]
+    vertices[:, 4:, 2] = top[:, None]
+    return vertices.reshape(-1, 3)
+
+def wall_geometry(points: np.ndarray, edges: np.ndarray, thickness, height,
+                  base_z=0.0) -> Tuple[np.ndarray, np.ndarray]:
+    """중심선 그래프의 벽체 (정점 (E * 8, 3), 사각형 면 (E * 6, 4))"""
+    corners = segment_corners(points, edges, thickness)
+    return extrude_corners(corners, height, base_z), boxes.box_faces(len(corners))
+
+@span("walls.build_walls")
+def build_walls(points: np.ndarray, edges: np.ndarray, thickness, height, base_z=0.0,
+                element_ids: Optional[np.ndarray] = None, name: str = "Walls",
+                collection: Optional[bpy.types.Collection] = None) -> bpy.types.Object:
+    """벽체 그래프 전체를 하나의 메쉬 오브젝트로 생성 (면마다 선분의 element_id 저장)"""
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    vertices, faces = wall_geometry(points, edges, thickness, height, base_z)
+    if element_ids is None:
+        element_ids = np.arange(len(edges), dtype=np.int32)
+    face_ids = np.repeat(np.asarray(element_ids, dtype=np.int32), FACES_PER_SEGMENT)
+    obj = mesh_writer.new_mesh_object(name, vertices, faces,
+                                      face_attributes={mesh_writer.ELEMENT_ID_ATTRIBUTE: face_ids},
+                                      collection=collection)
+    log.debug("Built %s wall segments", len(edges))
+    return obj
@@ -1,23 +1,140 @@
 # irkebim/operators/cube.py
+import time
 import bpy
-from ..preferences import default_values  # 오퍼레이터 설정 가져오기
+from ..preferences import default_values, linked_props  # 오퍼레이터 설정 가져오기
+from ..geometry import boxes, element_graph, mesh_cache, mesh_writer
+
+def resolve_cube(obj, record):
+    """큐브 크기: 고정값이 없으면 씬의 cube_custom_size"""
+    params = dict(record["params"])
+    params.setdefault("size", element_graph.scene_of(obj).cube_custom_size)
+    return params
+
+def rebuild_cube(obj, params):
+    mesh_cache.assign(obj, "cube", {"size": params["size"]})
+
+element_graph.register_type("cube", resolve_cube, rebuild_cube)
 
 class CubeOperator(bpy.types.Operator):
     bl_idname = "mesh.add_custom_cube"
     bl_label = "Add Cube"
     bl_description = "Add a cube with the specified size"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    follow_defaults: bpy.props.BoolProperty(
+        name="Follow Defaults",
+        description="Update the cube when the scene cube size changes",
+        default=False
+    )
 
     def execute(self, context):
         scene = context.scene
         size = scene.cube_custom_size
-        bpy.ops.mesh.primitive_cube_add(size=size)
+        # 같은 크기의 큐브는 하나의 메쉬를 공유
+        mesh = mesh_cache.acquire("cube", {"size": size})
+        obj = mesh_writer.create_object("Cube", mesh, context.collection)
+        obj.location = scene.cursor.location
+        # follow_defaults면 씬 크기가 바뀔 때 이 큐브도 따라 바뀜, 아니면 지금 크기로 고정
+        if self.follow_defaults:
+            element_graph.register_element(obj, "cube", inputs=[element_graph.SCENE_INPUT + "cube_custom_size"])
+        else:
+            element_graph.register_element(obj, "cube", {"size": size})
+        mesh_writer.select_only(context, [obj])
+        return {'FINISHED'}
+
+class UpdateSharedCubeOperator(bpy.types.Operator):
+    bl_idname = "object.update_shared_cube"
+    bl_label = "Apply Size to Shared Cubes"
+    bl_description = "Change the size of every cube sharing the active cube's mesh"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        if obj is None or obj.type != 'MESH':
+            return False
+        # 다른 종류의 캐시 메쉬(벽체 등)에 큐브 크기를 쓰지 않도록
+        cached = mesh_cache.get_params(obj.data)
+        return cached is not None and cached[0] == "cube"
+
+    def execute(self, context):
+        mesh = context.active_object.data
+        users = mesh.users
+        mesh_cache.update_params(mesh, {"size": context.scene.cube_custom_size})
+        removed = mesh_cache.cleanup_orphans()
+        self.report({'INFO'}, f"Updated {users} cubes" + (f", removed {removed} unused meshes" if removed else ""))
+        return {'FINISHED'}
+
+class BatchCubeOperator(bpy.types.Operator):
+    bl_idname = "mesh.add_cube_batch"
+    bl_label = "Add Cube Batch"
+    bl_description = "Add many cubes at once from a grid or a CSV/JSON element spec"
+    bl_options = {'REGISTER', 'UNDO'}  # 전체 생성이 하나의 실행 취소 단계
+
+    source: bpy.props.EnumProperty(
+        name="Source",
+        items=[
+            ('GRID', "Grid", "Place cubes on a regular grid"),
+            ('FILE', "File", "Read centers, sizes and IDs from a CSV or JSON file"),
+        ],
+        default='GRID'
+    )
+    filepath: bpy.props.StringProperty(name="File Path", subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.csv;*.json", options={'HIDDEN'})
+    count_x: bpy.props.IntProperty(name="Count X", default=10, min=1, soft_max=1000)
+    count_y: bpy.props.IntProperty(name="Count Y", default=10, min=1, soft_max=1000)
+    count_z: bpy.props.IntProperty(name="Count Z", default=1, min=1, soft_max=100)
+    spacing: bpy.props.FloatProperty(
+        name="Spacing",
+        description="Distance between grid cell centers (0 uses the default grid size)",
+        default=0.0,
+        min=0.0,
+        unit='LENGTH'
+    )
+    chunk_size: bpy.props.IntProperty(
+        name="Cubes per Mesh",
+        description="Split the result into meshes of at most this many cubes",
+        default=10000,
+        min=1
+    )
+
+    def invoke(self, context, event):
+        if self.source == 'FILE' and not self.filepath:
+            context.window_manager.fileselect_add(self)
+            return {'RUNNING_MODAL'}
+        return self.execute(context)
+
+    def execute(self, context):
+        started = time.perf_counter()
+        size = context.scene.cube_custom_size
+        if self.source == 'FILE':
+            try:
+                centers, sizes, element_ids = boxes.load_spec(bpy.path.abspath(self.filepath), size)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                self.report({'ERROR'}, f"Could not read element spec: {e}")
+                return {'CANCELLED'}
+        else:
+            spacing = self.spacing or default_values.DEFAULT_GRID_SIZE
+            centers = boxes.grid_centers((self.count_x, self.count_y, self.count_z), spacing,
+                                         context.scene.cursor.location)
+            sizes, element_ids = size, None
+
+        objects = boxes.build_boxes(centers, sizes, element_ids, name="Cubes",
+                                    chunk_size=self.chunk_size, collection=context.collection)
+        mesh_writer.select_only(context, objects)
+        self.report({'INFO'}, f"Added {len(centers)} cubes in {len(objects)} meshes "
+                              f"({(time.perf_counter() - started) * 1000.0:.0f} ms)")
         return {'FINISHED'}
 
 # 프로퍼티 정의 - 자동 수집을 위한 이름 규칙 사용
-Property_Scene_cube_custom_size = bpy.props.FloatProperty(
+# 환경설정의 default_cube_size를 따르며, 씬에서 바꾼 값은 그 씬에만 저장됨
+Property_Scene_cube_custom_size = linked_props.linked_scene_property(
+    bpy.props.FloatProperty,
+    "cube_custom_size",
+    "default_cube_size",
+    default_values.DEFAULT_CUBE_SIZE,  # 오퍼레이터 설정에서 기본값 가져오기
     name="Cube Size",
     description="Size of the new cube",
-    default=default_values.DEFAULT_CUBE_SIZE,  # 오퍼레이터 설정에서 기본값 가져오기
     min=0.01,
     soft_max=100.0
 )
\ No newline at end of file
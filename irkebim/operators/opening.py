@@ -0,0 +1,112 @@
+# irkebim/operators/opening.py
+import time
+import bpy
+import numpy as np
+from ..geometry import wall_model
+
+# 종류별 기본 크기 (폭, 하단 높이, 상단 높이)
+OPENING_PRESETS = {
+    'DOOR': (0.9, 0.0, 2.1),
+    'WINDOW': (1.2, 0.9, 2.1),
+}
+
+class OpeningOperator(bpy.types.Operator):
+    bl_idname = "mesh.add_opening"
+    bl_label = "Add Opening"
+    bl_description = "Add a door or window to the wall nearest to the 3D cursor"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    kind: bpy.props.EnumProperty(
+        name="Kind",
+        items=[
+            ('DOOR', "Door", "Opening that starts at the floor"),
+            ('WINDOW', "Window", "Opening above a sill"),
+        ],
+        default='DOOR'
+    )
+    width: bpy.props.FloatProperty(
+        name="Width",
+        default=OPENING_PRESETS['DOOR'][0],
+        min=0.01,
+        max=100.0,
+        unit='LENGTH'
+    )
+    sill_height: bpy.props.FloatProperty(
+        name="Sill Height",
+        default=OPENING_PRESETS['DOOR'][1],
+        min=0.0,
+        max=100.0,
+        unit='LENGTH'
+    )
+    head_height: bpy.props.FloatProperty(
+        name="Head Height",
+        default=OPENING_PRESETS['DOOR'][2],
+        min=0.01,
+        max=100.0,
+        unit='LENGTH'
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return wall_model.is_wall_object(context.active_object)
+
+    def invoke(self, context, event):
+        # 크기를 넘기지 않은 경우 종류별 기본값 사용
+        for name, value in zip(("width", "sill_height", "head_height"), OPENING_PRESETS[self.kind]):
+            if not self.properties.is_property_set(name):
+                setattr(self, name, value)
+        return self.execute(context)
+
+    def execute(self, context):
+        started = time.perf_counter()
+        obj = context.active_object
+        if self.head_height <= self.sill_height:
+            self.report({'ERROR'}, "Head height must be above the sill height")
+            return {'CANCELLED'}
+
+        # 3D 커서에서 가장 가까운 벽체에 커서 위치를 중심으로 배치
+        cursor = np.array(obj.matrix_world.inverted() @ context.scene.cursor.location)
+        wall_id, along, _ = wall_model.nearest_wall(obj, cursor)
+        wall_model.add_opening(obj, wall_id, along - self.width * 0.5, self.width,
+                               self.sill_height, self.head_height)
+        wall_model.regenerate(obj)
+        self.report({'INFO'}, f"Added {self.kind.lower()} to wall {wall_id} "
+                              f"({(time.perf_counter() - started) * 1000.0:.0f} ms)")
+        return {'FINISHED'}
+
+class MoveOpeningOperator(bpy.types.Operator):
+    bl_idname = "mesh.move_opening"
+    bl_label = "Move Opening"
+    bl_description = "Move an opening of the active wall object to the wall nearest to the 3D cursor"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    opening_id: bpy.props.IntProperty(
+        name="Opening",
+        description="Opening to move (-1 for the most recently added one)",
+        default=-1,
+        min=-1
+    )
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return wall_model.is_wall_object(obj) and len(wall_model.get_openings(obj)[0]) > 0
+
+    def execute(self, context):
+        started = time.perf_counter()
+        obj = context.active_object
+        wall_ids, params = wall_model.get_openings(obj)
+        opening_id = len(wall_ids) - 1 if self.opening_id < 0 else self.opening_id
+        if opening_id >= len(wall_ids):
+            self.report({'ERROR'}, f"{obj.name} has no opening {opening_id}")
+            return {'CANCELLED'}
+
+        # 크기는 그대로 두고 3D 커서에서 가장 가까운 벽체에 커서 위치를 중심으로 옮김
+        cursor = np.array(obj.matrix_world.inverted() @ context.scene.cursor.location)
+        wall_id, along, _ = wall_model.nearest_wall(obj, cursor)
+        width = float(params[opening_id, 1])
+        wall_model.update_opening(obj, opening_id, wall_id=wall_id, offset=along - width * 0.5)
+        wall_model.regenerate(obj)
+        self.report({'INFO'}, f"Moved opening {opening_id} to wall {wall_id} "
+                              f"({(time.perf_counter() - started) * 1000.0:.0f} ms)")
+        return {'FINISHED'}
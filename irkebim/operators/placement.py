@@ -0,0 +1,89 @@
+# irkebim/operators/placement.py
+import time
+import bpy
+from bpy_extras import view3d_utils
+from mathutils import Vector, geometry
+from ..preferences import default_values, linked_props
+from ..geometry import snapping
+from ..utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# 화면에서 이 거리(픽셀) 안의 요소에 스냅
+SNAP_RADIUS_PIXELS = 12
+
+class PlaceElementOperator(bpy.types.Operator):
+    bl_idname = "object.place_element"
+    bl_label = "Place Element"
+    bl_description = ("Move the selected elements with the mouse, snapping to element vertices, "
+                      "edge midpoints, wall centerlines and the grid (hold Ctrl to toggle snapping)")
+    bl_options = {'REGISTER', 'UNDO', 'GRAB_CURSOR', 'BLOCKING'}
+
+    @classmethod
+    def poll(cls, context):
+        return (context.area is not None and context.area.type == 'VIEW_3D' and
+                context.active_object is not None and bool(context.selected_objects))
+
+    def invoke(self, context, event):
+        self._objects = list(context.selected_objects)
+        self._names = {obj.name for obj in self._objects}
+        self._start = [obj.location.copy() for obj in self._objects]
+        self._anchor = context.active_object.matrix_world.translation.copy()
+        # 패널 버튼으로 실행되면 context.region은 사이드바이므로 3D 뷰 영역을 직접 찾음
+        self._region = next(region for region in context.area.regions if region.type == 'WINDOW')
+        self._view = context.space_data.region_3d
+        self._use_snapping = linked_props.get_preference_value("use_snapping", True)
+        self._grid_size = linked_props.get_preference_value("snap_grid_size", default_values.DEFAULT_GRID_SIZE)
+        self._query_ms = 0.0
+        self._queries = 0
+        context.window_manager.modal_handler_add(self)
+        self._update(context, event)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type in {'MOUSEMOVE', 'LEFT_CTRL', 'RIGHT_CTRL'}:
+            self._update(context, event)
+        elif event.type in {'LEFTMOUSE', 'RET', 'NUMPAD_ENTER'} and event.value == 'PRESS':
+            self._finish(context)
+            return {'FINISHED'}
+        elif event.type in {'RIGHTMOUSE', 'ESC'} and event.value == 'PRESS':
+            for obj, location in zip(self._objects, self._start):
+                obj.location = location
+            self._finish(context)
+            return {'CANCELLED'}
+        elif event.type in {'MIDDLEMOUSE', 'WHEELUPMOUSE', 'WHEELDOWNMOUSE'}:
+            return {'PASS_THROUGH'}  # 배치 중 뷰 회전/확대
+        return {'RUNNING_MODAL'}
+
+    def _plane_point(self, x: float, y: float):
+        """창 좌표의 마우스 위치를 기준 오브젝트 높이의 수평면에 투영"""
+        coord = (x - self._region.x, y - self._region.y)
+        origin = view3d_utils.region_2d_to_origin_3d(self._region, self._view, coord)
+        direction = view3d_utils.region_2d_to_vector_3d(self._region, self._view, coord)
+        return geometry.intersect_line_plane(origin, origin + direction, self._anchor, Vector((0.0, 0.0, 1.0)))
+
+    def _update(self, context, event):
+        point = self._plane_point(event.mouse_x, event.mouse_y)
+        if point is None:
+            return
+        target, label = (point.x, point.y), "Free"
+        # Ctrl을 누르는 동안 환경설정과 반대로 동작
+        if self._use_snapping != event.ctrl:
+            edge = self._plane_point(event.mouse_x + SNAP_RADIUS_PIXELS, event.mouse_y)
+            radius = (edge - point).length if edge is not None else 0.0
+            started = time.perf_counter()
+            result = snapping.get_index().snap(context.scene, target, radius, self._grid_size, exclude=self._names)
+            self._query_ms += (time.perf_counter() - started) * 1000.0
+            self._queries += 1
+            if result is not None:
+                target, label = result.location, result.kind.title()
+
+        offset = Vector((target[0] - self._anchor.x, target[1] - self._anchor.y, 0.0))
+        for obj, location in zip(self._objects, self._start):
+            obj.location = location + offset
+        context.area.header_text_set(f"Place: {label}  X {target[0]:.4f}  Y {target[1]:.4f}")
+
+    def _finish(self, context):
+        context.area.header_text_set(None)
+        if self._queries:
+            log.debug("Snap queries: %s, average %.3f ms", self._queries, self._query_ms / self._queries)
@@ -0,0 +1,58 @@
+# irkebim/operators/storey.py
+import bpy
+from ..preferences import default_values
+from ..geometry import element_graph
+
+def storey_changed(self, context):
+    """층 값이 바뀌면 그 층에 의존하는 요소만 다시 만들기 예약"""
+    element_graph.mark_input_dirty(element_graph.storey_input(self))
+
+class AddStoreyOperator(bpy.types.Operator):
+    bl_idname = "collection.add_storey"
+    bl_label = "Add Storey"
+    bl_description = "Add a storey collection above the highest storey and make it active"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        scene = context.scene
+        storeys = [collection for collection in scene.collection.children_recursive
+                   if element_graph.get_storey(collection) is not None]
+        top = max(storeys, key=lambda storey: storey.storey_elevation, default=None)
+
+        collection = bpy.data.collections.new(f"Storey {len(storeys) + 1}")
+        scene.collection.children.link(collection)
+        collection.is_storey = True
+        collection.storey_wall_height = top.storey_wall_height if top else scene.wall_default_height
+        collection.storey_elevation = top.storey_elevation + top.storey_wall_height if top else 0.0
+
+        # 새 요소가 이 층에 만들어지도록 활성 컬렉션으로
+        context.view_layer.active_layer_collection = context.view_layer.layer_collection.children[collection.name]
+        self.report({'INFO'}, f"Added {collection.name} at {collection.storey_elevation:.2f}")
+        return {'FINISHED'}
+
+# 프로퍼티 정의 - 자동 수집을 위한 이름 규칙 사용
+# 층은 컬렉션에 저장되며, 층에 만든 요소는 층의 바닥 높이와 벽체 높이를 따름
+Property_Collection_is_storey = bpy.props.BoolProperty(
+    name="Storey",
+    description="Elements created in this collection follow its elevation and wall height",
+    default=False,
+    update=storey_changed
+)
+
+Property_Collection_storey_elevation = bpy.props.FloatProperty(
+    name="Elevation",
+    description="Floor level of the storey",
+    default=0.0,
+    unit='LENGTH',
+    update=storey_changed
+)
+
+Property_Collection_storey_wall_height = bpy.props.FloatProperty(
+    name="Wall Height",
+    description="Height of walls on this storey that follow the defaults",
+    default=default_values.DEFAULT_WALL_HEIGHT,
+    min=0.1,
+    max=100.0,
+    unit='LENGTH',
+    update=storey_changed
+)
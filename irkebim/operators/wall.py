@@ -0,0 +1,190 @@
+# irkebim/operators/wall.py
+import time
+import bpy
+import numpy as np
+from ..preferences import default_values, linked_props  # 오퍼레이터 설정 가져오기
+from ..geometry import element_graph, mesh_writer, wall_model, walls
+
+def create_wall_material(obj):
+    """벽체에 기본 재질 생성 및 적용"""
+    mat_name = "Wall_Material"
+
+    # 기존 재질 찾기 또는 새로 생성
+    mat = bpy.data.materials.get(mat_name)
+    if not mat:
+        mat = bpy.data.materials.new(name=mat_name)
+        mat.diffuse_color = (0.8, 0.8, 0.8, 1.0)  # 연한 회색
+
+        # Principled BSDF 사용을 위한 노드 설정
+        mat.use_nodes = True
+        bsdf = mat.node_tree.nodes.get('Principled BSDF')
+        if bsdf:
+            if 'Base Color' in bsdf.inputs:
+                bsdf.inputs['Base Color'].default_value = (0.8, 0.8, 0.8, 1.0)
+            if 'Roughness' in bsdf.inputs:
+                bsdf.inputs['Roughness'].default_value = 0.7
+            if 'Specular' in bsdf.inputs:
+                bsdf.inputs['Specular'].default_value = 0.1
+            elif 'Specular IOR Level' in bsdf.inputs:
+                # Blender 4.0 이상에서 이름 변경
+                bsdf.inputs['Specular IOR Level'].default_value = 0.1
+
+    if not obj.data.materials:
+        obj.data.materials.append(mat)
+
+def resolve_wall(obj, record):
+    """벽체 높이/바닥 높이: 고정값 > 층 > 씬 기본 높이 (층이 없으면 바닥 높이는 저장된 값 유지)"""
+    params = dict(record["params"])
+    storey = element_graph.storey_of(record)
+    if storey is not None:
+        params.setdefault("height", storey.storey_wall_height)
+        params.setdefault("base_z", storey.storey_elevation)
+    else:
+        params.setdefault("height", element_graph.scene_of(obj).wall_default_height)
+    return params
+
+def rebuild_wall(obj, params):
+    starts, ends, thickness, _, base_z = wall_model.get_walls(obj)
+    wall_model.store_walls(obj, starts, ends, thickness, params["height"], params.get("base_z", base_z))
+    wall_model.regenerate(obj)
+
+element_graph.register_type("wall", resolve_wall, rebuild_wall)
+
+def read_centerlines(obj):
+    """메쉬 오브젝트의 정점/선분을 월드 좌표 중심선 그래프로 읽기 (점 (P, 2), 선분 (E, 2), 바닥 높이)"""
+    mesh = obj.data
+    coordinates = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coordinates)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+
+    coordinates = coordinates.reshape(-1, 3)
+    matrix = np.array(obj.matrix_world, dtype=np.float64)
+    world = coordinates @ matrix[:3, :3].T + matrix[:3, 3]
+    base_z = float(world[:, 2].min()) if len(world) else 0.0
+    return walls.weld_points(world[:, :2], edges.reshape(-1, 2)) + (base_z,)
+
+class WallOperator(bpy.types.Operator):
+    bl_idname = "mesh.add_wall"
+    bl_label = "Add Wall"
+    bl_description = "Add a straight wall, or walls along the edges of the selected centerline meshes"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    source: bpy.props.EnumProperty(
+        name="Source",
+        items=[
+            ('STRAIGHT', "Straight", "Add one straight wall starting at the 3D cursor"),
+            ('CENTERLINES', "Centerlines", "Build walls along the edges of the selected mesh objects"),
+        ],
+        default='STRAIGHT'
+    )
+    length: bpy.props.FloatProperty(
+        name="Length",
+        description="Length of a straight wall",
+        default=4.0,
+        min=0.01,
+        max=1000.0,
+        unit='LENGTH'
+    )
+    height: bpy.props.FloatProperty(
+        name="Height",
+        default=default_values.DEFAULT_WALL_HEIGHT,
+        min=0.1,
+        max=100.0,
+        unit='LENGTH'
+    )
+    thickness: bpy.props.FloatProperty(
+        name="Thickness",
+        default=default_values.DEFAULT_WALL_THICKNESS,
+        min=0.01,
+        max=10.0,
+        unit='LENGTH'
+    )
+    follow_defaults: bpy.props.BoolProperty(
+        name="Follow Defaults",
+        description="Take the height from the active storey or the scene default and update the wall when it changes",
+        default=True
+    )
+    apply_material: bpy.props.BoolProperty(
+        name="Apply Material",
+        description="Assign the default wall material",
+        default=True
+    )
+
+    def invoke(self, context, event):
+        # 패널에서 값을 넘기지 않은 경우 씬 설정 사용
+        scene = context.scene
+        if not self.properties.is_property_set("height"):
+            self.height = scene.wall_default_height
+        if not self.properties.is_property_set("thickness"):
+            self.thickness = scene.wall_thickness
+        return self.execute(context)
+
+    def execute(self, context):
+        started = time.perf_counter()
+        # 층 컬렉션에 만들면 층의 바닥/벽체 높이를 따름
+        storey = element_graph.get_storey(context.collection)
+        height = self.height
+        if self.follow_defaults:
+            height = storey.storey_wall_height if storey else context.scene.wall_default_height
+
+        if self.source == 'CENTERLINES':
+            sources = [obj for obj in context.selected_objects if obj.type == 'MESH' and len(obj.data.edges)]
+            if not sources:
+                self.report({'ERROR'}, "Select mesh objects whose edges are wall centerlines")
+                return {'CANCELLED'}
+            objects = []
+            for source in sources:
+                points, edges, base_z = read_centerlines(source)
+                # 선분마다 벽체 하나로 저장하고 L/T/X 연결은 wall_model에서 해석
+                objects.append(wall_model.create_wall_object(
+                    f"{source.name}_Walls", points[edges[:, 0]], points[edges[:, 1]], self.thickness,
+                    height, storey.storey_elevation if storey else base_z, collection=context.collection))
+        else:
+            cursor = context.scene.cursor.location
+            objects = [wall_model.create_wall_object(
+                "Wall", [(cursor.x, cursor.y)], [(cursor.x + self.length, cursor.y)], self.thickness,
+                height, storey.storey_elevation if storey else cursor.z, collection=context.collection)]
+        count = sum(len(wall_model.get_walls(obj)[0]) for obj in objects)
+
+        # 기본값을 따르는 벽체는 층 또는 씬 높이가 바뀌면 다시 만들어짐
+        if storey is not None:
+            inputs = [element_graph.storey_input(storey)]
+        else:
+            inputs = [element_graph.SCENE_INPUT + "wall_default_height"] if self.follow_defaults else []
+        params = {} if self.follow_defaults else {"height": self.height}
+        for obj in objects:
+            element_graph.register_element(obj, "wall", params, inputs)
+
+        if self.apply_material:
+            for obj in objects:
+                create_wall_material(obj)
+        mesh_writer.select_only(context, objects)
+        self.report({'INFO'}, f"Added {count} walls ({(time.perf_counter() - started) * 1000.0:.0f} ms)")
+        return {'FINISHED'}
+
+# 프로퍼티 정의 - 자동 수집을 위한 이름 규칙 사용
+# 환경설정의 벽체 기본값을 따르며, 씬에서 바꾼 값은 그 씬에만 저장됨
+Property_Scene_wall_default_height = linked_props.linked_scene_property(
+    bpy.props.FloatProperty,
+    "wall_default_height",
+    "default_wall_height",
+    default_values.DEFAULT_WALL_HEIGHT,
+    name="Wall Height",
+    description="Default height of new walls",
+    min=0.1,
+    max=100.0,
+    unit='LENGTH'
+)
+
+Property_Scene_wall_thickness = linked_props.linked_scene_property(
+    bpy.props.FloatProperty,
+    "wall_thickness",
+    "default_wall_thickness",
+    default_values.DEFAULT_WALL_THICKNESS,
+    name="Wall Thickness",
+    description="Default thickness of new walls",
+    min=0.01,
+    max=10.0,
+    unit='LENGTH'
+)
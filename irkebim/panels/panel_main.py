@@ -1,6 +1,11 @@
 # irkebim/panels/panel_main.py
 import bpy
-from ..operators.cube import CubeOperator
+from ..geometry import element_graph
+from ..operators.cube import BatchCubeOperator, CubeOperator, UpdateSharedCubeOperator
+from ..operators.opening import MoveOpeningOperator, OpeningOperator
+from ..operators.placement import PlaceElementOperator
+from ..operators.storey import AddStoreyOperator
+from ..operators.wall import WallOperator
 
 class MainPanel(bpy.types.Panel):
     bl_label = "IRKE BIM Tools"
@@ -17,4 +22,45 @@ class MainPanel(bpy.types.Panel):
         box = layout.box()
         box.label(text="Cube Generator")
         box.prop(scene, "cube_custom_size", text="Cube Size")
-        box.operator(CubeOperator.bl_idname, text="Generate Cube")
\ No newline at end of file
+        box.operator(CubeOperator.bl_idname, text="Generate Cube")
+        box.operator(UpdateSharedCubeOperator.bl_idname, text="Apply Size to Shared Cubes")
+        
+        # 일괄 생성 (격자 또는 CSV/JSON 명세)
+        row = box.row(align=True)
+        row.operator(BatchCubeOperator.bl_idname, text="Cube Grid").source = 'GRID'
+        row.operator(BatchCubeOperator.bl_idname, text="From File").source = 'FILE'
+        
+        # 벽체 생성 섹션
+        box = layout.box()
+        box.label(text="Wall Generator")
+        box.prop(scene, "wall_default_height", text="Height")
+        box.prop(scene, "wall_thickness", text="Thickness")
+        
+        # 벽체 생성 연산자 - 씬 속성값 연결
+        row = box.row(align=True)
+        for source, text in (('STRAIGHT', "Generate Wall"), ('CENTERLINES', "From Centerlines")):
+            op = row.operator(WallOperator.bl_idname, text=text)
+            op.source = source
+            op.height = scene.wall_default_height
+            op.thickness = scene.wall_thickness
+
+        # 개구부 - 활성 벽체에서 3D 커서에 가장 가까운 벽에 추가
+        row = box.row(align=True)
+        row.operator(OpeningOperator.bl_idname, text="Add Door").kind = 'DOOR'
+        row.operator(OpeningOperator.bl_idname, text="Add Window").kind = 'WINDOW'
+        box.operator(MoveOpeningOperator.bl_idname, text="Move Opening to Cursor")
+
+        # 층 섹션 - 활성 컬렉션이 층이면 층 값 표시 (바꾸면 그 층의 요소만 다시 만듦)
+        box = layout.box()
+        box.label(text="Storeys")
+        storey = element_graph.get_storey(context.collection)
+        if storey is not None:
+            box.label(text=storey.name)
+            box.prop(storey, "storey_elevation")
+            box.prop(storey, "storey_wall_height")
+        else:
+            box.label(text="Active collection is not a storey")
+        box.operator(AddStoreyOperator.bl_idname, text="Add Storey")
+
+        # 선택한 요소를 마우스로 옮기며 스냅
+        layout.operator(PlaceElementOperator.bl_idname, text="Place Selected")
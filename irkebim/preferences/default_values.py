@@ -1,8 +1,11 @@
 # irkebim/preferences/default_values.py
-import bpy
 from bpy.types import AddonPreferences
 from bpy.props import FloatProperty, BoolProperty
 from .. import config
+from ..utils.logger import get_logger
+from . import linked_props, scene_sync
+
+log = get_logger(__name__)
 
 # 오퍼레이터 기본값 정의 - 실제 기능 작동 관련 설정
 DEFAULT_CUBE_SIZE = 2.0  # 기본 큐브 크기
@@ -14,30 +17,27 @@ DEFAULT_WALL_THICKNESS = 0.2  # 기본 벽체 두께
 # 환경설정 속성과 씬 속성 간의 매핑 정보
 # 형식: {'환경설정 속성 이름': ('씬 속성 이름', 기본값)}
 # 이 매핑이 있는 속성은 자동으로 동기화됩니다
+# 씬 속성을 linked_props.linked_scene_property로 정의하면 씬에 복사하지 않고 환경설정을 직접 읽습니다
 PREFERENCES_TO_SCENE_MAPPING = {
     'default_cube_size': ('cube_custom_size', DEFAULT_CUBE_SIZE),
     'default_wall_height': ('wall_default_height', DEFAULT_WALL_HEIGHT),
-    'default_wall_thickness': ('wall_thickness', DEFAULT_WALL_THICKNESS)  # 아직 씬에 추가하지 않은 예시 속성
+    'default_wall_thickness': ('wall_thickness', DEFAULT_WALL_THICKNESS)
 }
 
 # 씬 업데이트 함수 - 속성별 특수 로직이 필요한 경우 사용
 def update_scenes_property(property_name, value):
-    """특정 속성 값으로 모든 씬 업데이트"""
-    try:
-        # 매핑에서 씬 속성 이름 찾기
-        if property_name in PREFERENCES_TO_SCENE_MAPPING:
-            scene_property_name = PREFERENCES_TO_SCENE_MAPPING[property_name][0]
-            print(f"Updating scenes property: {scene_property_name} = {value}")
-            
-            # 모든 씬에 적용
-            for scene in bpy.data.scenes:
-                if hasattr(scene, scene_property_name):
-                    setattr(scene, scene_property_name, value)
-                    print(f"Updated scene {scene.name}.{scene_property_name}")
-    except Exception as e:
-        print(f"Error updating scenes property {property_name}: {e}")
-        import traceback
-        traceback.print_exc()
+    """특정 속성 값으로 씬 업데이트 예약 (연속 변경은 모아서 다음 타이머 틱에 한 번 반영)"""
+    # 매핑에서 씬 속성 이름 찾기
+    if property_name in PREFERENCES_TO_SCENE_MAPPING:
+        scene_property_name = PREFERENCES_TO_SCENE_MAPPING[property_name][0]
+        if linked_props.is_linked(scene_property_name):
+            # 환경설정을 따르는 속성은 씬에 쓰지 않고 캐시만 무효화
+            linked_props.invalidate()
+            linked_props.tag_redraw()
+            linked_props.notify_changed(scene_property_name)
+            return
+        log.debug("Scheduling scenes property update: %s = %s", scene_property_name, value)
+        scene_sync.request_sync(scene_property_name, value)
 
 # 업데이트 콜백 생성 함수
 def create_update_callback(property_name):
@@ -47,6 +47,10 @@ def create_update_callback(property_name):
         update_scenes_property(property_name, value)
     return update_callback
 
+def invalidate_preference_cache(self, context):
+    """씬 속성과 연결되지 않은 환경설정(스냅 등)이 바뀌면 캐시된 환경설정 값 무효화"""
+    linked_props.invalidate()
+
 class DefaultAddonPreferences(AddonPreferences):
     bl_idname = config.ADDON_ID
 
@@ -84,7 +88,18 @@ class DefaultAddonPreferences(AddonPreferences):
     use_snapping: BoolProperty(
         name="Use Snapping",
         description="Enable automatic snapping for precise modeling",
-        default=True
+        default=True,
+        update=invalidate_preference_cache
+    )
+    
+    snap_grid_size: FloatProperty(
+        name="Snap Grid Size",
+        description="Grid spacing used when no element is within snapping range",
+        default=DEFAULT_GRID_SIZE,
+        min=0.001,
+        max=100.0,
+        unit='LENGTH',
+        update=invalidate_preference_cache
     )
 
     def draw(self, context):
@@ -105,6 +120,7 @@ class DefaultAddonPreferences(AddonPreferences):
         box = layout.box()
         box.label(text="Other Settings")
         box.prop(self, "use_snapping")
+        box.prop(self, "snap_grid_size")
         
         # 설명 추가
-        layout.label(text="Changes will affect new scenes and existing scenes when restarting Blender")
\ No newline at end of file
+        layout.label(text="Scenes follow these values unless a value is changed in the scene itself")
\ No newline at end of file
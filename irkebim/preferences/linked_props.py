@@ -0,0 +1,109 @@
+# irkebim/preferences/linked_props.py
+# 환경설정을 따르는 씬 속성 (복사 대신 getter/setter로 읽기)
+# 씬에서 값을 직접 바꾸면 그 씬에만 재정의 값이 ID 속성으로 저장되고,
+# 재정의가 없는 씬은 항상 현재 환경설정 값을 보여줍니다.
+#   Property_Scene_cube_custom_size = linked_props.linked_scene_property(
+#       bpy.props.FloatProperty, "cube_custom_size", "default_cube_size", DEFAULT_CUBE_SIZE, name="Cube Size")
+import bpy
+from typing import Any, Callable, Dict, Tuple
+
+from .. import config
+from ..utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# 씬별 재정의 값을 저장하는 ID 속성 이름 접두사 (이전 방식으로 복사된 값과 구분)
+OVERRIDE_PREFIX = "irkebim_override_"
+
+_linked: Dict[str, Tuple[str, Any]] = {}  # 씬 속성 이름: (환경설정 속성 이름, 기본값)
+_version = 0  # 환경설정이 바뀔 때마다 증가
+_cache: Dict[str, Tuple[int, Any]] = {}  # 환경설정 속성 이름: (읽은 시점의 버전, 값)
+_listeners: Dict[str, Callable[[str], None]] = {}  # 이름: 값이 바뀐 씬 속성 이름을 받는 함수
+
+def is_linked(scene_property: str) -> bool:
+    return scene_property in _linked
+
+def invalidate():
+    """환경설정 값 캐시 무효화 (다음 읽기 때 환경설정에서 다시 읽음)"""
+    global _version
+    _version += 1
+
+def add_listener(name: str, callback: Callable[[str], None]):
+    """연결된 씬 속성 값이 바뀌면 호출할 함수 등록 (같은 이름은 교체 - 모듈 리로드 대비)"""
+    _listeners[name] = callback
+
+def remove_listener(name: str):
+    _listeners.pop(name, None)
+
+def notify_changed(scene_property: str):
+    """씬 속성 값 변경(씬 재정의 또는 환경설정) 알림"""
+    for name, callback in list(_listeners.items()):
+        try:
+            callback(scene_property)
+        except Exception as e:
+            log.exception("Error in linked property listener %s: %s", name, e)
+
+def get_preference_value(pref_property: str, default: Any) -> Any:
+    """환경설정 값 (버전이 같으면 캐시된 값)"""
+    entry = _cache.get(pref_property)
+    if entry is not None and entry[0] == _version:
+        return entry[1]
+    version = _version
+    addon = bpy.context.preferences.addons.get(config.ADDON_ID)
+    value = getattr(addon.preferences, pref_property, default) if addon and addon.preferences else default
+    _cache[pref_property] = (version, value)
+    return value
+
+def has_override(scene: bpy.types.Scene, scene_property: str) -> bool:
+    return OVERRIDE_PREFIX + scene_property in scene
+
+def clear_override(scene: bpy.types.Scene, scene_property: str):
+    """씬의 재정의 값을 지워 다시 환경설정 값을 따르게 함"""
+    key = OVERRIDE_PREFIX + scene_property
+    if key in scene:
+        del scene[key]
+        notify_changed(scene_property)
+
+def remove_stale_copies(scenes) -> int:
+    """이전 복사 동기화 방식이 씬 속성 이름 그대로 남긴 ID 속성 삭제, 삭제한 수 반환
+
+    getter/setter 속성은 값을 저장하지 않으므로 같은 이름의 ID 속성은 쓰이지 않고 파일에만 남습니다.
+    씬에서 바꾼 값은 복사 방식에서도 다음 동기화 때 환경설정 값으로 덮였으므로 재정의로 옮기지 않습니다.
+    """
+    removed = 0
+    for scene in scenes:
+        if scene.library is not None:
+            continue  # 링크된 씬은 읽기 전용
+        for scene_property in _linked:
+            if scene_property in scene.keys():
+                del scene[scene_property]
+                removed += 1
+    if removed:
+        log.info("Removed %s stale scene properties left by preference copy sync", removed)
+    return removed
+
+def linked_scene_property(property_type: Callable, scene_property: str, pref_property: str,
+                          default: Any, **kwargs) -> Any:
+    """환경설정 pref_property를 따르는 씬 속성 정의 생성 (Property_Scene_<scene_property>에 할당)"""
+    _linked[scene_property] = (pref_property, default)
+    key = OVERRIDE_PREFIX + scene_property
+
+    def getter(self):
+        if key in self:
+            return self[key]
+        return get_preference_value(pref_property, default)
+
+    def setter(self, value):
+        self[key] = value
+        notify_changed(scene_property)
+
+    return property_type(default=default, get=getter, set=setter, **kwargs)
+
+def tag_redraw():
+    """환경설정 변경을 표시 중인 UI에 반영"""
+    window_manager = bpy.context.window_manager
+    if not window_manager:
+        return
+    for window in window_manager.windows:
+        for area in window.screen.areas:
+            area.tag_redraw()
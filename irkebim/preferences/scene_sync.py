@@ -0,0 +1,124 @@
+# irkebim/preferences/scene_sync.py
+# 환경설정 -> 씬 속성 동기화 스케줄러
+# 환경설정 변경은 속성별로 마지막 값만 모아 두었다가 타이머에서 한 번에 반영하고,
+# 창에 표시 중인 씬만 즉시 갱신합니다. 나머지 씬은 전환(msgbus)이나 파일 로드 시 갱신됩니다.
+import bpy
+from bpy.app.handlers import persistent
+from typing import Any, Dict, Iterable
+
+from ..utils import handlers
+from ..utils.logger import get_logger, span
+from . import linked_props
+
+log = get_logger(__name__)
+
+# 슬라이더 드래그 등 연속 변경을 모으는 시간 (초)
+FLUSH_INTERVAL = 0.05
+
+_pending: Dict[str, Any] = {}  # 씬 속성 이름: 아직 반영하지 않은 최신 값
+_values: Dict[str, Any] = {}  # 씬 속성 이름: 반영된 최신 값
+_versions: Dict[str, int] = {}  # 씬 속성 이름: 값이 바뀔 때마다 증가하는 버전
+_scene_versions: Dict[int, Dict[str, int]] = {}  # scene.session_uid: {씬 속성 이름: 적용된 버전}
+# 모듈을 다시 로드해도 같은 소유자로 기존 구독을 지울 수 있도록 유지
+_msgbus_owner = globals().get("_msgbus_owner") or object()
+
+def request_sync(scene_property: str, value: Any):
+    """값 변경 예약 - 같은 속성의 이전 예약은 덮어씀"""
+    _pending[scene_property] = value
+    if not bpy.app.timers.is_registered(_flush_tick):
+        bpy.app.timers.register(_flush_tick, first_interval=FLUSH_INTERVAL)
+
+def set_values(values: Dict[str, Any]):
+    """여러 속성 값을 한 번에 설정 (씬에는 flush 때 반영)"""
+    _pending.update(values)
+
+def _commit_pending():
+    for scene_property, value in _pending.items():
+        if scene_property in _values and _values[scene_property] == value:
+            continue
+        _values[scene_property] = value
+        _versions[scene_property] = _versions.get(scene_property, 0) + 1
+    _pending.clear()
+
+def get_active_scenes() -> list:
+    """창에 표시 중인 씬 (백그라운드 모드에서는 현재 컨텍스트 씬)"""
+    scenes = {}
+    window_manager = bpy.context.window_manager
+    if window_manager:
+        for window in window_manager.windows:
+            if window.scene:
+                scenes[window.scene.session_uid] = window.scene
+    scene = getattr(bpy.context, "scene", None)
+    if not scenes and scene:
+        scenes[scene.session_uid] = scene
+    return list(scenes.values())
+
+def sync_scene(scene: bpy.types.Scene) -> int:
+    """씬 하나를 최신 값으로 갱신 (이미 최신인 속성은 건너뜀), 갱신한 속성 수 반환"""
+    applied = _scene_versions.setdefault(scene.session_uid, {})
+    count = 0
+    for scene_property, version in _versions.items():
+        if applied.get(scene_property) == version:
+            continue
+        if hasattr(scene, scene_property):
+            setattr(scene, scene_property, _values[scene_property])
+            count += 1
+        applied[scene_property] = version
+    return count
+
+@span("scene_sync.flush")
+def flush(scenes: Iterable[bpy.types.Scene] = None) -> int:
+    """예약된 변경을 반영하고 지정한 씬(기본: 표시 중인 씬)을 갱신"""
+    _commit_pending()
+    count = 0
+    for scene in (get_active_scenes() if scenes is None else scenes):
+        count += sync_scene(scene)
+    log.debug("Synced %s scene properties", count)
+    return count
+
+def _flush_tick():
+    try:
+        flush()
+    except Exception as e:
+        log.exception("Error flushing preference sync: %s", e)
+    return None  # 다음 변경 요청 때 다시 등록
+
+def _on_scene_switch():
+    flush()
+
+def _subscribe_scene_switch():
+    # 파일을 열면 msgbus 구독이 지워지므로 load_post에서 다시 구독
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    bpy.msgbus.subscribe_rna(key=(bpy.types.Window, "scene"), owner=_msgbus_owner,
+                             args=(), notify=_on_scene_switch)
+
+@persistent
+def _on_load_post(dummy):
+    _scene_versions.clear()  # 새 파일의 씬은 아직 동기화되지 않음
+    linked_props.invalidate()  # 환경설정 파일이 다시 로드되었을 수 있음
+    linked_props.remove_stale_copies(bpy.data.scenes)
+    _subscribe_scene_switch()
+    flush()
+
+@persistent
+def _on_save_pre(dummy):
+    # 저장되는 파일은 모든 씬이 최신 값을 갖도록
+    flush(bpy.data.scenes)
+
+_HANDLERS = (
+    (bpy.app.handlers.load_post, _on_load_post),
+    (bpy.app.handlers.save_pre, _on_save_pre),
+)
+
+def register_handlers():
+    """파일 로드/저장 핸들러와 씬 전환 구독 등록"""
+    handlers.register(_HANDLERS)
+    _subscribe_scene_switch()
+
+def unregister_handlers():
+    handlers.unregister(_HANDLERS)
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    if bpy.app.timers.is_registered(_flush_tick):
+        bpy.app.timers.unregister(_flush_tick)
+    _pending.clear()
+    _scene_versions.clear()
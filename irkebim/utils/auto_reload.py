@@ -1,71 +1,74 @@
 import importlib
 import os
+import queue
+import select
+import struct
 import time
 import threading
 import sys
-from typing import List, Set, Optional
+from typing import Dict, List, Set, Optional
+
+import bpy
+
+from .logger import get_logger, span
+
+log = get_logger(__name__)
 
 # 전역 변수
 _running = False
 _thread = None
 
+# 연속 저장을 하나의 변경 묶음으로 합치는 대기 시간 (초)
+DEBOUNCE_SECONDS = 0.2
+# 파일 시스템 알림을 쓸 수 없을 때의 폴링 간격 (초)
+POLL_INTERVAL = 1.0
+# 메인 스레드에서 변경 묶음을 확인하는 간격 (초)
+TIMER_INTERVAL = 0.1
+
+# 감시 쓰레드 -> 메인 스레드 타이머로 전달되는 변경 묶음
+_change_queue: "queue.Queue[Set[str]]" = queue.Queue()
+
+# 프레임워크(test.py)가 블렌더를 실행하며 핫 리로드를 맡을 때 설정되는 환경 변수 이름 접미사
+# (IRKEBIM_FRAMEWORK_RELOAD) - 이 경우 같은 저장을 두 번 리로드하지 않도록 자체 감시를 켜지 않음
+FRAMEWORK_RELOAD_ENV_SUFFIX = "_FRAMEWORK_RELOAD"
+
+# 전체 리로드 시 다시 로드할 패키지
+WATCHED_PACKAGES = ["operators", "panels", "preferences"]
+# ModuleManager가 없을 때 사용하는 탐색 인덱스
+_discovery = None
+
+def get_discovery_index():
+    """ModuleManager와 공유하는 모듈 탐색 인덱스 (관리자가 없으면 직접 생성)"""
+    global _discovery
+    package_name, root_dir = _get_package_root()
+    manager = getattr(sys.modules.get(package_name), "manager", None)
+    if manager is not None and hasattr(manager, "get_discovery_index"):
+        return manager.get_discovery_index()
+    
+    if _discovery is None:
+        from .discovery import load_index
+        _discovery = load_index(root_dir, package_name)
+    else:
+        _discovery.refresh()
+    return _discovery
+
 def get_modules_to_watch() -> List[str]:
-    """감시할 모듈 목록을 자동으로 생성"""
+    """감시할 모듈 목록을 자동으로 생성 (하위 패키지 포함)"""
     try:
-        print("Auto-reload: Getting modules to watch")
-        # 현재 모듈의 패키지 이름 추출
-        package_name = __package__
-        if not package_name:
-            # __package__가 비어있으면 파일 경로에서 추론
-            current_dir = os.path.dirname(os.path.dirname(__file__))
-            package_name = os.path.basename(current_dir)
-            print(f"Package name from path: {package_name}")
-        elif "." in package_name:
-            # utils.auto_reload 같은 형태면 루트 패키지만 사용
-            package_name = package_name.split(".")[0]
-            print(f"Root package name: {package_name}")
-        
-        # 패키지 루트 디렉토리 찾기
-        if package_name in sys.modules:
-            root_module = sys.modules[package_name]
-            if hasattr(root_module, "__file__"):
-                current_dir = os.path.dirname(os.path.abspath(root_module.__file__))
-                print(f"Root dir from module: {current_dir}")
-            else:
-                current_dir = os.path.dirname(os.path.dirname(__file__))
-                print(f"Root dir from current file: {current_dir}")
-        else:
-            current_dir = os.path.dirname(os.path.dirname(__file__))
-            print(f"Root dir from current file (fallback): {current_dir}")
-        
-        modules_to_watch = []
-        
-        # 하위 폴더 검색
-        for folder in ["operators", "panels", "preferences"]:
-            folder_path = os.path.join(current_dir, folder)
-            if os.path.isdir(folder_path):
-                print(f"Checking folder: {folder_path}")
-                for filename in os.listdir(folder_path):
-                    if filename.endswith(".py") and not filename.startswith("__"):
-                        module_name = f".{folder}.{filename[:-3]}"
-                        modules_to_watch.append(module_name)
-                        print(f"Added module to watch: {module_name}")
-            else:
-                print(f"Folder not found: {folder_path}")
-        
-        print(f"Total modules to watch: {len(modules_to_watch)}")
+        log.debug("Auto-reload: Getting modules to watch")
+        index = get_discovery_index()
+        modules_to_watch = [f".{key}" for package in WATCHED_PACKAGES for key in index.iter_modules(package)]
+        log.debug("Total modules to watch: %s", len(modules_to_watch))
         return modules_to_watch
     except Exception as e:
-        print(f"Error finding modules to watch: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Error finding modules to watch: %s", e)
         # 오류 발생 시 기본 모듈 목록 반환
         basic_modules = [
             ".operators.cube",
             ".panels.panel_main",
             ".preferences.default_values"
         ]
-        print(f"Using basic module list: {basic_modules}")
+        log.debug("Using basic module list: %s", basic_modules)
         return basic_modules
 
 # 감시할 모듈 목록 (지연 초기화)
@@ -78,134 +81,248 @@ def get_watched_modules() -> List[str]:
         WATCHED_MODULES = get_modules_to_watch()
     return WATCHED_MODULES
 
-def reload_modules():
-    """모듈을 다시 로드"""
-    print("♻️ [AutoReload] Reloading modules...")
+def _get_package_root() -> tuple:
+    """(루트 패키지 이름, 루트 패키지 폴더) 반환"""
+    package_name = (__package__ or "irkebim").split(".")[0]
+    root_module = sys.modules.get(package_name)
+    if root_module is not None and getattr(root_module, "__file__", None):
+        return package_name, os.path.dirname(os.path.abspath(root_module.__file__))
+    return package_name, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@span("auto_reload.reload_modules")
+def reload_modules(changed_paths: Optional[Set[str]] = None):
+    """모듈을 다시 로드
+    
+    변경된 파일 목록이 주어지면 해당 모듈과 이를 임포트하는 모듈만
+    의존성 순서대로 다시 로드하고, 없으면 감시 목록 전체를 다시 로드합니다.
+    """
+    package_name, root_dir = _get_package_root()
+    manager = getattr(sys.modules.get(package_name), "manager", None)
+    
+    if changed_paths and manager is not None and hasattr(manager, "reload_changed"):
+        from .import_graph import module_name_from_path
+        manager.invalidate_import_graph(changed_paths)
+        module_names = sorted({module_name_from_path(os.path.abspath(path), root_dir, package_name)
+                               for path in changed_paths})
+        log.info("♻️ [AutoReload] Changed modules: %s", ", ".join(module_names))
+        if not manager.reload_changed(module_names):
+            log.warning("⚠️ [AutoReload] Core modules changed, disable and re-enable the add-on to apply")
+        return
+    
+    log.debug("♻️ [AutoReload] Reloading modules...")
     
     # 모듈 목록 가져오기
     modules_to_reload = get_watched_modules()
     success_count = 0
     error_count = 0
     
-    # 패키지 이름 찾기
-    package_name = __package__ or "irkebim"
-    if "." in package_name:
-        # utils.auto_reload 같은 형태면 루트 패키지만 사용
-        package_name = package_name.split(".")[0]
-    
-    print(f"Using package name for reloading: {package_name}")
+    log.debug("Using package name for reloading: %s", package_name)
     
     # 모듈 리로드
     for modname in modules_to_reload:
         try:
             full_name = package_name + modname  # irkebim.operators.cube
-            print(f"Reloading module: {full_name}")
+            log.debug("Reloading module: %s", full_name)
             module = importlib.import_module(full_name)
             importlib.reload(module)
             success_count += 1
         except ImportError as e:
-            print(f"❌ [AutoReload] Failed to reload {modname}: {e}")
+            log.error("❌ [AutoReload] Failed to reload %s: %s", modname, e)
             error_count += 1
         except Exception as e:
-            print(f"❌ [AutoReload] Error reloading {modname}: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("❌ [AutoReload] Error reloading %s: %s", modname, e)
             error_count += 1
     
-    print(f"✅ [AutoReload] Reloaded {success_count} modules, {error_count} failed")
+    log.info("✅ [AutoReload] Reloaded %s modules, %s failed", success_count, error_count)
+
+def is_framework_reload_active() -> bool:
+    """프레임워크가 변경 파일을 동기화하고 리로드를 보내는 중인지 여부"""
+    package_name, _ = _get_package_root()
+    return os.environ.get(package_name.upper() + FRAMEWORK_RELOAD_ENV_SUFFIX) == "1"
 
 def _get_monitored_paths() -> Set[str]:
-    """감시할 모든 파일 경로 세트 가져오기"""
+    """감시할 폴더 세트 (패키지 루트 전체 - 임포트 그래프가 영향 범위를 결정)"""
     try:
-        # 패키지 이름 찾기
-        package_name = __package__ or "irkebim"
-        if "." in package_name:
-            # utils.auto_reload 같은 형태면 루트 패키지만 사용
-            package_name = package_name.split(".")[0]
-        
-        # 패키지 루트 디렉토리 찾기
-        current_dir = None
-        if package_name in sys.modules:
-            root_module = sys.modules[package_name]
-            if hasattr(root_module, "__file__"):
-                current_dir = os.path.dirname(os.path.abspath(root_module.__file__))
-        
-        if current_dir is None:
-            current_dir = os.path.dirname(os.path.dirname(__file__))
-        
-        paths = set()
-        
-        # 하위 폴더 추가
-        for folder in ["operators", "panels", "preferences"]:
-            folder_path = os.path.join(current_dir, folder)
-            if os.path.isdir(folder_path):
-                paths.add(folder_path)
-        
-        return paths
+        _, root_dir = _get_package_root()
+        return {root_dir} if os.path.isdir(root_dir) else set()
     except Exception as e:
-        print(f"[AutoReload] Error finding folders to monitor: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("[AutoReload] Error finding folders to monitor: %s", e)
+        return set()
+
+class InotifyWatcher:
+    """리눅스 inotify 기반 폴더 감시 (ctypes 사용, 하위 폴더 포함)"""
+    
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    EVENT_HEADER = struct.Struct("iIII")
+    
+    def __init__(self, folders: Set[str]):
+        import ctypes
+        import ctypes.util
         
-        # 오류 발생 시 현재 디렉토리 기준으로 경로 찾기 시도
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._watches: Dict[int, str] = {}
+        for folder in folders:
+            self._add_tree(folder)
+    
+    def _add_tree(self, folder: str):
+        for root, dirs, _ in os.walk(folder):
+            dirs[:] = [d for d in dirs if d != "__pycache__" and not d.startswith(".")]
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(root), self.WATCH_MASK)
+            if wd >= 0:
+                self._watches[wd] = root
+    
+    def read_changes(self, timeout: float) -> Set[str]:
+        """timeout 동안 이벤트를 기다려 변경된 .py 파일 경로 반환"""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
         try:
-            current_dir = os.path.dirname(os.path.dirname(__file__))
-            paths = set()
-            for folder in ["operators", "panels", "preferences"]:
-                folder_path = os.path.join(current_dir, folder)
-                if os.path.isdir(folder_path):
-                    paths.add(folder_path)
-            return paths
-        except:
-            # 모든 방법이 실패하면 빈 세트 반환
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
             return set()
+        
+        changed = set()
+        offset = 0
+        while offset + self.EVENT_HEADER.size <= len(data):
+            wd, mask, _, name_len = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = data[offset:offset + name_len].rstrip(b"\0").decode("utf-8", "replace")
+            offset += name_len
+            
+            folder = self._watches.get(wd)
+            if mask & self.IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            if folder is None or not name:
+                continue
+            path = os.path.join(folder, name)
+            if mask & self.IN_ISDIR:
+                # 새로 생긴 폴더도 감시 대상에 추가
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    self._add_tree(path)
+                    changed.update(_snapshot_folder(path))
+            elif name.endswith(".py"):
+                changed.add(path)
+        return changed
+    
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+class PollingWatcher:
+    """알림을 쓸 수 없는 플랫폼용 폴링 감시
+
+    탐색 인덱스로 바뀐 폴더만 다시 나열하고 파일 mtime을 비교합니다.
+    감시 쓰레드 전용 인덱스를 사용하여 메인 스레드의 인덱스와 충돌하지 않습니다.
+    """
+    
+    def __init__(self, folders: Set[str]):
+        from .discovery import DiscoveryIndex
+        package_name, _ = _get_package_root()
+        self.indexes = [DiscoveryIndex(folder, package_name) for folder in sorted(folders)]
+        for index in self.indexes:
+            index.refresh()
+    
+    def read_changes(self, timeout: float) -> Set[str]:
+        time.sleep(max(timeout, POLL_INTERVAL))
+        changed = set()
+        for index in self.indexes:
+            changed |= index.refresh(check_files=True)
+        return changed
+    
+    def close(self):
+        pass
+
+def _snapshot_folder(folder: str) -> Dict[str, int]:
+    """폴더 아래 모든 .py 파일의 {경로: mtime}"""
+    mtimes = {}
+    for root, dirs, files in os.walk(folder):
+        dirs[:] = [d for d in dirs if d != "__pycache__" and not d.startswith(".")]
+        for filename in files:
+            if filename.endswith(".py"):
+                path = os.path.join(root, filename)
+                try:
+                    mtimes[path] = os.stat(path).st_mtime_ns
+                except FileNotFoundError:
+                    continue
+    return mtimes
+
+def _create_watcher(folders: Set[str]):
+    """가능하면 inotify, 아니면 폴링 감시 생성"""
+    if sys.platform.startswith("linux"):
+        try:
+            watcher = InotifyWatcher(folders)
+            log.info("👀 [AutoReload] Using inotify file notifications")
+            return watcher
+        except (OSError, AttributeError) as e:
+            log.warning("[AutoReload] inotify not available (%s), falling back to polling", e)
+    return PollingWatcher(folders)
 
 def _watch():
-    """파일 변경 감시 쓰레드"""
-    last_mtime = {}
+    """파일 변경 감시 쓰레드 - 변경 묶음을 큐에 넣기만 하고 리로드는 하지 않음"""
     global _running
     
-    # 초기 경로 설정
     monitored_paths = _get_monitored_paths()
-    print(f"👀 [AutoReload] Watching folders: {monitored_paths}")
+    log.debug("👀 [AutoReload] Watching folders: %s", monitored_paths)
+    watcher = _create_watcher(monitored_paths)
     
-    while _running:
-        time.sleep(0.5)
-        
-        # 변경감지 코드 예외처리
-        try:
-            # 매 반복마다 경로 갱신 (폴더가 생성될 수 있음)
-            if not monitored_paths:
-                monitored_paths = _get_monitored_paths()
-                if monitored_paths:
-                    print(f"👀 [AutoReload] Found folders to watch: {monitored_paths}")
-            
-            for path in monitored_paths:
-                if not os.path.exists(path):
+    try:
+        while _running:
+            try:
+                changed = watcher.read_changes(0.5)
+                if not changed:
                     continue
-                    
-                for filename in os.listdir(path):
-                    if filename.endswith(".py") and not filename.startswith("__"):
-                        filepath = os.path.join(path, filename)
-                        try:
-                            mtime = os.path.getmtime(filepath)
-                            
-                            if filepath not in last_mtime:
-                                last_mtime[filepath] = mtime
-                            elif last_mtime[filepath] != mtime:
-                                last_mtime[filepath] = mtime
-                                print(f"🔁 [AutoReload] Detected change in {filepath}")
-                                reload_modules()
-                                break
-                        except FileNotFoundError:
-                            continue
+                
+                # 연속 저장이 멈출 때까지 모아서 한 번에 전달
+                while _running:
+                    more = watcher.read_changes(DEBOUNCE_SECONDS)
+                    if not more:
+                        break
+                    changed |= more
+                
+                for path in sorted(changed):
+                    log.info("🔁 [AutoReload] Detected change in %s", path)
+                _change_queue.put(changed)
+            except Exception as e:
+                log.exception("[AutoReload] Error in file watcher: %s", e)
+                
+                # 짧은 대기 후 계속
+                time.sleep(1)
+    finally:
+        watcher.close()
+
+def _process_changes() -> Optional[float]:
+    """bpy.app.timers 콜백 - 메인 스레드에서 대기 중인 변경을 리로드"""
+    if not _running:
+        return None
+    
+    changed = set()
+    while True:
+        try:
+            changed |= _change_queue.get_nowait()
+        except queue.Empty:
+            break
+    
+    if changed:
+        try:
+            reload_modules(changed)
         except Exception as e:
-            print(f"[AutoReload] Error in file watcher: {e}")
-            import traceback
-            traceback.print_exc()
-            
-            # 짧은 대기 후 계속
-            time.sleep(1)
+            log.exception("❌ [AutoReload] Reload failed: %s", e)
+    return TIMER_INTERVAL
 
 def start_watchdog():
     """파일 변경 감시 시작"""
@@ -213,7 +330,12 @@ def start_watchdog():
     
     # 이미 실행 중이면 중복 시작 방지
     if _thread and _thread.is_alive():
-        print("[AutoReload] Watcher already running")
+        log.info("[AutoReload] Watcher already running")
+        return
+    
+    # 프레임워크가 같은 폴더를 동기화하며 바뀐 모듈을 직접 리로드하므로 감시하지 않음
+    if is_framework_reload_active():
+        log.info("[AutoReload] Framework hot reload is active, add-on watcher not started")
         return
     
     # 초기화가 필요하면 수행
@@ -223,20 +345,29 @@ def start_watchdog():
         _running = True
         _thread = threading.Thread(target=_watch, daemon=True)
         _thread.start()
-        print("🚀 [AutoReload] Watcher started.")
+        if not bpy.app.timers.is_registered(_process_changes):
+            bpy.app.timers.register(_process_changes, first_interval=TIMER_INTERVAL, persistent=True)
+        log.info("🚀 [AutoReload] Watcher started.")
     except Exception as e:
-        print(f"❌ [AutoReload] Failed to start watcher: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("❌ [AutoReload] Failed to start watcher: %s", e)
         _running = False
 
 def stop_watchdog():
     """파일 변경 감시 중지"""
-    global _running
+    global _running, _thread
     
     if _running:
         _running = False
-        print("🛑 [AutoReload] Watcher stopped.")
-        
-    # 스레드가 완전히 종료될 시간 부여
-    time.sleep(0.1)
\ No newline at end of file
+        log.info("🛑 [AutoReload] Watcher stopped.")
+    
+    if bpy.app.timers.is_registered(_process_changes):
+        bpy.app.timers.unregister(_process_changes)
+    
+    # 쓰레드가 select 대기에서 빠져나올 때까지 잠시 기다림
+    if _thread and _thread.is_alive() and _thread is not threading.current_thread():
+        _thread.join(timeout=1.0)
+    _thread = None
+    
+    # 처리되지 않은 변경은 버림
+    while not _change_queue.empty():
+        _change_queue.get_nowait()
@@ -0,0 +1,286 @@
+# irkebim/utils/class_scan.py
+# 모듈을 임포트하지 않고 AST로 Blender 클래스/속성 정의를 분석
+# 주의: 이 모듈은 표준 라이브러리만 사용 (bpy 및 상대 임포트 없음, framework.py에서도 로드)
+import ast
+import json
+import logging
+import os
+from typing import Dict, Iterable, Optional
+
+# 애드온 안에서는 irkebim 로거의 하위 로거 (logger.py 설정을 따름)
+log = logging.getLogger(__name__)
+
+# 릴리스 빌드에 미리 계산되어 포함되는 메타데이터 파일
+METADATA_FILENAME = "class_metadata.json"
+METADATA_VERSION = 2
+
+# 릴리스에서 동적 탐색 대신 사용하는 등록 매니페스트
+REGISTRATION_MANIFEST_FILENAME = "registration_manifest.json"
+
+# 지연 로딩 셸로 대신할 수 있는 기반 클래스
+LAZY_BASES = ("Operator", "Panel")
+# 첫 호출 시 실제 구현을 불러오는 메서드
+LAZY_METHODS = ("execute", "invoke", "modal", "draw", "draw_header", "cancel", "check")
+# 셸에서 update/get/set 콜백으로 대신 넘길 수 있는 모듈 함수의 인자 수
+LAZY_CALLBACK_ARGS = (1, 2, 3)
+
+def _base_name(node: ast.expr) -> str:
+    """bpy.types.Operator, types.Operator, Operator -> Operator"""
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Name):
+        return node.id
+    return ""
+
+def _type_references(node: ast.AST) -> set:
+    """노드 안의 type=클래스 키워드 인자 (PointerProperty, CollectionProperty)"""
+    references = set()
+    for call in ast.walk(node):
+        if isinstance(call, ast.Call):
+            for keyword in call.keywords:
+                if keyword.arg == "type" and isinstance(keyword.value, (ast.Name, ast.Attribute)):
+                    references.add(_base_name(keyword.value))
+    return references
+
+def _free_names(node: ast.AST) -> list:
+    """식이 읽는 이름 (bpy.props.IntProperty -> bpy)"""
+    return sorted({name.id for name in ast.walk(node) if isinstance(name, ast.Name)})
+
+def _scan_class(node: ast.ClassDef) -> dict:
+    info = {
+        "name": node.name,
+        "bases": [_base_name(base) for base in node.bases],
+        "base_paths": [ast.unparse(base) for base in node.bases],
+        "attributes": {},  # 이름: 리터럴 소스 (ast.literal_eval로 복원)
+        "methods": [],
+        "annotations": [],
+        "annotation_sources": {},  # 이름: 속성 정의 소스 (셸에서 모듈 상수/임포트로 평가)
+        "annotation_names": [],  # 속성 정의 소스가 읽는 이름
+        "dynamic": [],  # 리터럴이 아닌 클래스 속성
+        "references": sorted(_type_references(node)),  # PointerProperty(type=...) 등으로 참조하는 클래스
+    }
+    for item in node.body:
+        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            info["methods"].append(item.name)
+        elif isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
+            info["annotations"].append(item.target.id)
+            info["annotation_sources"][item.target.id] = ast.unparse(item.annotation)
+            info["annotation_names"] = sorted(set(info["annotation_names"]) | set(_free_names(item.annotation)))
+        elif isinstance(item, ast.Assign):
+            for target in item.targets:
+                if not isinstance(target, ast.Name):
+                    continue
+                try:
+                    ast.literal_eval(item.value)
+                    info["attributes"][target.id] = ast.unparse(item.value)
+                except ValueError:
+                    info["dynamic"].append(target.id)
+    return info
+
+def _unresolved_names(names: Iterable[str], module_info: dict) -> list:
+    """셸에서 평가할 수 없는 이름 (bpy, 리터럴 상수, 임포트한 이름, 콜백으로 넘길 함수만 가능)"""
+    functions = module_info["functions"]
+    return [name for name in names
+            if name != "bpy" and name not in module_info["constants"] and name not in module_info["imports"] and
+            functions.get(name) not in LAZY_CALLBACK_ARGS]
+
+def _lazy_blocker(module_info: dict) -> Optional[str]:
+    """모듈을 지연 로딩할 수 없는 이유 (가능하면 None)"""
+    if not module_info["classes"]:
+        return "defines no classes"
+    unresolved = _unresolved_names(module_info["call_names"], module_info)
+    if unresolved:
+        return f"module-level calls reference {', '.join(unresolved)}"
+    for attribute in module_info["properties"]:
+        unresolved = _unresolved_names(module_info["property_names"][attribute], module_info)
+        if unresolved:
+            return f"{attribute} references {', '.join(unresolved)}"
+    for info in module_info["classes"]:
+        if not any(base in LAZY_BASES for base in info["bases"]) or len(info["bases"]) != 1:
+            return f"{info['name']} is not a plain Operator/Panel"
+        unresolved = _unresolved_names(info["annotation_names"], module_info)
+        if unresolved:
+            return f"{info['name']} property annotations reference {', '.join(unresolved)}"
+        if info["dynamic"]:
+            return f"{info['name']} has non-literal attributes ({', '.join(info['dynamic'])})"
+        if "bl_idname" not in info["attributes"] and info["bases"][0] == "Operator":
+            return f"{info['name']} has no literal bl_idname"
+    return None
+
+def _callback_args(node: ast.FunctionDef) -> Optional[int]:
+    """위치 인자만 받는 함수의 인자 수 (기본값/가변 인자가 있으면 None)"""
+    arguments = node.args
+    if (arguments.vararg or arguments.kwarg or arguments.kwonlyargs or arguments.defaults or
+            arguments.posonlyargs):
+        return None
+    return len(arguments.args)
+
+def scan_source(source: str) -> dict:
+    """모듈 소스의 최상위 클래스와 Property_ 정의 분석"""
+    tree = ast.parse(source)
+    module_info = {
+        "classes": [],
+        "properties": [],
+        "property_sources": {},  # Property_ 이름: 정의 소스
+        "property_names": {},  # Property_ 이름: 정의 소스가 읽는 이름
+        "constants": {},  # 리터럴 상수 이름: 소스
+        "functions": {},  # 함수 이름: 위치 인자 수 (콜백으로 넘길 수 없으면 None)
+        "imports": {},  # 임포트한 이름: [모듈, 속성 이름(모듈 자체면 None), 상대 임포트 수준]
+        "calls": [],  # 최상위 호출문 소스 (셸에서 다시 실행, 실제 임포트 때 한 번 더 실행되므로 등록처럼 반복해도 되는 호출)
+        "call_names": [],  # 최상위 호출문이 읽는 이름
+        "bpy_type_names": [],
+    }
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and not node.name.startswith("_"):
+            module_info["classes"].append(_scan_class(node))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            module_info["functions"][node.name] = _callback_args(node) if isinstance(node, ast.FunctionDef) else None
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if not isinstance(target, ast.Name):
+                    continue
+                if target.id.startswith("Property_"):
+                    module_info["properties"].append(target.id)
+                    module_info["property_sources"][target.id] = ast.unparse(node.value)
+                    module_info["property_names"][target.id] = _free_names(node.value)
+                else:
+                    try:
+                        ast.literal_eval(node.value)
+                        module_info["constants"][target.id] = ast.unparse(node.value)
+                    except ValueError:
+                        pass
+        elif isinstance(node, ast.Expr) and isinstance(node.value, ast.Call):
+            module_info["calls"].append(ast.unparse(node.value))
+            module_info["call_names"] = sorted(set(module_info["call_names"]) | set(_free_names(node.value)))
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                # import a.b는 a를, import a.b as c는 a.b를 묶음
+                name = alias.asname or alias.name.split(".")[0]
+                module_info["imports"][name] = [alias.name if alias.asname else name, None, 0]
+        elif isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                module_info["imports"][alias.asname or alias.name] = [node.module or "", alias.name, node.level]
+            if node.module == "bpy.types":
+                # from bpy.types import AddonPreferences
+                module_info["bpy_type_names"].extend(alias.asname or alias.name for alias in node.names)
+    module_info["lazy_blocker"] = _lazy_blocker(module_info)
+    return module_info
+
+def scan_file(file_path: str) -> dict:
+    with open(file_path, "r", encoding="utf-8") as f:
+        return scan_source(f.read())
+
+def scan_modules(files: Iterable[tuple]) -> Dict[str, dict]:
+    """(모듈 키, 파일 경로) 목록을 분석하여 {모듈 키: 분석 결과} 반환"""
+    metadata = {}
+    for key, file_path in files:
+        try:
+            metadata[key] = scan_file(file_path)
+        except (SyntaxError, UnicodeDecodeError, OSError) as e:
+            log.warning("Class scan: could not scan %s: %s", file_path, e)
+    return metadata
+
+def to_dict(metadata: Dict[str, dict]) -> dict:
+    return {"version": METADATA_VERSION, "modules": metadata}
+
+def load_metadata(base_dir: str) -> Optional[Dict[str, dict]]:
+    """릴리스에 포함된 메타데이터 읽기 (없으면 None)"""
+    path = os.path.join(base_dir, METADATA_FILENAME)
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == METADATA_VERSION:
+            return data["modules"]
+    except (OSError, ValueError, KeyError) as e:
+        log.warning("Class scan: could not load %s: %s", path, e)
+    return None
+
+# 등록 순서 (registration.sort_classes와 동일: 연산자 -> 기타 -> 설정 -> 패널)
+_KIND_ORDER = {"Operator": 0, "AddonPreferences": 2, "Panel": 3}
+
+def _resolve_kind(info: dict, module_info: dict, local_kinds: Dict[str, str]) -> Optional[str]:
+    """클래스가 상속하는 bpy.types 기반 클래스 이름 (Blender 클래스가 아니면 None)"""
+    for name, path in zip(info["bases"], info["base_paths"]):
+        if path.startswith("bpy.types.") or path.startswith("types.") or name in module_info["bpy_type_names"]:
+            return name
+        if name in local_kinds:
+            return local_kinds[name]
+    return None
+
+def build_registration_manifest(metadata: Dict[str, dict]) -> dict:
+    """정적 분석 결과로 등록할 클래스(의존성 순서)와 속성 목록 생성
+
+    PointerProperty/CollectionProperty의 type= 으로 참조되는 클래스는 참조하는
+    클래스보다 먼저, 하위 패널(bl_parent_id)은 부모 패널 다음에 등록됩니다.
+    """
+    classes = []
+    for key in sorted(metadata):
+        module_info = metadata[key]
+        local_kinds = {}
+        for position, info in enumerate(module_info["classes"]):
+            kind = _resolve_kind(info, module_info, local_kinds)
+            if kind is None:
+                continue
+            # 같은 모듈의 기반 클래스도 먼저 등록되어야 함
+            local_bases = [name for name in info["bases"] if name in local_kinds]
+            local_kinds[info["name"]] = kind
+            parent = info["attributes"].get("bl_parent_id")
+            classes.append({
+                "module": key,
+                "name": info["name"],
+                "kind": kind,
+                "bl_idname": ast.literal_eval(info["attributes"]["bl_idname"]) if "bl_idname" in info["attributes"] else None,
+                "parent": ast.literal_eval(parent) if parent else None,
+                "references": info["references"] + local_bases,
+                "position": position,
+            })
+
+    # 범주 순으로 나열한 뒤 참조/부모 관계를 만족하도록 위상 정렬
+    classes.sort(key=lambda entry: (_KIND_ORDER.get(entry["kind"], 1), entry["module"], entry["position"]))
+    by_name = {entry["name"]: entry for entry in classes}
+    by_idname = {entry["bl_idname"]: entry for entry in classes if entry["bl_idname"]}
+    ordered, visiting, done = [], set(), set()
+
+    def visit(entry):
+        key = (entry["module"], entry["name"])
+        if key in done or key in visiting:
+            return
+        visiting.add(key)
+        dependencies = [by_name[name] for name in entry["references"] if name in by_name]
+        if entry["parent"]:
+            parent = by_idname.get(entry["parent"]) or by_name.get(entry["parent"])
+            if parent:
+                dependencies.append(parent)
+        for dependency in dependencies:
+            visit(dependency)
+        visiting.discard(key)
+        done.add(key)
+        ordered.append({"module": entry["module"], "name": entry["name"], "kind": entry["kind"]})
+
+    for entry in classes:
+        visit(entry)
+
+    properties = []
+    for key in sorted(metadata):
+        for attribute in metadata[key]["properties"]:
+            parts = attribute.split("_", 2)  # Property_Owner_PropertyName
+            if len(parts) >= 3:
+                properties.append({"module": key, "attribute": attribute, "owner": parts[1], "name": parts[2]})
+
+    return {"version": METADATA_VERSION, "classes": ordered, "properties": properties}
+
+def load_registration_manifest(base_dir: str) -> Optional[dict]:
+    """릴리스에 포함된 등록 매니페스트 읽기 (없으면 None)"""
+    path = os.path.join(base_dir, REGISTRATION_MANIFEST_FILENAME)
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") == METADATA_VERSION:
+            return manifest
+    except (OSError, ValueError) as e:
+        log.warning("Class scan: could not load %s: %s", path, e)
+    return None
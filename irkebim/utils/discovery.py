@@ -0,0 +1,216 @@
+# irkebim/utils/discovery.py
+# 패키지 모듈 탐색 인덱스 - ModuleManager, auto_reload, 임포트 그래프가 함께 사용
+# 주의: 이 모듈은 표준 라이브러리만 사용 (bpy 및 상대 임포트 없음, framework.py에서도 로드)
+import json
+import logging
+import os
+from typing import Dict, Iterable, List, Optional, Set
+
+# 애드온 안에서는 irkebim 로거의 하위 로거 (logger.py 설정을 따름)
+log = logging.getLogger(__name__)
+
+# 릴리스 빌드에 미리 계산되어 포함되는 인덱스 파일
+INDEX_FILENAME = "discovery_index.json"
+INDEX_VERSION = 1
+
+def _is_skipped_dir(name: str) -> bool:
+    return name == "__pycache__" or name.startswith(".")
+
+def module_key_from_path(rel_path: str) -> str:
+    """패키지 기준 상대 경로를 모듈 키로 변환 (operators/cube.py -> operators.cube, operators/__init__.py -> operators)"""
+    parts = [part for part in rel_path.replace("\\", "/").split("/") if part]
+    parts[-1] = parts[-1][:-3]
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    return ".".join(parts)
+
+class DiscoveryIndex:
+    """패키지 안의 모든 모듈(하위 패키지 포함)과 경로, mtime 인덱스
+
+    폴더 mtime이 바뀐 폴더만 다시 나열하므로 갱신 비용은 폴더 수에 비례합니다.
+    frozen 인덱스(릴리스에 포함된 인덱스)는 파일 시스템을 전혀 조회하지 않습니다.
+    """
+
+    def __init__(self, base_dir: str, root_package: str, frozen: bool = False):
+        self.base_dir = base_dir
+        self.root_package = root_package
+        self.frozen = frozen
+        self.modules: Dict[str, list] = {}  # 모듈 키: [상대 경로, mtime_ns]
+        self.dirs: Dict[str, int] = {}  # 상대 폴더 경로: mtime_ns
+
+    # 조회
+    def iter_modules(self, package: str = "", include_packages: bool = False) -> List[str]:
+        """package 아래의 모든 모듈 키 (하위 패키지 포함, 이름순)"""
+        prefix = f"{package}." if package else ""
+        keys = []
+        for key, (rel_path, _) in self.modules.items():
+            if key == package or not key.startswith(prefix):
+                continue
+            if not include_packages and os.path.basename(rel_path).startswith("__"):
+                continue
+            keys.append(key)
+        return sorted(keys)
+
+    def has_package(self, package: str) -> bool:
+        return package.replace(".", "/") in self.dirs
+
+    def get_path(self, key: str) -> Optional[str]:
+        entry = self.modules.get(key)
+        return os.path.join(self.base_dir, entry[0]) if entry else None
+
+    def get_folders(self) -> List[str]:
+        return [os.path.join(self.base_dir, rel_dir) if rel_dir else self.base_dir for rel_dir in sorted(self.dirs)]
+
+    def iter_files(self):
+        """(모듈 키, 절대 경로) 목록"""
+        for key in sorted(self.modules):
+            yield key, os.path.join(self.base_dir, self.modules[key][0])
+
+    # 갱신
+    def _list_dir(self, rel_dir: str) -> List[str]:
+        """폴더 하나를 나열하여 파일 항목을 갱신하고 하위 폴더 목록 반환"""
+        folder = os.path.join(self.base_dir, rel_dir)
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        subdirs = []
+        found = set()
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not _is_skipped_dir(entry.name):
+                        subdirs.append(prefix + entry.name)
+                elif entry.name.endswith(".py"):
+                    rel_path = prefix + entry.name
+                    key = module_key_from_path(rel_path)
+                    found.add(key)
+                    if key not in self.modules:
+                        self.modules[key] = [rel_path, entry.stat().st_mtime_ns]
+
+        # 폴더에서 사라진 파일 제거
+        for key in [key for key, (rel_path, _) in self.modules.items()
+                    if os.path.dirname(rel_path) == rel_dir and key not in found]:
+            del self.modules[key]
+        return subdirs
+
+    def _add_tree(self, rel_dir: str, changed: Set[str]):
+        pending = [rel_dir]
+        while pending:
+            current = pending.pop()
+            try:
+                self.dirs[current] = os.stat(os.path.join(self.base_dir, current)).st_mtime_ns
+                before = set(self.modules)
+                pending.extend(self._list_dir(current))
+            except OSError:
+                continue
+            changed.update(self.get_path(key) for key in set(self.modules) - before)
+
+    def _remove_tree(self, rel_dir: str, changed: Set[str]):
+        prefix = f"{rel_dir}/"
+        for other in [other for other in self.dirs if other == rel_dir or other.startswith(prefix)]:
+            del self.dirs[other]
+        for key in [key for key, (rel_path, _) in self.modules.items() if rel_path.startswith(prefix)]:
+            changed.add(self.get_path(key))
+            del self.modules[key]
+
+    def refresh(self, check_files: bool = False) -> Set[str]:
+        """바뀐 폴더만 다시 나열하여 인덱스 갱신
+
+        추가/삭제된 모듈 파일의 절대 경로를 반환합니다. check_files가 True이면
+        각 파일의 mtime도 확인하여 수정된 파일을 함께 반환합니다.
+        """
+        changed = set()
+        if self.frozen:
+            return changed
+        if not self.dirs:
+            self._add_tree("", changed)
+            return changed
+
+        for rel_dir in sorted(self.dirs):
+            if rel_dir not in self.dirs:
+                continue  # 상위 폴더와 함께 이미 제거됨
+            try:
+                mtime = os.stat(os.path.join(self.base_dir, rel_dir)).st_mtime_ns
+            except OSError:
+                self._remove_tree(rel_dir, changed)
+                continue
+            if mtime == self.dirs[rel_dir]:
+                continue
+
+            self.dirs[rel_dir] = mtime
+            before = {key: entry[0] for key, entry in self.modules.items()}
+            for subdir in self._list_dir(rel_dir):
+                if subdir not in self.dirs:
+                    self._add_tree(subdir, changed)
+            changed.update(os.path.join(self.base_dir, rel_path)
+                           for key, rel_path in before.items() if key not in self.modules)
+            changed.update(self.get_path(key) for key in set(self.modules) - set(before))
+            # 폴더 안에서 사라진 하위 폴더 제거
+            for other in [other for other in self.dirs
+                          if os.path.dirname(other) == rel_dir and other != rel_dir]:
+                if not os.path.isdir(os.path.join(self.base_dir, other)):
+                    self._remove_tree(other, changed)
+
+        if check_files:
+            for key, entry in self.modules.items():
+                path = os.path.join(self.base_dir, entry[0])
+                try:
+                    mtime = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+                if mtime != entry[1]:
+                    entry[1] = mtime
+                    changed.add(path)
+        return changed
+
+    # 직렬화
+    def to_dict(self, with_mtimes: bool = True) -> dict:
+        """JSON으로 저장 가능한 형태 (릴리스용은 재현 가능하도록 mtime 제외)"""
+        return {
+            "version": INDEX_VERSION,
+            "root_package": self.root_package,
+            "dirs": sorted(self.dirs),
+            "modules": {key: entry[0] for key, entry in sorted(self.modules.items())},
+            "mtimes": ({key: entry[1] for key, entry in sorted(self.modules.items())}
+                       if with_mtimes else {}),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, base_dir: str, frozen: bool = True) -> "DiscoveryIndex":
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported discovery index version: {data.get('version')}")
+        index = cls(base_dir, data["root_package"], frozen=frozen)
+        mtimes = data.get("mtimes", {})
+        index.modules = {key: [rel_path, mtimes.get(key, 0)] for key, rel_path in data["modules"].items()}
+        index.dirs = {rel_dir: 0 for rel_dir in data["dirs"]}
+        return index
+
+    @classmethod
+    def from_files(cls, rel_paths: Iterable[str], base_dir: str, root_package: str) -> "DiscoveryIndex":
+        """파일 목록(예: 릴리스 매니페스트)에서 스캔 없이 인덱스 생성"""
+        index = cls(base_dir, root_package, frozen=True)
+        for rel_path in rel_paths:
+            rel_path = rel_path.replace("\\", "/")
+            parts = rel_path.split("/")
+            if not rel_path.endswith(".py") or any(_is_skipped_dir(part) for part in parts[:-1]):
+                continue
+            index.modules[module_key_from_path(rel_path)] = [rel_path, 0]
+            for depth in range(len(parts)):
+                index.dirs["/".join(parts[:depth])] = 0
+        return index
+
+    def save(self, file_path: str):
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, sort_keys=True)
+
+def load_index(base_dir: str, root_package: str) -> DiscoveryIndex:
+    """릴리스에 포함된 인덱스가 있으면 그대로 사용하고, 없으면 패키지를 스캔"""
+    index_path = os.path.join(base_dir, INDEX_FILENAME)
+    if os.path.isfile(index_path):
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                return DiscoveryIndex.from_dict(json.load(f), base_dir)
+        except (OSError, ValueError, KeyError) as e:
+            log.warning("Discovery index: could not load %s: %s, scanning instead", index_path, e)
+
+    index = DiscoveryIndex(base_dir, root_package)
+    index.refresh()
+    return index
@@ -0,0 +1,32 @@
+# irkebim/utils/handlers.py
+# bpy.app.handlers 등록 도우미 - 모듈은 (핸들러 목록, 함수) 표만 정의하고 이 모듈로 등록/해제
+# ModuleManager가 HANDLER_MODULES의 register_handlers/unregister_handlers를 호출하며,
+# 리로드 전에 해제하고 리로드 후 다시 등록하므로 핸들러가 중복되지 않습니다.
+#   _HANDLERS = (
+#       (bpy.app.handlers.load_post, _on_load_post),
+#   )
+#   def register_handlers():
+#       handlers.register(_HANDLERS)
+#   def unregister_handlers():
+#       handlers.unregister(_HANDLERS)
+from typing import Callable, Iterable, Tuple
+
+HandlerTable = Iterable[Tuple[list, Callable]]
+
+def _remove_handler(handlers: list, handler: Callable):
+    # 모듈이 다시 로드되면 함수 객체가 바뀌므로 이름으로 비교
+    for existing in list(handlers):
+        if getattr(existing, "__name__", None) == handler.__name__ and \
+                getattr(existing, "__module__", None) == handler.__module__:
+            handlers.remove(existing)
+
+def register(table: HandlerTable):
+    """표의 핸들러 등록 (이전에 등록된 같은 이름의 핸들러는 교체)"""
+    for handlers, handler in table:
+        _remove_handler(handlers, handler)
+        handlers.append(handler)
+
+def unregister(table: HandlerTable):
+    """표의 핸들러 해제"""
+    for handlers, handler in table:
+        _remove_handler(handlers, handler)
@@ -0,0 +1,184 @@
+# irkebim/utils/import_graph.py
+# 패키지 내부 임포트 의존성 그래프 - 변경된 모듈만 다시 로드하기 위해 사용
+# 주의: 이 모듈은 표준 라이브러리만 사용 (bpy 및 상대 임포트 없음)
+import ast
+import logging
+import os
+from typing import Dict, Iterable, List, Optional, Set
+
+# 애드온 안에서는 irkebim 로거의 하위 로거 (logger.py 설정을 따름)
+log = logging.getLogger(__name__)
+
+def module_name_from_path(file_path: str, base_dir: str, root_package: str) -> str:
+    """파일 경로를 전체 모듈 이름으로 변환 (irkebim/operators/cube.py -> irkebim.operators.cube)"""
+    rel_path = os.path.relpath(file_path, base_dir)
+    if rel_path.endswith(".py"):
+        rel_path = rel_path[:-3]
+    parts = [part for part in rel_path.replace("\\", "/").split("/") if part]
+    if parts and parts[-1] == "__init__":
+        parts = parts[:-1]
+    return ".".join([root_package] + parts)
+
+def iter_package_files(base_dir: str):
+    """패키지 폴더의 모든 .py 파일 경로 (하위 패키지 포함)"""
+    for root, dirs, files in os.walk(base_dir):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__" and not d.startswith("."))
+        for filename in sorted(files):
+            if filename.endswith(".py"):
+                yield os.path.join(root, filename)
+
+def scan_import_candidates(source: str, module_name: str, is_package: bool) -> Set[str]:
+    """소스 코드에서 임포트될 수 있는 모든 모듈 이름 추출 (내부/외부 구분 없음)"""
+    tree = ast.parse(source)
+    package = module_name if is_package else module_name.rpartition(".")[0]
+    candidates = set()
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            candidates.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                # 상대 임포트 해석 (from ..operators import cube)
+                parts = package.split(".")
+                if node.level - 1 > len(parts) - 1:
+                    continue
+                base = ".".join(parts[:len(parts) - (node.level - 1)])
+                if node.module:
+                    base = f"{base}.{node.module}"
+            else:
+                base = node.module or ""
+            candidates.add(base)
+            # from package import submodule 형태
+            candidates.update(f"{base}.{alias.name}" for alias in node.names)
+
+    candidates.discard(module_name)
+    return candidates
+
+def scan_imports(source: str, module_name: str, is_package: bool, known_modules: Set[str]) -> Set[str]:
+    """소스 코드에서 패키지 내부 모듈에 대한 임포트만 추출"""
+    return scan_import_candidates(source, module_name, is_package) & known_modules
+
+def build_import_graph(base_dir: str, root_package: str) -> Dict[str, Set[str]]:
+    """패키지 전체를 AST로 스캔하여 {모듈: 임포트하는 내부 모듈 집합} 그래프 생성"""
+    files = {}
+    for file_path in iter_package_files(base_dir):
+        files[module_name_from_path(file_path, base_dir, root_package)] = file_path
+
+    known_modules = set(files)
+    graph = {}
+    for module_name, file_path in files.items():
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                source = f.read()
+            is_package = os.path.basename(file_path) == "__init__.py"
+            graph[module_name] = scan_imports(source, module_name, is_package, known_modules)
+        except (SyntaxError, UnicodeDecodeError, OSError) as e:
+            log.warning("Import graph: could not scan %s: %s", file_path, e)
+            graph[module_name] = set()
+    return graph
+
+def get_importers(graph: Dict[str, Set[str]]) -> Dict[str, Set[str]]:
+    """역방향 그래프 {모듈: 이 모듈을 임포트하는 모듈 집합}"""
+    importers = {name: set() for name in graph}
+    for module_name, deps in graph.items():
+        for dep in deps:
+            importers.setdefault(dep, set()).add(module_name)
+    return importers
+
+def topological_order(modules: Iterable[str], graph: Dict[str, Set[str]]) -> List[str]:
+    """의존 대상이 먼저 오도록 정렬 (순환이 있으면 나머지는 이름순)"""
+    modules = set(modules)
+    pending = {name: set(graph.get(name, ())) & modules for name in modules}
+    order = []
+    ready = sorted(name for name, deps in pending.items() if not deps)
+    while ready:
+        name = ready.pop(0)
+        order.append(name)
+        del pending[name]
+        newly_ready = [other for other, deps in pending.items() if name in deps and len(deps) == 1]
+        for other, deps in pending.items():
+            deps.discard(name)
+        ready = sorted(set(ready) | set(newly_ready))
+    # 순환 의존성이 남은 경우
+    order.extend(sorted(pending))
+    return order
+
+def get_reload_order(changed_modules: Iterable[str], graph: Dict[str, Set[str]]) -> List[str]:
+    """변경된 모듈과 이를 (간접적으로) 임포트하는 모듈을 다시 로드 순서대로 반환"""
+    importers = get_importers(graph)
+    affected = set()
+    stack = list(changed_modules)
+    while stack:
+        name = stack.pop()
+        if name in affected:
+            continue
+        affected.add(name)
+        stack.extend(importers.get(name, ()))
+    return topological_order(affected, graph)
+
+class ImportGraphCache:
+    """파일별로 무효화되는 임포트 그래프 캐시
+
+    파일의 (mtime, 크기)가 바뀐 경우에만 해당 파일을 다시 파싱하고,
+    나머지 파일은 이전 스캔 결과를 재사용합니다.
+    """
+
+    def __init__(self, base_dir: str, root_package: str, index=None):
+        self.base_dir = base_dir
+        self.root_package = root_package
+        self.index = index  # 있으면 폴더 대신 discovery.DiscoveryIndex로 파일 목록 조회
+        self._entries: Dict[str, tuple] = {}  # 모듈 이름: (파일 경로, mtime_ns, 크기, 임포트 후보)
+        self._graph: Optional[Dict[str, Set[str]]] = None
+        self.scanned_files = 0
+
+    def module_name(self, file_path: str) -> str:
+        return module_name_from_path(file_path, self.base_dir, self.root_package)
+
+    def invalidate(self, file_paths: Iterable[str] = None):
+        """지정한 파일(없으면 전체)의 스캔 결과 폐기"""
+        if file_paths is None:
+            self._entries.clear()
+        else:
+            for file_path in file_paths:
+                self._entries.pop(self.module_name(os.path.abspath(file_path)), None)
+        self._graph = None
+
+    def refresh(self) -> Dict[str, Set[str]]:
+        """바뀐 파일만 다시 스캔하여 최신 그래프 반환"""
+        self.scanned_files = 0
+        entries = {}
+        changed = False
+        if self.index is not None:
+            self.index.refresh()
+            files = [path for _, path in self.index.iter_files()]
+        else:
+            files = iter_package_files(self.base_dir)
+        for file_path in files:
+            module_name = self.module_name(file_path)
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            entry = self._entries.get(module_name)
+            if entry and entry[0] == file_path and entry[1] == stat.st_mtime_ns and entry[2] == stat.st_size:
+                entries[module_name] = entry
+                continue
+
+            changed = True
+            self.scanned_files += 1
+            try:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    source = f.read()
+                is_package = os.path.basename(file_path) == "__init__.py"
+                candidates = scan_import_candidates(source, module_name, is_package)
+            except (SyntaxError, UnicodeDecodeError, OSError) as e:
+                log.warning("Import graph: could not scan %s: %s", file_path, e)
+                candidates = set()
+            entries[module_name] = (file_path, stat.st_mtime_ns, stat.st_size, candidates)
+
+        if changed or set(entries) != set(self._entries) or self._graph is None:
+            self._entries = entries
+            # 모듈이 추가/삭제되면 내부 모듈 판정이 바뀌므로 그래프는 항상 후보에서 다시 조립
+            known_modules = set(entries)
+            self._graph = {name: entry[3] & known_modules for name, entry in entries.items()}
+        return self._graph
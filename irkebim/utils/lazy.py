@@ -0,0 +1,147 @@
+# irkebim/utils/lazy.py
+# 지연 로딩 - 오퍼레이터/패널을 가벼운 셸로 먼저 등록하고 첫 실행 시 실제 모듈을 임포트
+# 셸은 정적 분석한 속성 정의(어노테이션, Property_)를 모듈의 리터럴 상수와 임포트한 이름으로
+# 평가해 가지며, 정의가 참조하는 모듈 함수(update 콜백 등)는 호출될 때 실제 모듈로 위임합니다.
+# 모듈 최상위의 호출문(element_graph.register_type 등)도 같은 방식으로 셸을 만들 때 실행합니다.
+import ast
+import importlib
+import sys
+import threading
+import types
+from typing import Any, Dict, Iterable, Optional
+
+import bpy
+
+from .class_scan import LAZY_CALLBACK_ARGS, LAZY_METHODS
+from .logger import get_logger
+
+log = get_logger(__name__)
+
+_BASES = {
+    "Operator": bpy.types.Operator,
+    "Panel": bpy.types.Panel,
+}
+
+def load_implementation(shell: type) -> type:
+    """셸 클래스의 실제 구현 모듈을 임포트하고 메서드를 셸에 복사"""
+    real = shell._lazy_class
+    if real is None:
+        module = importlib.import_module(shell._lazy_module)
+        real = getattr(module, shell.__name__)
+        for name, value in vars(real).items():
+            if name.startswith("__") or name.startswith("bl_"):
+                continue
+            setattr(shell, name, value)
+        shell._lazy_class = real
+        log.debug("Lazy loading: loaded %s.%s", shell._lazy_module, shell.__name__)
+    return real
+
+def _make_stub(method_name: str):
+    """첫 호출 시 구현을 불러온 뒤 실제 메서드로 위임하는 메서드"""
+    def stub(self, *args):
+        load_implementation(type(self))
+        return getattr(self, method_name)(*args)
+    stub.__name__ = method_name
+    return stub
+
+def _poll(cls, context):
+    """첫 poll에서 구현을 불러온 뒤 실제 poll로 위임"""
+    load_implementation(cls)
+    return cls.poll(context)
+
+def _make_callback(module_name: str, function_name: str, argument_count: int):
+    """호출될 때 실제 모듈의 함수로 위임하는 콜백 (bpy.props는 인자 수를 검사하므로 맞춰 만듦)"""
+    def call(*args):
+        return getattr(importlib.import_module(module_name), function_name)(*args)
+    callbacks = {
+        1: lambda a: call(a),
+        2: lambda a, b: call(a, b),
+        3: lambda a, b, c: call(a, b, c),
+    }
+    callback = callbacks[argument_count]
+    callback.__name__ = function_name
+    return callback
+
+def _import_name(module_name: str, spec: list) -> Any:
+    """class_scan이 기록한 임포트 [모듈, 속성 이름, 상대 수준]을 모듈 기준으로 가져오기"""
+    source, name, level = spec
+    package = module_name.rpartition(".")[0]
+    module = importlib.import_module("." * level + source if level else source, package if level else None)
+    if name is None:
+        return module
+    if not hasattr(module, name):  # from . import submodule
+        return importlib.import_module(f"{module.__name__}.{name}")
+    return getattr(module, name)
+
+def _evaluation_namespace(module_name: str, module_info: Dict[str, Any], names: Iterable[str]) -> Dict[str, Any]:
+    """속성 정의 소스를 평가할 이름공간 (소스가 읽는 이름만)"""
+    namespace = {"bpy": bpy}
+    for name in names:
+        if name in namespace:
+            continue
+        if name in module_info["constants"]:
+            namespace[name] = ast.literal_eval(module_info["constants"][name])
+        elif name in module_info["imports"]:
+            namespace[name] = _import_name(module_name, module_info["imports"][name])
+        elif module_info["functions"].get(name) in LAZY_CALLBACK_ARGS:
+            namespace[name] = _make_callback(module_name, name, module_info["functions"][name])
+    return namespace
+
+def create_shell_class(module_name: str, info: Dict[str, Any], module_info: Dict[str, Any]) -> type:
+    """정적 분석 결과로 bl_* 속성, 속성 어노테이션, 위임 메서드만 가진 셸 클래스 생성"""
+    attributes = {name: ast.literal_eval(source) for name, source in info["attributes"].items()}
+    attributes.update(__module__=module_name, _lazy_module=module_name, _lazy_class=None)
+    namespace = _evaluation_namespace(module_name, module_info, info["annotation_names"])
+    attributes["__annotations__"] = {name: eval(source, namespace)
+                                     for name, source in info["annotation_sources"].items()}
+    for method_name in info["methods"]:
+        if method_name in LAZY_METHODS:
+            attributes[method_name] = _make_stub(method_name)
+    if "poll" in info["methods"]:
+        attributes["poll"] = classmethod(_poll)
+    return type(info["name"], (_BASES[info["bases"][0]],), attributes)
+
+def create_shell_module(module_name: str, module_info: Dict[str, Any]) -> types.ModuleType:
+    """셸 클래스와 Property_ 정의만 담은 대체 모듈 (sys.modules에는 등록하지 않음)"""
+    module = types.ModuleType(module_name)
+    module.__lazy__ = True
+    for info in module_info["classes"]:
+        setattr(module, info["name"], create_shell_class(module_name, info, module_info))
+    for attribute in module_info["properties"]:
+        namespace = _evaluation_namespace(module_name, module_info, module_info["property_names"][attribute])
+        setattr(module, attribute, eval(module_info["property_sources"][attribute], namespace))
+    if module_info["calls"]:
+        namespace = _evaluation_namespace(module_name, module_info, module_info["call_names"])
+        for source in module_info["calls"]:
+            eval(source, namespace)
+    return module
+
+def get_lazy_blocker(module_info: Optional[Dict[str, Any]]) -> Optional[str]:
+    """셸로 대신할 수 없는 이유 (가능하면 None)"""
+    if module_info is None:
+        return "no metadata"
+    blocker = module_info.get("lazy_blocker")
+    if blocker is None and any(info["bases"][0] not in _BASES for info in module_info["classes"]):
+        return "unsupported base class"
+    return blocker
+
+def warm_imports(module_names: Iterable[str]) -> Optional[threading.Thread]:
+    """무거운 선택적 의존성(numpy 등)을 백그라운드 쓰레드에서 미리 임포트
+
+    bpy를 사용하는 애드온 모듈은 메인 스레드에서만 임포트해야 하므로 여기에 넣지 않습니다.
+    """
+    pending = [name for name in module_names if name not in sys.modules]
+    if not pending:
+        return None
+
+    def run():
+        for name in pending:
+            try:
+                importlib.import_module(name)
+                log.debug("Lazy loading: warmed %s", name)
+            except ImportError as e:
+                log.warning("Lazy loading: could not warm %s: %s", name, e)
+
+    thread = threading.Thread(target=run, name="irkebim-warm-imports", daemon=True)
+    thread.start()
+    return thread
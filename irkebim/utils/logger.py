@@ -0,0 +1,116 @@
+# irkebim/utils/logger.py
+# 애드온 공용 로깅 - 표준 logging 기반, config.DEBUG_MODE로 레벨 결정
+# 메시지는 logging의 % 형식 인자로 넘겨 레벨이 꺼져 있으면 문자열을 만들지 않음
+#   log = get_logger(__name__)
+#   log.debug("Updated scene %s.%s", scene.name, name)
+#   with span("registration.register_all"):
+#       ...
+import json
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from functools import wraps
+from typing import Any, Dict, List, Optional
+
+ROOT_LOGGER = "irkebim"
+LOG_FORMAT = "[%(name)s] %(levelname)s: %(message)s"
+
+# 최근 타이밍 구간을 보관하는 링 버퍼 크기
+SPAN_BUFFER_SIZE = 2048
+
+# 모듈을 다시 로드해도 기록은 유지
+_spans = globals().get("_spans") or deque(maxlen=SPAN_BUFFER_SIZE)
+_span_stack = threading.local()
+
+def configure(debug_mode: bool = False):
+    """애드온 로거 설정 (DEBUG_MODE면 DEBUG, 아니면 INFO 이상만 출력)"""
+    root = logging.getLogger(ROOT_LOGGER)
+    # 모듈이 다시 로드되어도 로거는 유지되므로 핸들러는 한 번만 추가
+    if not any(getattr(handler, "_irkebim_handler", False) for handler in root.handlers):
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        handler._irkebim_handler = True
+        root.addHandler(handler)
+        root.propagate = False
+    root.setLevel(logging.DEBUG if debug_mode else logging.INFO)
+
+def get_logger(name: str) -> logging.Logger:
+    """모듈 로거 (irkebim.utils.registration 등, 루트 패키지 로거의 하위)"""
+    if name != ROOT_LOGGER and not name.startswith(ROOT_LOGGER + "."):
+        name = f"{ROOT_LOGGER}.{name}"
+    return logging.getLogger(name)
+
+def is_debug() -> bool:
+    return logging.getLogger(ROOT_LOGGER).isEnabledFor(logging.DEBUG)
+
+class span:
+    """걸린 시간을 링 버퍼에 기록하는 컨텍스트 관리자 겸 데코레이터
+
+    with span("reload", modules=3): ...
+    @span("sync_preferences")
+    def ...
+    """
+
+    __slots__ = ("name", "fields", "started", "depth")
+
+    def __init__(self, name: str, **fields: Any):
+        self.name = name
+        self.fields = fields
+
+    def __enter__(self):
+        self.depth = getattr(_span_stack, "depth", 0)
+        _span_stack.depth = self.depth + 1
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        duration_ms = (time.perf_counter() - self.started) * 1000.0
+        _span_stack.depth = self.depth
+        # deque.append는 스레드 안전
+        _spans.append((self.name, self.started, duration_ms, self.depth,
+                       threading.current_thread().name, self.fields or None))
+        return False
+
+    def __call__(self, func):
+        name, fields = self.name, self.fields
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name, **fields):
+                return func(*args, **kwargs)
+        return wrapper
+
+def get_spans(name: Optional[str] = None) -> List[Dict[str, Any]]:
+    """기록된 구간 목록 (오래된 것부터)"""
+    return [
+        {"name": entry[0], "start": entry[1], "ms": entry[2], "depth": entry[3],
+         "thread": entry[4], "fields": entry[5]}
+        for entry in list(_spans) if name is None or entry[0] == name
+    ]
+
+def summarize_spans() -> Dict[str, Dict[str, float]]:
+    """구간 이름별 호출 수, 합계, 최대 시간"""
+    summary = {}
+    for entry in list(_spans):
+        stats = summary.setdefault(entry[0], {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        stats["count"] += 1
+        stats["total_ms"] += entry[2]
+        stats["max_ms"] = max(stats["max_ms"], entry[2])
+    return summary
+
+def dump_spans(file_path: Optional[str] = None, clear: bool = False) -> Dict[str, Any]:
+    """구간 기록을 JSON 파일로 저장하거나 요약을 로그로 출력"""
+    data = {"spans": get_spans(), "summary": summarize_spans()}
+    if file_path:
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+    else:
+        log = get_logger(ROOT_LOGGER)
+        for name, stats in sorted(data["summary"].items(), key=lambda item: -item[1]["total_ms"]):
+            log.info("span %-40s %5d calls %10.2f ms total %8.2f ms max",
+                     name, stats["count"], stats["total_ms"], stats["max_ms"])
+    if clear:
+        _spans.clear()
+    return data
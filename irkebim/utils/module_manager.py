@@ -1,14 +1,28 @@
 import os
 import sys
 import importlib
+import time
 from typing import Dict, List, Any, Optional
 import bpy
 
+from .logger import configure, get_logger, span
+
+log = get_logger(__name__)
+
 class ModuleManager:
     """애드온 모듈을 동적으로 관리하는 클래스"""
     
+    # 부분 리로드가 불가능한 핵심 모듈 (변경 시 전체 리로드)
+    # auto_reload는 리로드를 실행하는 타이머 안에서 다시 로드되면 전역 상태가 초기화되어 감시가 멈춤
+    CORE_MODULES = ("", "utils.module_manager", "utils.registration", "utils.auto_reload")
+    
+    # bpy 핸들러/타이머/구독을 register_handlers/unregister_handlers로 관리하는 모듈 (등록 순서)
+    # 다시 로드되면 이전 핸들러를 해제하고 새 모듈의 핸들러를 다시 등록해야 함
+    HANDLER_MODULES = ("preferences.scene_sync", "geometry.snapping", "geometry.element_graph",
+                       "geometry.wall_model")
+    
     def __init__(self, root_package: str, package_paths: List[str] = None):
-        print(f"Initializing ModuleManager for {root_package}")
+        log.debug("Initializing ModuleManager for %s", root_package)
         self.root_package = root_package
         self.package_paths = package_paths or []
         self.modules = {}  # 이름: 모듈 객체
@@ -18,75 +32,79 @@ class ModuleManager:
         self.config = None
         self.auto_reload = None
         self.registration = None
+        self._import_graph = None  # 선택적 리로드용 임포트 그래프 캐시
+        self.discovery = None  # 패키지 모듈 탐색 인덱스 (utils.discovery)
+        self.lazy_modules = set()  # 셸로 대신 등록된 모듈 키 (지연 로딩)
         
         # 유틸리티 모듈 먼저 로드
         self._load_utils()
         
         # 특별 모듈 로드 (순서 조정: config를 먼저 로드)
-        print("Loading config module")
+        log.debug("Loading config module")
         config_module = self._safe_import_module("config", self.root_package)
         if config_module:
             self.config = config_module
             self.modules['config'] = config_module
-            print("Config module loaded successfully")
+            configure(getattr(config_module, "DEBUG_MODE", False))
+            log.debug("Config module loaded successfully")
         else:
-            print("Failed to load config module")
+            log.error("Failed to load config module")
         
         # 나머지 특별 모듈 로드
         for name in self.special_modules:
             if name != "config":  # config는 이미 로드했으므로 제외
-                print(f"Loading special module: {name}")
+                log.debug("Loading special module: %s", name)
                 self._safe_import_module(name, self.root_package)
         
         # 모든 모듈 로드
-        print("Loading all modules")
+        log.debug("Loading all modules")
         self.load_all_modules()
         
         # 등록 관리자 가져오기
-        print("Setting up registration manager")
+        log.debug("Setting up registration manager")
         self.registration = self.get_module("utils.registration")
         if not self.registration:
             try:
                 from . import registration
                 self.registration = registration
-                print("Loaded registration from local import")
+                log.debug("Loaded registration from local import")
             except ImportError:
-                print("Registration module not found")
+                log.warning("Registration module not found")
                 self.registration = None
                 
         # auto_reload 모듈 가져오기
-        print("Setting up auto_reload module")
+        log.debug("Setting up auto_reload module")
         self.auto_reload = self.get_module("utils.auto_reload")
         if not self.auto_reload:
-            print("auto_reload not found in modules, trying direct imports")
+            log.debug("auto_reload not found in modules, trying direct imports")
             try:
                 # 모듈이 루트에 있을 수도 있음
                 if "auto_reload" in self.modules:
                     self.auto_reload = self.modules["auto_reload"]
-                    print("Found auto_reload in modules")
+                    log.debug("Found auto_reload in modules")
                 else:
                     # 직접 임포트 시도
                     try:
                         module_name = f"{self.root_package}.utils.auto_reload"
-                        print(f"Trying to import auto_reload from {module_name}")
+                        log.debug("Trying to import auto_reload from %s", module_name)
                         self.auto_reload = importlib.import_module(module_name)
-                        print("Imported auto_reload from utils")
+                        log.debug("Imported auto_reload from utils")
                     except ImportError as e:
-                        print(f"Failed to import from utils: {e}")
+                        log.debug("Failed to import from utils: %s", e)
                         try:
                             module_name = f"{self.root_package}.auto_reload"
-                            print(f"Trying to import auto_reload from {module_name}")
+                            log.debug("Trying to import auto_reload from %s", module_name)
                             self.auto_reload = importlib.import_module(module_name)
-                            print("Imported auto_reload from root package")
+                            log.debug("Imported auto_reload from root package")
                         except ImportError as e:
-                            print(f"Failed to import from root: {e}")
-                            print("Auto-reload module not found, hot-reload will be disabled")
+                            log.debug("Failed to import from root: %s", e)
+                            log.warning("Auto-reload module not found, hot-reload will be disabled")
                             self.auto_reload = None
             except Exception as e:
-                print(f"Error setting up auto_reload: {e}")
+                log.error("Error setting up auto_reload: %s", e)
                 self.auto_reload = None
                 
-        print("ModuleManager initialization completed")
+        log.info("ModuleManager initialization completed")
     
     def _get_base_dir(self) -> str:
         """루트 패키지 디렉토리 가져오기"""
@@ -99,83 +117,112 @@ class ModuleManager:
             current_dir = os.path.dirname(__file__)  # utils 폴더
             return os.path.dirname(current_dir)  # 상위 폴더 (루트)
     
+    def get_discovery_index(self):
+        """모듈 탐색 인덱스 (처음 한 번 생성, 이후 바뀐 폴더만 갱신)"""
+        if self.discovery is None:
+            from . import discovery
+            self.discovery = discovery.load_index(self._get_base_dir(), self.root_package)
+            log.info("Discovery index: %s modules%s", len(self.discovery.modules),
+                     " (precomputed)" if self.discovery.frozen else "")
+        else:
+            self.discovery.refresh()
+        return self.discovery
+    
+    def _import_by_key(self, key: str) -> Optional[Any]:
+        """모듈 키(operators.cube)로 모듈 가져오기"""
+        package, _, name = key.rpartition(".")
+        return self._import_module(name, f"{self.root_package}.{package}" if package else self.root_package)
+    
     def _load_utils(self):
         """유틸리티 모듈 로드"""
         try:
-            base_dir = self._get_base_dir()
-            utils_path = os.path.join(base_dir, "utils")
-            print(f"Loading utilities from {utils_path}")
+            index = self.get_discovery_index()
+            log.debug("Loading utilities")
             
-            if os.path.exists(utils_path):
-                for filename in os.listdir(utils_path):
-                    if filename.endswith(".py") and not filename.startswith("__"):
-                        name = filename[:-3]
-                        print(f"Loading utility module: {name}")
-                        self._safe_import_module(name, f"{self.root_package}.utils")
+            for key in index.iter_modules("utils"):
+                log.debug("Loading utility module: %s", key)
+                self._import_by_key(key)
         except Exception as e:
-            print(f"Error in _load_utils: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error in _load_utils: %s", e)
     
     def _safe_import_module(self, name: str, package: str) -> Optional[Any]:
         """안전하게 모듈 가져오기 (config 참조 없이)"""
         full_name = f"{package}.{name}"
         try:
-            print(f"Attempting to import: {full_name}")
+            log.debug("Attempting to import: %s", full_name)
             if full_name in sys.modules:
-                print(f"Reloading existing module: {full_name}")
+                log.debug("Reloading existing module: %s", full_name)
                 module = importlib.reload(sys.modules[full_name])
             else:
-                print(f"Importing new module: {full_name}")
+                log.debug("Importing new module: %s", full_name)
                 module = importlib.import_module(f".{name}", package=package)
                 
             # 모듈 맵에 추가 (패키지 접두사 제거)
             module_key = full_name.replace(f"{self.root_package}.", "", 1)
             self.modules[module_key] = module
-            print(f"Successfully imported: {full_name} -> {module_key}")
+            log.debug("Successfully imported: %s -> %s", full_name, module_key)
             return module
         except ImportError as e:
-            print(f"Failed to import {full_name}: {e}")
+            log.error("Failed to import %s: %s", full_name, e)
             return None
         except Exception as e:
-            print(f"Error importing {full_name}: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error importing %s: %s", full_name, e)
             return None
     
     def _import_module(self, name: str, package: str) -> Optional[Any]:
         """모듈 가져오기 (새로고침 또는 처음 임포트)"""
         return self._safe_import_module(name, package)  # 안전한 임포트 메서드 재사용
     
+    def get_class_metadata(self) -> Dict[str, dict]:
+        """모듈별 클래스 정적 분석 결과 (릴리스에 포함된 것이 있으면 사용)"""
+        from . import class_scan
+        metadata = class_scan.load_metadata(self._get_base_dir())
+        if metadata is None:
+            index = self.get_discovery_index()
+            metadata = class_scan.scan_modules(
+                (key, path) for key, path in index.iter_files()
+                if any(key.startswith(f"{package}.") for package in self.package_paths))
+        return metadata
+    
+    def _load_lazy(self, key: str, module_info: Optional[dict]) -> bool:
+        """모듈 대신 셸 클래스만 담은 대체 모듈 등록 (불가능하면 False)"""
+        from . import lazy
+        blocker = lazy.get_lazy_blocker(module_info)
+        if blocker:
+            log.debug("Loading eagerly: %s (%s)", key, blocker)
+            return False
+        full_name = f"{self.root_package}.{key}"
+        self.modules[key] = lazy.create_shell_module(full_name, module_info)
+        self.lazy_modules.add(key)
+        log.debug("Lazy module: %s", full_name)
+        return True
+    
+    @span("ModuleManager.load_all_modules")
     def load_all_modules(self):
-        """모든 모듈 로드"""
+        """모든 모듈 로드 (하위 패키지 포함)"""
         try:
-            base_dir = self._get_base_dir()
+            index = self.get_discovery_index()
+            lazy_loading = bool(self.config and getattr(self.config, "LAZY_LOADING", False))
+            metadata = self.get_class_metadata() if lazy_loading else {}
             
             # 패키지 경로 처리
             for package_path in self.package_paths:
-                full_path = os.path.join(base_dir, package_path)
-                if not os.path.exists(full_path):
-                    print(f"Path does not exist: {full_path}")
+                if not index.has_package(package_path):
+                    log.warning("Package does not exist: %s", package_path)
                     continue
                     
                 if package_path == "utils":  # utils는 이미 처리함
-                    print("Skipping utils folder (already processed)")
+                    log.debug("Skipping utils folder (already processed)")
                     continue
                 
-                print(f"Loading modules from {package_path}")
-                package = f"{self.root_package}.{package_path}"
-                
-                # 디렉토리의 모든 Python 파일 처리
-                for filename in os.listdir(full_path):
-                    if filename.endswith(".py") and not filename.startswith("__"):
-                        name = filename[:-3]
-                        print(f"Loading module: {package}.{name}")
-                        self._import_module(name, package)
+                log.debug("Loading modules from %s", package_path)
+                for key in index.iter_modules(package_path):
+                    if lazy_loading and self._load_lazy(key, metadata.get(key)):
+                        continue
+                    log.debug("Loading module: %s.%s", self.root_package, key)
+                    self._import_by_key(key)
         except Exception as e:
-            print(f"Error in load_all_modules: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error in load_all_modules: %s", e)
     
     def get_module(self, name: str) -> Optional[Any]:
         """이름으로 모듈 가져오기"""
@@ -192,104 +239,219 @@ class ModuleManager:
                 if full_name in sys.modules:
                     try:
                         self.modules[name] = importlib.reload(sys.modules[full_name])
-                        print(f"Reloaded module: {name}")
+                        log.debug("Reloaded module: %s", name)
                     except Exception as e:
-                        print(f"Error reloading {name}: {e}")
+                        log.error("Error reloading %s: %s", name, e)
+    
+    def _module_key(self, full_name: str) -> str:
+        """전체 모듈 이름을 모듈 맵 키로 변환 (irkebim.operators.cube -> operators.cube)"""
+        if full_name == self.root_package:
+            return ""
+        return full_name.replace(f"{self.root_package}.", "", 1)
     
+    def get_import_graph(self) -> Dict[str, set]:
+        """캐시된 임포트 그래프 (바뀐 파일만 다시 스캔)"""
+        if self._import_graph is None:
+            from . import import_graph
+            self._import_graph = import_graph.ImportGraphCache(self._get_base_dir(), self.root_package,
+                                                               self.get_discovery_index())
+        return self._import_graph.refresh()
+    
+    def invalidate_import_graph(self, file_paths: List[str] = None):
+        """파일 변경 알림을 받은 경우 해당 파일의 스캔 결과 폐기"""
+        if self._import_graph is not None:
+            self._import_graph.invalidate(file_paths)
+    
+    @span("ModuleManager.reload_changed")
+    def reload_changed(self, module_names: List[str]) -> bool:
+        """변경된 모듈과 이를 임포트하는 모듈만 의존성 순서대로 다시 로드하고 재등록
+        
+        루트 패키지나 모듈 관리/등록 모듈이 바뀐 경우처럼 부분 리로드가 불가능하면
+        False를 반환하며, 이때 호출자는 애드온 전체를 다시 로드해야 합니다.
+        """
+        if not self.registration:
+            log.warning("Registration module not found, cannot reload selectively.")
+            return False
+        
+        from . import import_graph
+        started = time.perf_counter()
+        graph = self.get_import_graph()
+        reload_order = import_graph.get_reload_order([name for name in module_names if name in graph], graph)
+        keys = [self._module_key(name) for name in reload_order]
+        
+        core_modules = [key for key in keys if key in self.CORE_MODULES]
+        if core_modules:
+            log.warning("Core modules changed (%s), full reload required",
+                        ", ".join(core_modules) or self.root_package)
+            return False
+        if not reload_order:
+            log.debug("No modules to reload")
+            return True
+        
+        log.info("Reloading %s modules: %s", len(reload_order), ", ".join(keys))
+        
+        # 다시 로드할 모듈의 핸들러는 이전 모듈 상태로 먼저 해제
+        handler_keys = [key for key in self.HANDLER_MODULES if key in keys]
+        self._unregister_handlers(handler_keys)
+        
+        # 의존성 순서대로 리로드한 뒤 정의가 바뀐 클래스/속성만 재등록
+        # (리로드가 실패해도 핸들러는 현재 모듈로 다시 등록)
+        reloaded = {}
+        try:
+            for full_name, key in zip(reload_order, keys):
+                if full_name in sys.modules:
+                    module = importlib.reload(sys.modules[full_name])
+                else:
+                    module = importlib.import_module(full_name)
+                self.modules[key] = module
+                self.lazy_modules.discard(key)
+                reloaded[key] = module
+                log.debug("Reloaded module: %s", full_name)
+            
+            self.registration.reregister(reloaded)
+        finally:
+            self._register_handlers(handler_keys)
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        log.info("Reloaded %s modules in %.1f ms, skipped %s unaffected modules",
+                 len(reloaded), elapsed_ms, len(graph) - len(reloaded))
+        return True
+    
+    @span("ModuleManager.register_all")
     def register_all(self):
         """모든 모듈의 클래스 및 속성 등록"""
         if not self.registration:
-            print("Registration module not found, cannot register classes.")
+            log.warning("Registration module not found, cannot register classes.")
             return
             
-        # 등록 초기화 및 실행
-        print("Initializing registration")
-        self.registration.initialize(self.modules)
-        print("Registering all classes and properties")
+        # 등록 초기화 및 실행 (릴리스 빌드는 정적 분석된 매니페스트 사용, 개발 모드는 동적 탐색)
+        log.debug("Initializing registration")
+        manifest = None
+        if not (self.config and getattr(self.config, "DEV_MODE", False)):
+            from . import class_scan
+            manifest = class_scan.load_registration_manifest(self._get_base_dir())
+        if manifest:
+            self.registration.initialize_from_manifest(self.modules, manifest)
+        else:
+            self.registration.initialize(self.modules)
+        log.debug("Registering all classes and properties")
         self.registration.register_all()
         
-        # 환경 설정에서 Scene 속성 초기화
-        print("Syncing preferences to scenes")
-        self._sync_preferences_to_scenes()
+        # 환경 설정에서 Scene 속성 초기화 후 모듈 핸들러 등록
+        # (스냅 색인은 depsgraph 갱신으로 바뀐 오브젝트만, 매개변수 요소는 바뀐 입력에 의존하는 요소만 갱신)
+        log.debug("Syncing preferences to scenes")
+        self._register_handlers(self.HANDLER_MODULES)
+        
+        # 지연 로딩 시 무거운 의존성은 백그라운드에서 미리 임포트
+        if self.lazy_modules:
+            from . import lazy
+            log.info("Registered %s modules lazily", len(self.lazy_modules))
+            lazy.warm_imports(getattr(self.config, "WARM_IMPORTS", ()))
         
         # 개발 모드에서 자동 리로드 활성화
         if self.config and hasattr(self.config, "DEV_MODE") and self.config.DEV_MODE:
-            print("Activating auto-reload (DEV_MODE is enabled)")
+            log.info("Activating auto-reload (DEV_MODE is enabled)")
             if self.auto_reload and hasattr(self.auto_reload, "start_watchdog"):
                 self.auto_reload.start_watchdog()
             else:
-                print("Auto-reload module not available or missing start_watchdog function")
+                log.warning("Auto-reload module not available or missing start_watchdog function")
+    
+    def _register_handlers(self, keys: List[str]):
+        """모듈 핸들러 등록 (scene_sync는 환경설정 값 동기화와 함께)"""
+        for key in self.HANDLER_MODULES:
+            if key not in keys:
+                continue
+            if key == "preferences.scene_sync":
+                self._sync_preferences_to_scenes()
+                continue
+            module = self.get_module(key)
+            if module and hasattr(module, "register_handlers"):
+                module.register_handlers()
     
-def _sync_preferences_to_scenes(self):
-    """환경 설정의 값을 Scene 속성에 동기화 (자동화된 방식)"""
-    if not self.config or not hasattr(self.config, "ADDON_ID"):
-        print("Config module missing or ADDON_ID not defined")
-        return
+    def _unregister_handlers(self, keys: List[str]):
+        """모듈 핸들러 해제 (등록의 역순)"""
+        for key in reversed(self.HANDLER_MODULES):
+            module = self.get_module(key) if key in keys else None
+            if module and hasattr(module, "unregister_handlers"):
+                try:
+                    module.unregister_handlers()
+                except Exception as e:
+                    log.exception("Error unregistering handlers of %s: %s", key, e)
     
-    try:
-        # 오퍼레이터 설정 모듈 가져오기
-        default_values_module = self.get_module("preferences.default_values")
-        if not default_values_module:
-            print("default_values module not found, cannot sync preferences")
+    @span("ModuleManager._sync_preferences_to_scenes")
+    def _sync_preferences_to_scenes(self):
+        """환경 설정의 값을 Scene 속성에 동기화 (자동화된 방식)"""
+        if not self.config or not hasattr(self.config, "ADDON_ID"):
+            log.warning("Config module missing or ADDON_ID not defined")
             return
+    
+        try:
+            # 오퍼레이터 설정 모듈 가져오기
+            default_values_module = self.get_module("preferences.default_values")
+            scene_sync = self.get_module("preferences.scene_sync")
+            linked_props = self.get_module("preferences.linked_props")
+            if not default_values_module or not scene_sync or not linked_props:
+                log.warning("default_values, scene_sync or linked_props module not found, cannot sync preferences")
+                return
             
-        # 매핑 정보 가져오기
-        if not hasattr(default_values_module, "PREFERENCES_TO_SCENE_MAPPING"):
-            print("PREFERENCES_TO_SCENE_MAPPING not found in default_values")
-            return
+            # 환경설정을 직접 읽는 속성은 캐시만 무효화 (씬에 복사하지 않음)
+            linked_props.invalidate()
             
-        mapping = default_values_module.PREFERENCES_TO_SCENE_MAPPING
-        print(f"Found {len(mapping)} properties to sync")
+            # 매핑 정보 가져오기
+            if not hasattr(default_values_module, "PREFERENCES_TO_SCENE_MAPPING"):
+                log.warning("PREFERENCES_TO_SCENE_MAPPING not found in default_values")
+                return
             
-        # 애드온 설정에 접근
-        addon_id = self.config.ADDON_ID
-        print(f"Looking for preferences for addon: {addon_id}")
-        preferences = bpy.context.preferences.addons.get(addon_id)
-        
-        # bpy.data.scenes 접근 가능 여부 확인
-        if not hasattr(bpy.data, "scenes"):
-            print("bpy.data.scenes not available, skipping sync")
-            return
+            mapping = default_values_module.PREFERENCES_TO_SCENE_MAPPING
+            log.debug("Found %s properties to sync", len(mapping))
+            
+            # 애드온 설정에 접근
+            addon_id = self.config.ADDON_ID
+            log.debug("Looking for preferences for addon: %s", addon_id)
+            preferences = bpy.context.preferences.addons.get(addon_id)
             
-        # 각 매핑된 속성에 대해 동기화 수행
-        for pref_property, (scene_property, default_value) in mapping.items():
-            # 환경설정에서 값 가져오기 또는 기본값 사용
-            if preferences and preferences.preferences:
-                if hasattr(preferences.preferences, pref_property):
-                    value = getattr(preferences.preferences, pref_property)
-                    print(f"Using preference value for {pref_property}: {value}")
+            # 각 매핑된 속성의 값 결정
+            values = {}
+            for pref_property, (scene_property, default_value) in mapping.items():
+                if linked_props.is_linked(scene_property):
+                    continue
+                # 환경설정에서 값 가져오기 또는 기본값 사용
+                if preferences and preferences.preferences:
+                    if hasattr(preferences.preferences, pref_property):
+                        value = getattr(preferences.preferences, pref_property)
+                        log.debug("Using preference value for %s: %s", pref_property, value)
+                    else:
+                        value = default_value
+                        log.warning("Preference %s not found, using default: %s", pref_property, value)
                 else:
                     value = default_value
-                    print(f"Preference {pref_property} not found, using default: {value}")
-            else:
-                value = default_value
-                print(f"No preferences found, using default for {pref_property}: {value}")
+                    log.debug("No preferences found, using default for %s: %s", pref_property, value)
+                values[scene_property] = value
             
-            # 모든 씬에 적용
-            for scene in bpy.data.scenes:
-                if hasattr(scene, scene_property):
-                    setattr(scene, scene_property, value)
-                    print(f"Updated scene {scene.name}.{scene_property} = {value}")
-                else:
-                    print(f"Property {scene_property} not found in scene {scene.name}")
+            # 표시 중인 씬만 바로 갱신하고 나머지는 씬 전환/파일 로드 시 갱신
+            scene_sync.set_values(values)
+            if hasattr(bpy.data, "scenes"):
+                scene_sync.flush()
+            scene_sync.register_handlers()
                 
-    except Exception as e:
-        print(f"Error syncing preferences to scenes: {e}")
-        import traceback
-        traceback.print_exc()
+        except Exception as e:
+            log.exception("Error syncing preferences to scenes: %s", e)
     
+    @span("ModuleManager.unregister_all")
     def unregister_all(self):
         """모든 모듈의 클래스 및 속성 등록 해제"""
         # 자동 리로드 중지
-        print("Stopping auto-reload if active")
+        log.debug("Stopping auto-reload if active")
         if self.config and hasattr(self.config, "DEV_MODE") and self.config.DEV_MODE:
             if self.auto_reload and hasattr(self.auto_reload, "stop_watchdog"):
                 self.auto_reload.stop_watchdog()
+    
+        # 씬 동기화/스냅/요소 그래프 핸들러 해제
+        self._unregister_handlers(self.HANDLER_MODULES)
         
         # 등록 해제
         if not self.registration:
-            print("Registration module not found, cannot unregister classes.")
+            log.warning("Registration module not found, cannot unregister classes.")
             return
-            
-        print("Unregistering all classes and properties")
+        
+        log.debug("Unregistering all classes and properties")
         self.registration.unregister_all()
\ No newline at end of file
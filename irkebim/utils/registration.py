@@ -1,70 +1,164 @@
 import inspect
+import types
 import bpy
 from typing import List, Tuple, Any, Dict, Type, Set, Optional
 
-# 등록 데이터 저장
-_classes = []
-_properties = []
+from .logger import get_logger, span
+
+log = get_logger(__name__)
+
+# 등록 데이터 저장 (키 기반 레지스트리)
+_classes: Dict[Tuple[str, str], Type] = {}  # (정의된 모듈 키, 클래스 이름): 클래스
+_properties: Dict[Tuple[Type, str], Tuple[Any, str]] = {}  # (소유자, 속성 이름): (속성 정의, 정의된 모듈 키)
+_fingerprints: Dict[Any, Any] = {}  # 클래스/속성 키: 등록 당시 정의 지문 (변경 비교용)
 _modules = {}
 _verbose = True  # 항상 로그 출력
+_presorted = False  # 등록 매니페스트에서 이미 의존성 순서로 정렬된 경우
+
+def _reset(modules: Dict[str, Any], presorted: bool):
+    global _modules, _presorted
+    _modules = modules
+    _classes.clear()
+    _properties.clear()
+    _fingerprints.clear()
+    _presorted = presorted
 
 def initialize(modules: Dict[str, Any], verbose: bool = True):
     """모듈 맵 및 클래스/속성 초기화"""
-    global _modules, _classes, _properties, _verbose
-    _modules = modules
-    _classes = []
-    _properties = []
+    global _verbose
+    _reset(modules, presorted=False)
     _verbose = verbose
     
-    print("Registration: Initializing with", len(modules), "modules")
+    log.debug("Registration: Initializing with %s modules", len(modules))
     
     # 모든 모듈에서 클래스와 속성 수집
     collect_from_all_modules()
     
-    print(f"Registration: Collected {len(_classes)} classes and {len(_properties)} properties")
+    log.info("Registration: Collected %s classes and %s properties", len(_classes), len(_properties))
 
+def initialize_from_manifest(modules: Dict[str, Any], manifest: Dict[str, Any]):
+    """릴리스 빌드용 - 정적 분석된 등록 매니페스트에서 클래스/속성을 그대로 가져옴 (내부 검사 없음)"""
+    _reset(modules, presorted=True)
+    
+    for entry in manifest["classes"]:
+        cls = getattr(modules.get(entry["module"]), entry["name"], None)
+        if cls is None:
+            log.warning("Manifest class not found: %s.%s", entry['module'], entry['name'])
+            continue
+        _classes[(entry["module"], entry["name"])] = cls
+    
+    for entry in manifest["properties"]:
+        owner = getattr(bpy.types, entry["owner"], None)
+        value = getattr(modules.get(entry["module"]), entry["attribute"], None)
+        if owner is None or value is None:
+            log.warning("Manifest property not found: %s.%s", entry['module'], entry['attribute'])
+            continue
+        _properties[(owner, entry["name"])] = (value, entry["module"])
+    
+    log.info("Registration: Loaded %s classes and %s properties from manifest",
+             len(_classes), len(_properties))
+
+@span("registration.collect_from_all_modules")
 def collect_from_all_modules():
     """모든 모듈에서 클래스 및 속성 수집"""
-    global _modules, _classes, _properties
-    
     for name, module in _modules.items():
-        if module is None:
-            print(f"Module is None: {name}")
-            continue
+        collect_from_module(name, module)
+
+def _get_source_key(obj: Type, default: str) -> str:
+    """클래스가 정의된 모듈의 키 찾기 (다른 모듈에서 임포트된 경우 대비)"""
+    for key, module in _modules.items():
+        if module is not None and getattr(module, "__name__", None) == obj.__module__:
+            return key
+    return default
+
+def collect_from_module(name: str, module: Any, classes: Dict = None, properties: Dict = None):
+    """단일 모듈에서 클래스 및 속성 수집 (대상 레지스트리를 지정하지 않으면 전역 레지스트리)"""
+    classes = _classes if classes is None else classes
+    properties = _properties if properties is None else properties
+    if module is None:
+        log.warning("Module is None: %s", name)
+        return
+        
+    # 클래스 수집 (자동 검색)
+    for obj_name, obj in inspect.getmembers(module):
+        if inspect.isclass(obj) and hasattr(obj, 'bl_rna') and not obj_name.startswith("_"):
+            # 내장 클래스는 등록하지 않음 (AddonPreferences 등)
+            if obj.__module__.startswith("bpy.types"):
+                log.debug("Skipping built-in class: %s", obj.__name__)
+                continue
             
-        # 클래스 수집 (자동 검색)
-        for obj_name, obj in inspect.getmembers(module):
-            if inspect.isclass(obj) and hasattr(obj, 'bl_rna') and not obj_name.startswith("_"):
-                # 내장 클래스는 등록하지 않음 (AddonPreferences 등)
-                if obj.__module__.startswith("bpy.types"):
-                    print(f"Skipping built-in class: {obj.__name__}")
-                    continue
-                    
-                if obj not in _classes:  # 중복 방지
-                    _classes.append(obj)
+            key = (_get_source_key(obj, name), obj.__name__)
+            if key not in classes:  # 중복 방지
+                classes[key] = obj
+                if classes is _classes:
+                    _fingerprints.setdefault(key, class_fingerprint(obj))
+                if _verbose:
+                    log.debug("Added class: %s from %s", obj.__name__, name)
+    
+    # 속성 수집 (Property_ 접두사 검색)
+    for attr_name in dir(module):
+        if attr_name.startswith("Property_"):
+            parts = attr_name.split("_", 2)  # Property_Owner_PropertyName
+            if len(parts) >= 3:
+                owner_name = parts[1]
+                if hasattr(bpy.types, owner_name):
+                    key = (getattr(bpy.types, owner_name), parts[2])
+                    # 중복 방지
+                    if key in properties:
+                        log.warning("Duplicate property found: %s.%s", owner_name, parts[2])
+                        continue
+                    properties[key] = (getattr(module, attr_name), name)
+                    if properties is _properties:
+                        _fingerprints.setdefault(key, value_fingerprint(properties[key][0]))
                     if _verbose:
-                        print(f"Added class: {obj.__name__} from {name}")
-        
-        # 속성 수집 (Property_ 접두사 검색)
-        for attr_name in dir(module):
-            if attr_name.startswith("Property_"):
-                parts = attr_name.split("_", 2)  # Property_Owner_PropertyName
-                if len(parts) >= 3:
-                    owner_name = parts[1]
-                    if hasattr(bpy.types, owner_name):
-                        owner = getattr(bpy.types, owner_name)
-                        prop_name = parts[2]
-                        prop_value = getattr(module, attr_name)
-                        
-                        # 중복 방지
-                        for existing_owner, existing_name, _ in _properties:
-                            if existing_owner == owner and existing_name == prop_name:
-                                print(f"Duplicate property found: {owner_name}.{prop_name}")
-                                break
-                        else:
-                            _properties.append((owner, prop_name, prop_value))
-                            if _verbose:
-                                print(f"Added property: {owner_name}.{prop_name} from {name}")
+                        log.debug("Added property: %s.%s from %s", owner_name, parts[2], name)
+
+# 정의 지문 - 리로드 전후의 클래스/속성이 같은지 비교
+def _code_fingerprint(code: types.CodeType) -> tuple:
+    consts = tuple(_code_fingerprint(const) if isinstance(const, types.CodeType) else repr(const)
+                   for const in code.co_consts)
+    return (code.co_code, consts, code.co_names, code.co_varnames)
+
+def value_fingerprint(value: Any) -> Any:
+    """함수는 바이트코드, 속성 정의(bpy.props)는 함수와 키워드 인자로 비교"""
+    if isinstance(value, types.FunctionType):
+        return ("function", _code_fingerprint(value.__code__))
+    if isinstance(value, (classmethod, staticmethod)):
+        return (type(value).__name__, value_fingerprint(value.__func__))
+    if isinstance(value, property):
+        return ("property", value_fingerprint(value.fget), value_fingerprint(value.fset))
+    if hasattr(value, "function") and hasattr(value, "keywords"):
+        # bpy.props로 만든 지연 속성 정의
+        return ("prop", value.function.__name__,
+                tuple(sorted((key, value_fingerprint(item)) for key, item in value.keywords.items())))
+    if isinstance(value, type):
+        return ("class", value.__module__, value.__qualname__)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return (type(value).__name__, tuple(sorted((value_fingerprint(item) for item in value), key=repr)
+                                            if isinstance(value, (set, frozenset)) else
+                                            (value_fingerprint(item) for item in value)))
+    return repr(value)
+
+_SKIPPED_CLASS_ATTRIBUTES = {"__dict__", "__weakref__", "__module__", "__doc__", "__annotations__", "bl_rna"}
+
+def class_fingerprint(cls: Type) -> tuple:
+    """bl_* 속성, 메서드 코드, 속성 어노테이션 키워드로 만든 클래스 지문"""
+    attributes = tuple(sorted((name, value_fingerprint(value)) for name, value in vars(cls).items()
+                              if name not in _SKIPPED_CLASS_ATTRIBUTES))
+    annotations = tuple(sorted((name, value_fingerprint(value))
+                               for name, value in vars(cls).get("__annotations__", {}).items()))
+    bases = tuple(f"{base.__module__}.{base.__qualname__}" for base in cls.__bases__)
+    return (bases, attributes, annotations)
+
+def _referenced_classes(value: Any) -> List[Type]:
+    """PointerProperty/CollectionProperty(type=...)로 참조하는 클래스"""
+    keywords = getattr(value, "keywords", None)
+    if isinstance(keywords, dict) and isinstance(keywords.get("type"), type):
+        return [keywords["type"]]
+    if inspect.isclass(value):
+        return [item for annotation in vars(value).get("__annotations__", {}).values()
+                for item in _referenced_classes(annotation)]
+    return []
 
 def sort_classes(classes: List[Type]) -> List[Type]:
     """클래스를 적절한 등록 순서로 정렬"""
@@ -75,7 +169,7 @@ def sort_classes(classes: List[Type]) -> List[Type]:
     
     for cls in classes:
         if cls is None:
-            print("Warning: None found in classes list")
+            log.warning("None found in classes list")
             continue
             
         try:
@@ -89,7 +183,7 @@ def sort_classes(classes: List[Type]) -> List[Type]:
                 others.append(cls)
         except TypeError:
             # 클래스가 아닌 경우 무시
-            print(f"TypeError when checking {cls} - not a class")
+            log.warning("TypeError when checking %s - not a class", cls)
             continue
     
     # 연산자 -> 기타 -> 설정 -> 패널 순으로 등록
@@ -100,36 +194,36 @@ def register_class(cls: Type) -> bool:
     try:
         # 이미 등록된 클래스인지 확인 (중복 등록 방지)
         if hasattr(bpy.types, cls.__name__):
-            print(f"Class already registered: {cls.__name__}")
+            log.debug("Class already registered: %s", cls.__name__)
             return True
             
         bpy.utils.register_class(cls)
-        print(f"✓ Registered class: {cls.__name__}")
+        log.debug("✓ Registered class: %s", cls.__name__)
         return True
     except Exception as e:
         error_msg = str(e)
         # AddonPreferences 관련 에러는 무시 (일반적인 동작)
         if "AddonPreferences" in error_msg and "already registered" in error_msg:
-            print(f"AddonPreferences registration info: {error_msg}")
+            log.debug("AddonPreferences registration info: %s", error_msg)
             return True
             
-        print(f"✗ Error registering {cls.__name__}: {e}")
+        log.error("✗ Error registering %s: %s", cls.__name__, e)
         return False
 
 def unregister_class(cls: Type) -> bool:
     """단일 클래스 등록 해제 (안전하게)"""
     try:
         bpy.utils.unregister_class(cls)
-        print(f"✓ Unregistered class: {cls.__name__}")
+        log.debug("✓ Unregistered class: %s", cls.__name__)
         return True
     except Exception as e:
         error_msg = str(e)
         # AddonPreferences 관련 에러는 무시 (일반적인 동작)
         if "AddonPreferences" in error_msg and "built-in class" in error_msg:
-            print(f"AddonPreferences unregistration info: {error_msg}")
+            log.debug("AddonPreferences unregistration info: %s", error_msg)
             return True
             
-        print(f"✗ Error unregistering {cls.__name__}: {e}")
+        log.error("✗ Error unregistering %s: %s", cls.__name__, e)
         return False
 
 def register_property(owner: Type, name: str, value: Any) -> bool:
@@ -137,15 +231,15 @@ def register_property(owner: Type, name: str, value: Any) -> bool:
     try:
         # 이미 존재하면 제거
         if hasattr(owner, name):
-            print(f"Property already exists: {owner.__name__}.{name}, will be replaced")
+            log.debug("Property already exists: %s.%s, will be replaced", owner.__name__, name)
             delattr(owner, name)
         
         # 새로 설정
         setattr(owner, name, value)
-        print(f"✓ Registered property: {owner.__name__}.{name}")
+        log.debug("✓ Registered property: %s.%s", owner.__name__, name)
         return True
     except Exception as e:
-        print(f"✗ Error registering property {owner.__name__}.{name}: {e}")
+        log.error("✗ Error registering property %s.%s: %s", owner.__name__, name, e)
         return False
 
 def unregister_property(owner: Type, name: str) -> bool:
@@ -153,38 +247,121 @@ def unregister_property(owner: Type, name: str) -> bool:
     try:
         if hasattr(owner, name):
             delattr(owner, name)
-            print(f"✓ Unregistered property: {owner.__name__}.{name}")
+            log.debug("✓ Unregistered property: %s.%s", owner.__name__, name)
             return True
         else:
-            print(f"Property not found for unregistration: {owner.__name__}.{name}")
+            log.warning("Property not found for unregistration: %s.%s", owner.__name__, name)
     except Exception as e:
-        print(f"✗ Error unregistering property {owner.__name__}.{name}: {e}")
+        log.error("✗ Error unregistering property %s.%s: %s", owner.__name__, name, e)
     return False
 
+def _ordered_classes() -> List[Type]:
+    return list(_classes.values()) if _presorted else sort_classes(list(_classes.values()))
+
+@span("registration.register_all")
 def register_all():
     """모든 클래스 및 속성 등록"""
-    # 클래스 정렬
-    sorted_classes = sort_classes(_classes)
-    print(f"Registering {len(sorted_classes)} classes")
+    # 클래스 정렬 (매니페스트에서 가져온 경우 이미 정렬됨)
+    sorted_classes = _ordered_classes()
+    log.debug("Registering %s classes", len(sorted_classes))
     
     # 클래스 등록
     for cls in sorted_classes:
         register_class(cls)
     
     # 속성 등록
-    print(f"Registering {len(_properties)} properties")
-    for owner, name, value in _properties:
+    log.debug("Registering %s properties", len(_properties))
+    for (owner, name), (value, _) in _properties.items():
         register_property(owner, name, value)
 
+@span("registration.unregister_all")
 def unregister_all():
     """모든 클래스 및 속성 등록 해제"""
     # 속성 등록 해제 (등록의 역순)
-    print(f"Unregistering {len(_properties)} properties")
-    for owner, name, _ in reversed(_properties):
+    log.debug("Unregistering %s properties", len(_properties))
+    for owner, name in reversed(list(_properties)):
         unregister_property(owner, name)
     
     # 클래스 등록 해제 (등록의 역순)
-    sorted_classes = sort_classes(_classes)
-    print(f"Unregistering {len(sorted_classes)} classes")
+    sorted_classes = _ordered_classes()
+    log.debug("Unregistering %s classes", len(sorted_classes))
     for cls in reversed(sorted_classes):
-        unregister_class(cls)
\ No newline at end of file
+        unregister_class(cls)
+
+def _register_entries(classes: Dict[Tuple[str, str], Type], properties: Dict[Tuple[Type, str], Tuple[Any, str]]):
+    keys = {cls: key for key, cls in classes.items()}
+    for cls in sort_classes(list(keys)):
+        register_class(cls)
+        _classes[keys[cls]] = cls
+        _fingerprints[keys[cls]] = class_fingerprint(cls)
+    for (owner, name), (value, source) in properties.items():
+        register_property(owner, name, value)
+        _properties[(owner, name)] = (value, source)
+        _fingerprints[(owner, name)] = value_fingerprint(value)
+
+@span("registration.reregister")
+def reregister(modules: Dict[str, Any]) -> Tuple[int, int]:
+    """다시 로드된 모듈의 정의를 이전 정의와 비교하여 바뀐 것만 재등록
+    
+    정의가 같은 클래스는 등록된 상태로 두고, 새 모듈의 속성이 등록된
+    기존 클래스를 가리키도록 다시 연결합니다. 바뀐 클래스를 type=으로 참조하는
+    클래스/속성도 함께 재등록됩니다. (재등록 수, 유지 수)를 반환합니다.
+    """
+    global _presorted
+    changed_modules = set(modules)
+    _modules.update(modules)
+    
+    # 새 정의 수집 (다시 로드된 모듈에서 정의된 것만)
+    new_classes, new_properties = {}, {}
+    for name, module in modules.items():
+        collect_from_module(name, module, new_classes, new_properties)
+    new_classes = {key: cls for key, cls in new_classes.items() if key[0] in changed_modules}
+    new_properties = {key: entry for key, entry in new_properties.items() if entry[1] in changed_modules}
+    old_classes = {key: cls for key, cls in _classes.items() if key[0] in changed_modules}
+    old_properties = {key: entry for key, entry in _properties.items() if entry[1] in changed_modules}
+    
+    # 지문이 같은 항목은 유지
+    kept_classes = {key for key in old_classes.keys() & new_classes.keys()
+                    if _fingerprints.get(key) == class_fingerprint(new_classes[key])}
+    kept_properties = {key for key in old_properties.keys() & new_properties.keys()
+                       if _fingerprints.get(key) == value_fingerprint(new_properties[key][0])}
+    
+    # 교체되는 클래스를 참조하는 항목은 유지할 수 없음
+    while True:
+        replaced = {old_classes[key] for key in old_classes if key not in kept_classes}
+        stale = {key for key in kept_classes if any(ref in replaced for ref in _referenced_classes(old_classes[key]))}
+        if not stale:
+            break
+        kept_classes -= stale
+    kept_properties = {key for key in kept_properties
+                       if not any(ref in replaced for ref in _referenced_classes(old_properties[key][0]))}
+    
+    # 바뀌거나 사라진 항목 등록 해제 (속성 -> 클래스 역순)
+    for key in reversed([key for key in old_properties if key not in kept_properties]):
+        unregister_property(*key)
+        del _properties[key]
+        _fingerprints.pop(key, None)
+    removed = {cls: key for key, cls in old_classes.items() if key not in kept_classes}
+    for cls in reversed(sort_classes(list(removed))):
+        unregister_class(cls)
+        del _classes[removed[cls]]
+        _fingerprints.pop(removed[cls], None)
+    
+    # 유지된 클래스: 새 모듈의 이름이 등록된 기존 클래스를 가리키도록 연결
+    replacements = {id(new_classes[key]): old_classes[key] for key in kept_classes}
+    for module in modules.values():
+        for attr_name, value in list(vars(module).items()):
+            registered = replacements.get(id(value))
+            if registered is not None and inspect.isclass(value):
+                setattr(module, attr_name, registered)
+    
+    # 새로 생기거나 바뀐 항목 등록
+    _presorted = False
+    _register_entries({key: cls for key, cls in new_classes.items() if key not in kept_classes},
+                      {key: entry for key, entry in new_properties.items() if key not in kept_properties})
+    
+    changed = (len(new_classes) - len(kept_classes)) + (len(new_properties) - len(kept_properties))
+    kept = len(kept_classes) + len(kept_properties)
+    removed_count = len(old_classes.keys() - new_classes.keys()) + len(old_properties.keys() - new_properties.keys())
+    log.info("Re-registered %s changed definitions, kept %s unchanged, removed %s", changed, kept, removed_count)
+    return changed, kept
@@ -16,6 +16,14 @@ def main():
     test_parser = subparsers.add_parser("test", help="개발 모드에서 애드온 테스트")
     test_parser.add_argument('--disable_watch', default=False, action='store_true', 
                        help='파일 변경 시 자동 리로드 비활성화')
+    test_parser.add_argument('--headless', default=False, action='store_true',
+                       help='헤드리스 블렌더 워커 풀에서 자동화 테스트 실행')
+    test_parser.add_argument('--workers', type=int, default=None,
+                       help='헤드리스 테스트에 사용할 블렌더 워커 수')
+    test_parser.add_argument('--pattern', default='test*.py',
+                       help='헤드리스 테스트 모듈 파일 이름 패턴')
+    test_parser.add_argument('--timeout', type=float, default=None,
+                       help='테스트 모듈 하나의 제한 시간(초), 넘기면 워커를 종료하고 교체')
     
     # 릴리즈 서브파서
     release_parser = subparsers.add_parser("release", help="애드온 릴리즈 생성")
@@ -28,11 +36,33 @@ def main():
     release_parser.add_argument('--as_addon', default=False, action='store_true',
                          help='확장이 아닌 애드온으로 릴리즈')
     
+    # 프로파일 서브파서
+    profile_parser = subparsers.add_parser("profile", help="헤드리스 블렌더에서 애드온 임포트/등록 시간 프로파일링")
+    profile_parser.add_argument('--repeat', type=int, default=3,
+                         help='블렌더 실행 횟수 (가장 빠른 결과 사용)')
+    profile_parser.add_argument('--threshold', type=float, default=0.2,
+                         help='회귀로 판단할 기준선 대비 느려짐 비율 (0.2 = 20%%)')
+    profile_parser.add_argument('--update_baseline', default=False, action='store_true',
+                         help='이번 결과를 새 기준선으로 저장')
+    
+    # 벤치마크 서브파서
+    bench_parser = subparsers.add_parser("bench", help="헤드리스 블렌더에서 벤치마크 실행 및 기준선 비교")
+    bench_parser.add_argument('--suite', default='default', choices=['default', 'quick'],
+                         help='실행할 벤치마크 묶음')
+    bench_parser.add_argument('--threshold', type=float, default=0.2,
+                         help='실패로 판단할 기준선 대비 느려짐 비율 (0.2 = 20%%)')
+    bench_parser.add_argument('--update_baseline', default=False, action='store_true',
+                         help='이번 결과를 새 기준선으로 저장')
+    
     # 인자 파싱
     args = parser.parse_args()
     
     # 명령 실행
     if args.command == "test":
+        if args.headless:
+            from framework import run_headless_tests
+            success = run_headless_tests(workers=args.workers, pattern=args.pattern, timeout=args.timeout)
+            sys.exit(0 if success else 1)
         from test import test_addon
         test_addon(enable_watch=not args.disable_watch)
         
@@ -45,6 +75,18 @@ def main():
             is_extension=not args.as_addon
         )
         
+    elif args.command == "profile":
+        from framework import profile_addon
+        success = profile_addon(repeat=args.repeat, update_baseline=args.update_baseline,
+                                threshold=args.threshold)
+        sys.exit(0 if success else 1)
+        
+    elif args.command == "bench":
+        from framework import run_benchmarks
+        success = run_benchmarks(suite=args.suite, threshold=args.threshold,
+                                 update_baseline=args.update_baseline)
+        sys.exit(0 if success else 1)
+        
     else:
         parser.print_help()
 
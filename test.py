@@ -1,4 +1,6 @@
-from framework import test_addon
+import sys
+
+from framework import test_addon, run_headless_tests
 
 if __name__ == '__main__':
     import argparse
@@ -6,6 +8,16 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('--disable_watch', default=False, action='store_true', 
                         help='Do not reload addon when file changed')
+    parser.add_argument('--headless', default=False, action='store_true',
+                        help='Run the automated tests in a pool of headless Blender workers')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Number of headless Blender workers')
+    parser.add_argument('--pattern', default='test*.py',
+                        help='File name pattern of the headless test modules')
+    parser.add_argument('--timeout', type=float, default=None,
+                        help='Per-module deadline in seconds; a worker that exceeds it is replaced')
     args = parser.parse_args()
     
+    if args.headless:
+        sys.exit(0 if run_headless_tests(workers=args.workers, pattern=args.pattern, timeout=args.timeout) else 1)
     test_addon(enable_watch=not args.disable_watch)
\ No newline at end of file
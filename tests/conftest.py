@@ -0,0 +1,52 @@
+# tests/conftest.py
+# 블렌더 밖에서 pytest로 실행할 때만 쓰이는 설정 (헤드리스 워커는 test*.py만 불러옴)
+# 순수 NumPy 형상 모듈(walls, wall_joins, openings 등)을 애드온 등록 없이 임포트할 수 있도록
+#   - irkebim 패키지를 __init__(ModuleManager, bpy 등록) 실행 없이 경로만 가진 패키지로 등록하고
+#   - bpy가 없으면 모듈 최상단의 bpy.types 상속, bpy.props 호출, @persistent 정도만 통과하는 자리표시 모듈을 넣음
+# 자리표시 bpy는 동작을 흉내내지 않으므로 bpy를 실제로 호출하는 테스트는 블렌더 워커에서만 실행해야 함
+import os
+import sys
+import types
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADDON_NAME = "irkebim"
+
+class _Placeholder(types.ModuleType):
+    """어떤 속성이든 자리표시로 돌려주고, 호출하면 데코레이터처럼 인자를 그대로 돌려줌"""
+    __placeholder__ = True  # 실제 블렌더가 필요한 테스트는 이 표시로 건너뜀 (test_addon_smoke.py)
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = _Placeholder(f"{self.__name__}.{name}")
+        setattr(self, name, value)
+        return value
+
+    def __call__(self, *args, **kwargs):
+        return args[0] if len(args) == 1 and callable(args[0]) and not kwargs else None
+
+    def __mro_entries__(self, bases):
+        # class Foo(bpy.types.Operator) 같은 선언이 임포트 시점에 실패하지 않도록
+        return (object,)
+
+def _install_bpy_placeholder():
+    for name in ("bpy", "bpy.types", "bpy.props", "bpy.utils", "bpy.app", "bpy.app.handlers", "bpy.app.timers",
+                 "mathutils", "mathutils.kdtree"):
+        module = sys.modules.setdefault(name, _Placeholder(name))
+        parent, _, child = name.rpartition(".")
+        if parent:
+            setattr(sys.modules[parent], child, module)
+
+def _install_bare_package():
+    package = types.ModuleType(ADDON_NAME)
+    package.__path__ = [os.path.join(PROJECT_ROOT, ADDON_NAME)]
+    package.__file__ = os.path.join(PROJECT_ROOT, ADDON_NAME, "__init__.py")
+    sys.modules[ADDON_NAME] = package
+
+try:
+    import bpy  # noqa: F401
+except ImportError:
+    _install_bpy_placeholder()
+
+if ADDON_NAME not in sys.modules:
+    _install_bare_package()
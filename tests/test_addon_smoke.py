@@ -0,0 +1,37 @@
+# tests/test_addon_smoke.py
+# 헤드리스 블렌더 워커에서 실행하는 기본 동작 확인 (main.py test --headless)
+# 워커가 애드온을 활성화한 상태에서 실행되며, 블렌더 밖에서는 건너뜀
+import unittest
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+if getattr(bpy, "__placeholder__", False):  # 블렌더 밖 pytest의 자리표시 bpy (conftest.py)
+    bpy = None
+
+@unittest.skipIf(bpy is None, "requires Blender (run with: python main.py test --headless)")
+class AddonSmokeTest(unittest.TestCase):
+    def test_operators_registered(self):
+        for idname in ("mesh.add_custom_cube", "mesh.add_wall", "mesh.add_opening", "mesh.move_opening",
+                       "collection.add_storey"):
+            category, name = idname.split(".")
+            self.assertTrue(hasattr(getattr(bpy.ops, category), name), idname)
+
+    def test_scene_properties_registered(self):
+        scene = bpy.context.scene
+        for name in ("cube_custom_size", "wall_default_height", "wall_thickness"):
+            self.assertTrue(hasattr(scene, name), name)
+
+    def test_generate_cube(self):
+        count = len(bpy.data.objects)
+        self.assertEqual(bpy.ops.mesh.add_custom_cube(), {'FINISHED'})
+        self.assertEqual(len(bpy.data.objects), count + 1)
+
+    def test_generate_wall(self):
+        self.assertEqual(bpy.ops.mesh.add_wall(source='STRAIGHT', length=4.0, height=3.0, thickness=0.2), {'FINISHED'})
+        mesh = bpy.context.active_object.data
+        self.assertGreater(len(mesh.polygons), 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+# tests/test_openings.py
+# 개구부가 뚫린 벽체 메쉬(openings.wall_with_openings, build_wall_arrays) 회귀 확인
+# 모든 결과는 닫힌 다양체(방향 있는 모서리마다 반대 방향 짝이 정확히 하나)이고 부피가 맞아야 함
+# bpy 없이 실행 가능 (블렌더 밖에서는 pytest tests/test_openings.py, conftest.py 참고)
+import unittest
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if np is not None:
+    from irkebim.geometry import openings, walls
+
+THICKNESS = 0.2
+HEIGHT = 2.4
+
+def non_manifold_edges(faces) -> int:
+    """한 번이 아니게 쓰였거나 반대 방향 짝이 없는 방향 있는 모서리 수"""
+    counts = Counter()
+    for quad in np.asarray(faces).tolist():
+        counts.update(zip(quad, quad[1:] + quad[:1]))
+    return sum(1 for (a, b), count in counts.items() if count != 1 or counts.get((b, a), 0) != 1)
+
+def volume(vertices, faces) -> float:
+    """발산 정리로 구한 부피 (면이 바깥을 향하면 양수)"""
+    points = np.asarray(vertices, dtype=np.float64)[np.asarray(faces)]  # (F, 4, 3)
+    total = 0.0
+    for k in (1, 2):
+        total += np.einsum("ij,ij->i", points[:, 0], np.cross(points[:, k], points[:, k + 1])).sum()
+    return total / 6.0
+
+def faces_area(vertices, faces) -> float:
+    """평면 사각형 면 넓이 합 (대각선 외적의 절반)"""
+    points = np.asarray(vertices, dtype=np.float64)[np.asarray(faces)]
+    diagonals = np.cross(points[:, 2] - points[:, 0], points[:, 3] - points[:, 1])
+    return 0.5 * np.linalg.norm(diagonals, axis=1).sum()
+
+def footprint_area(corners) -> float:
+    x, y = corners[:, 0], corners[:, 1]
+    return 0.5 * abs(np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y))
+
+@unittest.skipIf(np is None, "requires numpy")
+class WallWithOpeningsTest(unittest.TestCase):
+    STRAIGHT = ([(0, 0), (6, 0)], [(0, 1)])
+    L_SHAPE = ([(0, 0), (6, 0), (6, 4)], [(0, 1), (1, 2)])
+    U_SHAPE = ([(0, 4), (0, 0), (6, 0), (6, 4)], [(0, 1), (1, 2), (2, 3)])
+
+    def build(self, plan, segment, opening_rows):
+        points, edges = np.array(plan[0], dtype=np.float64), np.array(plan[1])
+        corners = walls.segment_corners(points, edges, THICKNESS)[segment]
+        start = points[edges[segment, 0]]
+        direction = points[edges[segment, 1]] - start
+        direction = direction / np.linalg.norm(direction)
+        vertices, faces, face_openings = openings.wall_with_openings(
+            corners, start, direction, HEIGHT, 0.0, np.array(opening_rows, dtype=np.float64).reshape(-1, 4))
+        self.assertEqual(len(face_openings), len(faces))
+        self.assertEqual(len(np.unique(faces)), len(vertices), "unused vertices")
+        self.vertices, self.faces = vertices, faces
+        return corners, vertices, faces, face_openings
+
+    def assertReveal(self, face_openings, opening_id, perimeter):
+        """개구부 안쪽 면(jamb, sill, head) 넓이 = 둘레 x 두께 (격자 때문에 면이 나뉘어도 같음)"""
+        area = faces_area(self.vertices, self.faces[face_openings == opening_id])
+        self.assertAlmostEqual(area, perimeter * THICKNESS, places=5)
+
+    def assertSolid(self, plan, segment, opening_rows, removed):
+        """removed: 빠져야 하는 개구부 면적 합 (축 방향 폭 x 높이, 잘린 뒤)"""
+        corners, vertices, faces, face_openings = self.build(plan, segment, opening_rows)
+        self.assertEqual(non_manifold_edges(faces), 0)
+        expected = footprint_area(corners) * HEIGHT - removed * THICKNESS
+        self.assertAlmostEqual(volume(vertices, faces), expected, places=4)
+        return face_openings
+
+    def test_no_openings_is_a_box(self):
+        self.assertSolid(self.STRAIGHT, 0, [], 0.0)
+
+    def test_door(self):
+        face_openings = self.assertSolid(self.STRAIGHT, 0, [(1.0, 0.9, 0.0, 2.1)], 0.9 * 2.1)
+        # 문은 바닥면이 없으므로 jamb 2개 + head
+        self.assertReveal(face_openings, 0, 2.1 * 2 + 0.9)
+
+    def test_two_windows(self):
+        face_openings = self.assertSolid(self.STRAIGHT, 0, [(1.0, 1.2, 0.9, 2.1), (3.5, 0.6, 1.5, 2.1)],
+                                         1.2 * 1.2 + 0.6 * 0.6)
+        self.assertReveal(face_openings, 0, 1.2 * 4)
+        self.assertReveal(face_openings, 1, (0.6 + 0.6) * 2)
+
+    def test_opening_clipped_at_start(self):
+        self.assertSolid(self.STRAIGHT, 0, [(-0.5, 0.9, 0.9, 2.1)], 0.4 * 1.2)
+
+    def test_opening_clipped_at_end_full_height(self):
+        # 끝에서 높이 전체가 빠지면 벽체가 그 위치에서 끝남
+        self.assertSolid(self.STRAIGHT, 0, [(5.5, 0.9, 0.0, HEIGHT)], 0.5 * HEIGHT)
+
+    def test_adjacent_openings(self):
+        self.assertSolid(self.STRAIGHT, 0, [(1.0, 0.9, 0.9, 2.1), (1.9, 0.5, 0.9, 2.1)], 1.4 * 1.2)
+        self.assertSolid(self.STRAIGHT, 0, [(1.0, 0.9, 0.0, 2.1), (1.9, 0.5, 0.9, 1.8)], 0.9 * 2.1 + 0.5 * 0.9)
+
+    def test_full_length_window(self):
+        # 벽체 길이 전체에 걸친 창: 아래/위 두 덩어리로 나뉨
+        self.assertSolid(self.STRAIGHT, 0, [(0.0, 6.0, 0.9, 2.1)], 6.0 * 1.2)
+
+    def test_whole_wall_opening_leaves_nothing(self):
+        _, vertices, faces, _ = self.build(self.STRAIGHT, 0, [(0.0, 6.0, 0.0, HEIGHT)])
+        self.assertEqual((len(vertices), len(faces)), (0, 0))
+
+    def test_opening_flush_with_miter_end(self):
+        # 마이터 쪽 끝에 붙은 개구부는 개구부 범위(안쪽 면 기준) 밖의 쐐기만 벽체로 남음
+        self.assertSolid(self.L_SHAPE, 0, [(5.1, 0.9, 0.9, 2.1)], 0.8 * 1.2)
+        self.assertSolid(self.L_SHAPE, 1, [(0.0, 0.9, 0.0, 2.1)], 0.8 * 2.1)
+
+    def test_openings_between_two_miters(self):
+        # 양쪽이 마이터인 가운데 선분, 한쪽 끝에 붙은 창과 가운데 문
+        self.assertSolid(self.U_SHAPE, 1, [(0.0, 0.9, 0.9, 2.1), (2.5, 0.9, 0.0, 2.1)],
+                         0.8 * 1.2 + 0.9 * 2.1)
+
+@unittest.skipIf(np is None, "requires numpy")
+class BuildWallArraysTest(unittest.TestCase):
+    def setUp(self):
+        self.points = np.array([(0, 0), (6, 0), (6, 4), (0, 4)], dtype=np.float64)
+        self.edges = np.array([(0, 1), (1, 2), (2, 3), (3, 0)])
+        self.edge_walls = np.array([10, 11, 12, 13])
+        self.edge_openings = {
+            0: (np.array([100, 101]), np.array([(1.0, 0.9, 0.0, 2.1), (3.0, 1.2, 0.9, 2.1)])),
+            2: (np.array([102]), np.array([(2.0, 1.2, 0.9, 2.1)])),
+        }
+
+    def build(self, cache=None):
+        return openings.build_wall_arrays(self.points, self.edges, THICKNESS, HEIGHT, 0.0, self.edge_walls,
+                                          self.edge_openings, cache)
+
+    def test_each_wall_is_closed(self):
+        vertices, faces, face_walls, face_openings = self.build()
+        self.assertEqual(len(face_walls), len(faces))
+        corners = walls.segment_corners(self.points, self.edges, THICKNESS)
+        removed = {10: 0.9 * 2.1 + 1.2 * 1.2, 11: 0.0, 12: 1.2 * 1.2, 13: 0.0}
+        for edge, wall_id in enumerate(self.edge_walls.tolist()):
+            wall_faces = faces[face_walls == wall_id]
+            self.assertEqual(non_manifold_edges(wall_faces), 0, wall_id)
+            expected = footprint_area(corners[edge]) * HEIGHT - removed[wall_id] * THICKNESS
+            self.assertAlmostEqual(volume(vertices, wall_faces), expected, places=4)
+        self.assertEqual(sorted(set(face_openings.tolist())), [-1, 100, 101, 102])
+
+    def test_cache_rebuilds_only_touched_segment(self):
+        cache = openings.WallMeshCache()
+        first = self.build(cache)
+        self.assertEqual(cache.rebuilt, 2)
+        self.build(cache)
+        self.assertEqual(cache.rebuilt, 0)
+
+        moved = self.edge_openings[2][1].copy()
+        moved[0, 0] += 0.5
+        self.edge_openings[2] = (self.edge_openings[2][0], moved)
+        cached = self.build(cache)
+        self.assertEqual(cache.rebuilt, 1)
+        # 캐시를 거친 결과는 새로 계산한 결과와 같음
+        for array, expected in zip(cached, self.build()):
+            np.testing.assert_array_equal(array, expected)
+        self.assertFalse(np.array_equal(cached[0], first[0]))
+
+    def test_cache_drops_segments_without_openings(self):
+        cache = openings.WallMeshCache()
+        self.build(cache)
+        del self.edge_openings[0]
+        self.build(cache)
+        self.assertEqual(cache.rebuilt, 0)
+        self.edge_openings[0] = (np.array([100]), np.array([(1.0, 0.9, 0.0, 2.1)]))
+        self.build(cache)
+        self.assertEqual(cache.rebuilt, 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,199 @@
+# tests/test_wall_joins.py
+# 벽체 연결 해석기(WallJoinSolver)와 마이터 꼭짓점(walls.segment_corners) 확인
+# bpy 없이 실행 가능 (블렌더 밖에서는 pytest tests/test_wall_joins.py, conftest.py 참고)
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if np is not None:
+    from irkebim.geometry import walls
+    from irkebim.geometry.wall_joins import DEFAULT_TOLERANCE, WallJoinSolver
+
+def _random_plan(seed, count=60, size=12):
+    """정수 격자 위의 임의 벽체 (길이 0 제외) - 일부는 축 정렬로 만들어 일직선 연장과 T 연결을 섞음"""
+    rng = np.random.default_rng(seed)
+    starts = rng.integers(0, size, (count * 2, 2)).astype(np.float64)
+    ends = rng.integers(0, size, (count * 2, 2)).astype(np.float64)
+    axis = rng.integers(0, 2, count * 2)
+    aligned = rng.random(count * 2) < 0.5
+    ends[aligned, axis[aligned]] = starts[aligned, axis[aligned]]
+    keep = np.any(starts != ends, axis=1)
+    return starts[keep][:count], ends[keep][:count]
+
+def _brute_force_kind(a0, a1, b0, b1, tolerance=DEFAULT_TOLERANCE):
+    """두 선분을 스칼라 계산으로 직접 분류 - "", "L", "T"(a가 stem), "t"(b가 stem), "X" """
+    r, s, q = a1 - a0, b1 - b0, b0 - a0
+    a_length, b_length = np.hypot(*r), np.hypot(*s)
+    denominator = r[0] * s[1] - r[1] * s[0]
+    if abs(denominator) <= 1e-9 * a_length * b_length:
+        touching = any(np.hypot(*(p - o)) <= tolerance for p in (a0, a1) for o in (b0, b1))
+        return "L" if touching else ""
+    t = (q[0] * s[1] - q[1] * s[0]) / denominator
+    u = (q[0] * r[1] - q[1] * r[0]) / denominator
+    t_tolerance, u_tolerance = tolerance / a_length, tolerance / b_length
+    if not (-t_tolerance <= t <= 1 + t_tolerance and -u_tolerance <= u <= 1 + u_tolerance):
+        return ""
+    a_end = t <= t_tolerance or t >= 1 - t_tolerance
+    b_end = u <= u_tolerance or u >= 1 - u_tolerance
+    return {(True, True): "L", (True, False): "T", (False, True): "t", (False, False): "X"}[(a_end, b_end)]
+
+def _brute_force_junctions(walls_by_id):
+    """모든 쌍을 검사한 {(작은 ID, 큰 ID): (종류, stem ID 또는 None)}"""
+    expected = {}
+    ids = sorted(walls_by_id)
+    for index, first in enumerate(ids):
+        for second in ids[index + 1:]:
+            kind = _brute_force_kind(*walls_by_id[first], *walls_by_id[second])
+            if kind == "T":
+                expected[(first, second)] = ("T", first)
+            elif kind == "t":
+                expected[(first, second)] = ("T", second)
+            elif kind:
+                expected[(first, second)] = (kind, None)
+    return expected
+
+def _solver_junctions(solver):
+    return {key: (junction.kind, junction.first if junction.kind == "T" else None)
+            for key, junction in solver.junctions.items()}
+
+def _canonical_graph(graph):
+    """점 번호와 선분 순서에 무관한 비교용 형태"""
+    points, edges, wall_ids, thickness = graph
+    return sorted((tuple(np.round(points[a], 6)), tuple(np.round(points[b], 6)), int(wall), round(float(value), 6))
+                  for (a, b), wall, value in zip(edges, wall_ids, thickness))
+
+def _fresh_graph(solver):
+    fresh = WallJoinSolver(cell_size=solver.cell_size, tolerance=solver.tolerance)
+    ids = sorted(solver.walls)
+    fresh.add_walls(ids, np.array([solver.walls[i][0] for i in ids]), np.array([solver.walls[i][1] for i in ids]),
+                    np.array([solver.walls[i][2] for i in ids]))
+    return fresh.to_graph()
+
+@unittest.skipIf(np is None, "requires numpy")
+class WallJoinSolverTest(unittest.TestCase):
+    def test_junctions_match_brute_force(self):
+        for seed in range(5):
+            starts, ends = _random_plan(seed)
+            solver = WallJoinSolver()
+            solver.add_walls(range(len(starts)), starts, ends, 0.2)
+            expected = _brute_force_junctions({i: (starts[i], ends[i]) for i in range(len(starts))})
+            self.assertEqual(_solver_junctions(solver), expected, f"seed {seed}")
+
+    def test_incremental_add_matches_brute_force(self):
+        # 두 번에 나누어 추가하면 기존 벽체와의 쌍 검사 경로를 거침
+        starts, ends = _random_plan(11)
+        half = len(starts) // 2
+        solver = WallJoinSolver()
+        solver.add_walls(range(half), starts[:half], ends[:half], 0.2)
+        solver.add_walls(range(half, len(starts)), starts[half:], ends[half:], 0.2)
+        expected = _brute_force_junctions({i: (starts[i], ends[i]) for i in range(len(starts))})
+        self.assertEqual(_solver_junctions(solver), expected)
+
+    def test_move_and_remove_match_brute_force(self):
+        starts, ends = _random_plan(7)
+        solver = WallJoinSolver()
+        solver.add_walls(range(len(starts)), starts, ends, 0.2)
+        plan = {i: (starts[i], ends[i]) for i in range(len(starts))}
+        rng = np.random.default_rng(7)
+        for _ in range(30):
+            wall_id = int(rng.choice(sorted(plan)))
+            if rng.random() < 0.2:
+                solver.remove_wall(wall_id)
+                del plan[wall_id]
+                continue
+            offset = rng.integers(-2, 3, 2).astype(np.float64)
+            plan[wall_id] = (plan[wall_id][0] + offset, plan[wall_id][1] + offset)
+            solver.move_wall(wall_id, *plan[wall_id])
+            self.assertEqual(_solver_junctions(solver), _brute_force_junctions(plan))
+        self.assertEqual(_solver_junctions(solver), _brute_force_junctions(plan))
+
+    def test_patch_graph_matches_full_graph(self):
+        starts, ends = _random_plan(3, count=40)
+        solver = WallJoinSolver()
+        solver.add_walls(range(len(starts)), starts, ends, 0.2)
+        graph = solver.to_graph()
+        rng = np.random.default_rng(3)
+        next_id = len(starts)
+        for step in range(30):
+            action = ("add", "move", "remove")[step % 3]
+            if action == "add":
+                start = rng.integers(0, 12, 2).astype(np.float64)
+                end = start + (rng.integers(1, 4), 0) if step % 2 else start + (0, rng.integers(1, 4))
+                solver.add_walls([next_id], start[None], np.asarray(end, dtype=np.float64)[None], 0.2)
+                affected = {next_id}
+                for junction in solver.junctions_of(next_id):
+                    affected.update((junction.first, junction.second))
+                next_id += 1
+            elif action == "move":
+                wall_id = int(rng.choice(sorted(solver.walls)))
+                start, end, _ = solver.walls[wall_id]
+                offset = rng.integers(-2, 3, 2).astype(np.float64)
+                affected = solver.move_wall(wall_id, start + offset, end + offset)
+            else:
+                wall_id = int(rng.choice(sorted(solver.walls)))
+                affected = solver.remove_wall(wall_id) | {wall_id}
+            graph = solver.patch_graph(graph, affected)
+            self.assertEqual(_canonical_graph(graph), _canonical_graph(_fresh_graph(solver)),
+                             f"step {step} ({action})")
+            # 패치한 그래프에도 쓰이지 않는 점이 남지 않음
+            self.assertEqual(len(np.unique(graph[1])), len(graph[0]))
+
+@unittest.skipIf(np is None, "requires numpy")
+class SegmentCornersTest(unittest.TestCase):
+    HALF = 0.1
+
+    def corners(self, points, edges):
+        return walls.segment_corners(np.array(points, dtype=np.float64), np.array(edges), self.HALF * 2)
+
+    def test_l_corner_miter(self):
+        corners = self.corners([(0, 0), (6, 0), (6, 4)], [(0, 1), (1, 2)])
+        # 첫 선분의 끝과 둘째 선분의 시작이 같은 마이터 꼭짓점을 공유
+        np.testing.assert_allclose(corners[0, 1], corners[1, 0])
+        np.testing.assert_allclose(corners[0, 2], corners[1, 3])
+        np.testing.assert_allclose(corners[0, 1], (6.1, -0.1))
+        np.testing.assert_allclose(corners[0, 2], (5.9, 0.1))
+        # 끝점은 버트
+        np.testing.assert_allclose(corners[0, 0], (0, -0.1))
+        np.testing.assert_allclose(corners[1, 1], (6.1, 4))
+
+    def test_closed_square(self):
+        points, edges = walls.polylines_to_graph([np.array([(0, 0), (6, 0), (6, 4), (0, 4)])], closed=[True])
+        corners = self.corners(points, edges)
+        for index in range(4):
+            following = (index + 1) % 4
+            np.testing.assert_allclose(corners[index, 1], corners[following, 0])
+            np.testing.assert_allclose(corners[index, 2], corners[following, 3])
+        # 선분 사각형 넓이 합 = 바깥 사각형 - 안쪽 사각형 (겹침, 틈 없음)
+        x, y = corners[..., 0], corners[..., 1]
+        areas = 0.5 * np.abs(np.sum(x * np.roll(y, -1, axis=1) - np.roll(x, -1, axis=1) * y, axis=1))
+        self.assertAlmostEqual(areas.sum(), 6.2 * 4.2 - 5.8 * 3.8)
+
+    def test_collinear_joint_is_flat(self):
+        corners = self.corners([(0, 0), (3, 0), (6, 0)], [(0, 1), (1, 2)])
+        np.testing.assert_allclose(corners[0, 1], (3, -0.1))
+        np.testing.assert_allclose(corners[0, 2], (3, 0.1))
+        np.testing.assert_allclose(corners[1, 0], (3, -0.1))
+        np.testing.assert_allclose(corners[1, 3], (3, 0.1))
+
+    def test_acute_miter_within_limit(self):
+        # 60도 꺾임: 마이터 거리 = half / sin(30도) = 2 * half < MITER_LIMIT * half
+        angle = np.radians(60)
+        corners = self.corners([(0, 0), (5, 0), (5 - 5 * np.cos(angle), 5 * np.sin(angle))], [(0, 1), (1, 2)])
+        np.testing.assert_allclose(corners[0, 1], corners[1, 0])
+        np.testing.assert_allclose(corners[0, 2], corners[1, 3])
+        self.assertAlmostEqual(np.hypot(*(corners[0, 1] - (5, 0))), 2 * self.HALF)
+
+    def test_acute_miter_beyond_limit_falls_back_to_butt(self):
+        # 10도 꺾임: 마이터가 MITER_LIMIT를 넘으므로 두 선분 모두 직각으로 끝냄
+        angle = np.radians(10)
+        corners = self.corners([(0, 0), (5, 0), (5 - 5 * np.cos(angle), 5 * np.sin(angle))], [(0, 1), (1, 2)])
+        np.testing.assert_allclose(corners[0, 1], (5, -self.HALF))
+        np.testing.assert_allclose(corners[0, 2], (5, self.HALF))
+        for corner in (corners[1, 0], corners[1, 3]):
+            self.assertAlmostEqual(np.hypot(*(corner - (5, 0))), self.HALF)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+# tests/test_wall_model.py
+# 벽체 오브젝트 regenerate 확인 - 위상이 그대로면 바뀐 정점만 기록하고 결과는 새로 만든 메쉬와 같아야 함
+# 헤드리스 블렌더 워커에서 실행 (python main.py test --headless), 블렌더 밖에서는 건너뜀
+import unittest
+from unittest import mock
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+if getattr(bpy, "__placeholder__", False):  # 블렌더 밖 pytest의 자리표시 bpy (conftest.py)
+    bpy = None
+
+if bpy is not None:
+    import numpy as np
+    from irkebim.geometry import mesh_writer, wall_model
+
+def _coordinates(mesh):
+    values = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", values)
+    return values.reshape(-1, 3)
+
+def _loops(mesh):
+    values = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", values)
+    return values
+
+@unittest.skipIf(bpy is None, "requires Blender (run with: python main.py test --headless)")
+class WallRegenerateTest(unittest.TestCase):
+    def setUp(self):
+        count = 20
+        self.starts = np.stack((np.zeros(count), np.arange(count) * 3.0), axis=1)
+        self.ends = self.starts + (30.0, 0.0)
+        self.obj = wall_model.create_wall_object("Walls", self.starts, self.ends, 0.2, 2.4)
+        for wall_id in range(count):
+            for index in range(5):
+                wall_model.add_opening(self.obj, wall_id, 1.0 + index * 5.0, 0.9, 0.9 if index % 2 else 0.0, 2.1)
+        wall_model.regenerate(self.obj)
+
+    def tearDown(self):
+        for obj in list(bpy.data.objects):
+            if wall_model.is_wall_object(obj):
+                bpy.data.objects.remove(obj)
+        wall_model.clear_caches()
+
+    def regenerate(self):
+        with mock.patch.object(mesh_writer, "update_vertices", wraps=mesh_writer.update_vertices) as spy:
+            wall_model.regenerate(self.obj)
+        return spy.call_args_list
+
+    def assertMatchesFreshObject(self):
+        fresh = wall_model.create_wall_object("Fresh", *wall_model.get_walls(self.obj)[:4])
+        wall_model.set_openings(fresh, *wall_model.get_openings(self.obj))
+        wall_model.regenerate(fresh)
+        np.testing.assert_array_equal(_loops(self.obj.data), _loops(fresh.data))
+        np.testing.assert_allclose(_coordinates(self.obj.data), _coordinates(fresh.data), atol=1e-6)
+        for name in (mesh_writer.ELEMENT_ID_ATTRIBUTE, wall_model.OPENING_ID_ATTRIBUTE):
+            np.testing.assert_array_equal(mesh_writer.get_face_attribute(self.obj.data, name),
+                                          mesh_writer.get_face_attribute(fresh.data, name))
+
+    def test_moving_an_opening_writes_only_its_vertices(self):
+        before = _coordinates(self.obj.data)
+        wall_model.update_opening(self.obj, 37, offset=11.3)
+        calls = self.regenerate()
+        self.assertEqual(len(calls), 1)  # 위상이 같으므로 좌표만 갱신
+        changed = np.flatnonzero(np.any(_coordinates(self.obj.data) != before, axis=1))
+        self.assertGreater(len(changed), 0)
+        self.assertLess(len(changed), len(before) // 20)
+        self.assertMatchesFreshObject()
+
+    def test_topology_change_rewrites_mesh(self):
+        wall_model.update_opening(self.obj, 36, sill=0.0)  # 창 -> 문 (sill 면이 없어짐)
+        self.assertEqual(len(self.regenerate()), 0)
+        self.assertMatchesFreshObject()
+
+    def test_moving_a_wall_keeps_topology(self):
+        self.starts[3] += (0.0, 0.5)
+        self.ends[3] += (0.0, 0.5)
+        wall_model.store_walls(self.obj, self.starts, self.ends, 0.2, 2.4)
+        self.assertEqual(len(self.regenerate()), 1)
+        self.assertMatchesFreshObject()
+
+if __name__ == "__main__":
+    unittest.main()